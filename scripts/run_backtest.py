@@ -4,20 +4,31 @@
 from __future__ import annotations
 
 import argparse
+from concurrent.futures import ProcessPoolExecutor
+from itertools import chain
 from pathlib import Path
-from typing import List
+from typing import List, Optional
 
-from trading_ai.backtest.data_loader import contexts_from_snapshot, load_snapshot_file
+from trading_ai.backtest.data_loader import CONTEXT_KEYS, contexts_from_snapshot, load_snapshot_file
 from trading_ai.backtest.engine import BacktestConfig, BacktestRunner
 from trading_ai.risk.manager import RiskManager
 from trading_ai.strategies import MomentumIVStrategy
+from trading_ai.strategies.base import StrategyContext
 
 
-def run_backtest(files: List[Path]) -> None:
-    contexts = []
-    for path in files:
-        snapshot = load_snapshot_file(path)
-        contexts.extend(contexts_from_snapshot(snapshot))
+def _load_one(path: Path) -> List[StrategyContext]:
+    snapshot = load_snapshot_file(path, keys=CONTEXT_KEYS)
+    return contexts_from_snapshot(snapshot)
+
+
+def run_backtest(files: List[Path], jobs: Optional[int] = None) -> None:
+    if jobs == 1 or len(files) < 2:
+        context_lists = [_load_one(path) for path in files]
+    else:
+        # Files parse independently; map() keeps results in input order so the run is deterministic.
+        with ProcessPoolExecutor(max_workers=jobs) as executor:
+            context_lists = list(executor.map(_load_one, files))
+    contexts = list(chain.from_iterable(context_lists))
 
     if not contexts:
         print("No contexts loaded. Ensure snapshots contain underlying bars.")
@@ -35,10 +46,16 @@ def run_backtest(files: List[Path]) -> None:
 
 def main() -> None:
     parser = argparse.ArgumentParser(description="Run backtests on snapshot JSON files.")
-    parser.add_argument("snapshots", nargs="+", help="Snapshot JSON files produced by collect-snapshots.")
+    parser.add_argument("snapshots", nargs="+", help="Snapshot JSON files or Parquet bundles produced by collect-snapshots.")
+    parser.add_argument(
+        "--jobs",
+        type=int,
+        default=None,
+        help="Worker processes used to load snapshots (default: CPU count, 1 disables).",
+    )
     args = parser.parse_args()
     files = [Path(p) for p in args.snapshots]
-    run_backtest(files)
+    run_backtest(files, jobs=args.jobs)
 
 
 if __name__ == "__main__":
@@ -2,30 +2,108 @@
 
 from __future__ import annotations
 
+import mmap
 from pathlib import Path
-from typing import Dict, Iterable, List
+from typing import Any, Dict, Iterable, List
 
+import duckdb
 import orjson
 import pandas as pd
 
+from trading_ai.data.cache import read_parquet_frame
 from trading_ai.strategies.base import StrategyContext
 
 
-def load_snapshot_file(path: str | Path) -> Dict[str, Dict]:
-    payload = orjson.loads(Path(path).read_bytes())
+# Per-ticker snapshot keys read by contexts_from_snapshot; option_chain feeds the IV/flow metrics.
+CONTEXT_KEYS = frozenset(
+    {
+        "underlying_bars",
+        "option_chain",
+        "option_metrics",
+        "option_quote",
+        "news",
+        "features",
+        "option_aggregates",
+    }
+)
+
+# Parquet snapshot bundles: a directory holding SIDECAR_NAME plus one Parquet file per table.
+SIDECAR_NAME = "snapshot.json"
+TABLE_KEYS = ("underlying_bars", "option_chain")
+_TABLE_MARKER = "$parquet"
+
+
+def load_snapshot_file(path: str | Path, *, keys: Iterable[str] | None = None) -> Dict[str, Dict]:
+    """Decode a snapshot file, optionally keeping only ``keys`` for each ticker entry.
+
+    ``path`` may also be a Parquet bundle directory written by ``write_snapshot_parquet``; its
+    tables come back as DataFrames and are only read when their key is kept.
+    """
+
+    path = Path(path)
+    bundle = path.is_dir()
+    payload = _decode_file(path / SIDECAR_NAME if bundle else path)
+    if keys is not None:
+        wanted = frozenset(keys)
+        payload = {
+            ticker: {key: value for key, value in data.items() if key in wanted}
+            for ticker, data in payload.items()
+        }
+    if bundle:
+        with duckdb.connect() as conn:
+            for data in payload.values():
+                for key, value in data.items():
+                    if isinstance(value, dict) and _TABLE_MARKER in value:
+                        data[key] = read_parquet_frame(conn, path / value[_TABLE_MARKER])
     return payload
 
 
+def write_snapshot_parquet(snapshot: Dict[str, Dict[str, Any]], directory: str | Path) -> Path:
+    """Write ``snapshot`` as a Parquet bundle: DataFrame tables as Parquet, the rest as JSON."""
+
+    directory = Path(directory)
+    directory.mkdir(parents=True, exist_ok=True)
+    sidecar: Dict[str, Dict[str, Any]] = {}
+    with duckdb.connect() as conn:
+        for index, (ticker, data) in enumerate(snapshot.items()):
+            entry: Dict[str, Any] = {}
+            for key, value in data.items():
+                if key in TABLE_KEYS and isinstance(value, pd.DataFrame) and not value.empty:
+                    # Index-based names keep arbitrary ticker strings out of file paths.
+                    name = f"{index:04d}_{key}.parquet"
+                    target = str(directory / name).replace("'", "''")
+                    conn.register("snapshot_table", value)
+                    conn.execute(f"COPY snapshot_table TO '{target}' (FORMAT parquet)")
+                    conn.unregister("snapshot_table")
+                    entry[key] = {_TABLE_MARKER: name}
+                elif isinstance(value, pd.DataFrame):
+                    entry[key] = value.to_dict(orient="list")
+                else:
+                    entry[key] = value
+            sidecar[ticker] = entry
+    payload = orjson.dumps(sidecar, option=orjson.OPT_SERIALIZE_NUMPY, default=str)
+    (directory / SIDECAR_NAME).write_bytes(payload)
+    return directory
+
+
+def _decode_file(path: Path) -> Dict[str, Dict]:
+    # Parse straight from the page cache via mmap rather than copying the file into a bytes object.
+    with path.open("rb") as handle:
+        if path.stat().st_size == 0:
+            return orjson.loads(b"")
+        with mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            with memoryview(mapped) as view:
+                return orjson.loads(view)
+
+
 def contexts_from_snapshot(snapshot: Dict[str, Dict]) -> List[StrategyContext]:
     contexts: List[StrategyContext] = []
     for ticker, data in snapshot.items():
-        bars = data.get("underlying_bars") or []
-        if isinstance(bars, list):
-            bars_df = pd.DataFrame(bars)
-        elif isinstance(bars, pd.DataFrame):
-            bars_df = bars
-        else:
-            bars_df = pd.DataFrame()
+        # Raw bars (row records or column lists) stay as-is; StrategyContext.bars_frame()
+        # builds a DataFrame on demand.
+        bars = data.get("underlying_bars")
+        if not isinstance(bars, (list, dict, pd.DataFrame)):
+            bars = []
 
         option_chain = data.get("option_chain")
         option_metrics = data.get("option_metrics") or {}
@@ -36,7 +114,7 @@ def contexts_from_snapshot(snapshot: Dict[str, Dict]) -> List[StrategyContext]:
 
         context = StrategyContext(
             ticker=ticker,
-            underlying_bars=bars_df,
+            underlying_bars=bars,
             option_chain=option_chain,
             option_metrics=option_metrics,
             option_quote=option_quote,
@@ -2,15 +2,30 @@
 
 from __future__ import annotations
 
+import hashlib
+import math
 from dataclasses import dataclass, field
-from typing import Dict, Iterable, List, Optional
+from typing import Any, Dict, Iterable, List, Optional, Tuple
 
+import numpy as np
+import orjson
 import pandas as pd
 
-from trading_ai.risk.manager import PositionSizingInput, RiskManager
+from trading_ai.risk.manager import RiskManager
 from trading_ai.strategies.base import StrategyContext, TradingSignal, TradingStrategy
 
 
+# Initial number of candidate rows sized per RiskManager.size_position_batch call.
+_SIZING_WINDOW = 32
+
+# Delta assumed when a signal carries no usable delta hint.
+_DEFAULT_DELTA = {"CALL": 0.5, "PUT": -0.4}
+
+_FINGERPRINT_OPTIONS = orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS
+# orjson writes NaN/inf as null; fingerprints tag them under this key so they stay distinct from None.
+_NON_FINITE_TAG = "__non_finite__"
+
+
 @dataclass
 class BacktestConfig:
     starting_equity: float = 150.0
@@ -43,135 +58,223 @@ class BacktestResult:
 class BacktestRunner:
     """Executes a strategy over historical snapshots."""
 
-    def __init__(self, strategy: TradingStrategy, risk_manager: Optional[RiskManager] = None, config: Optional[BacktestConfig] = None) -> None:
+    def __init__(
+        self,
+        strategy: TradingStrategy,
+        risk_manager: Optional[RiskManager] = None,
+        config: Optional[BacktestConfig] = None,
+        *,
+        cache_signals: bool = False,
+    ) -> None:
         self.strategy = strategy
         self.risk_manager = risk_manager or RiskManager()
         self.config = config or BacktestConfig()
+        # Only safe for deterministic strategies; lets config sweeps reuse signals across runs.
+        self.cache_signals = cache_signals
+        self._signal_cache: Dict[Tuple[str, bytes], TradingSignal] = {}
 
-    def run(self, snapshots: Iterable[StrategyContext]) -> BacktestResult:
-        equity = self.config.starting_equity
-        equity_points: List[float] = []
-        trades: List[TradeRecord] = []
-
-        for context in snapshots:
-            signal = self.strategy.generate_signal(context)
-            if signal.direction == "NONE" or signal.confidence <= 0:
-                equity_points.append(equity)
-                continue
-            if signal.confidence < self.config.min_confidence:
-                equity_points.append(equity)
-                continue
-
-            entry_price = self._infer_entry_price(signal, context)
-            if entry_price is None or entry_price < self.config.min_contract_price:
-                equity_points.append(equity)
-                continue
+    def clear_signal_cache(self) -> None:
+        self._signal_cache.clear()
 
-            size = self.risk_manager.size_position(
-                PositionSizingInput(
-                    account_equity=equity,
-                    trade_risk_fraction=self.config.risk_fraction,
-                    contract_price=entry_price,
-                    confidence=signal.confidence,
-                    max_positions=self.config.max_positions,
-                )
-            )
-            if size == 0:
-                equity_points.append(equity)
-                continue
+    def run(self, snapshots: Iterable[StrategyContext]) -> BacktestResult:
+        contexts = list(snapshots)
+        signals, batch = self._build_batch(contexts)
+        exit_prices = self._project_exit_prices(batch)
+        # Per-contract P&L net of the round-trip commission; sizing is applied below.
+        unit_pnl = batch["pnl_sign"] * (exit_prices - batch["entry"]) - 2 * self.config.commission_per_contract
 
-            exit_price = self._simulate_exit_price(signal, context, entry_price)
-            pnl = (exit_price - entry_price) * size
-            if signal.direction == "PUT":
-                pnl *= -1
+        sizes = self._size_positions(batch, unit_pnl)
+        # Sequential accumulate seeded with the starting equity, matching a running total.
+        pnl = np.where(sizes > 0, unit_pnl * sizes, 0.0)
+        equity_points = np.add.accumulate(np.concatenate(([self.config.starting_equity], pnl)))[1:]
+        equity = float(equity_points[-1]) if equity_points.size else self.config.starting_equity
 
-            pnl -= self.config.commission_per_contract * size * 2  # round-trip cost
-            equity += pnl
-            equity_points.append(equity)
+        trades: List[TradeRecord] = []
+        for i in np.flatnonzero(sizes):
+            signal = signals[i]
+            quantity = int(sizes[i])
             trades.append(
                 TradeRecord(
                     ticker=signal.ticker,
                     direction=signal.direction,
-                    entry_price=entry_price,
-                    exit_price=exit_price,
-                    quantity=size,
-                    pnl=pnl,
+                    entry_price=float(batch["entry"][i]),
+                    exit_price=float(exit_prices[i]),
+                    quantity=quantity,
+                    pnl=float(unit_pnl[i]) * quantity,
                     confidence=signal.confidence,
                     metadata=signal.metadata or {},
                 )
             )
 
-        equity_series = pd.Series(equity_points)
+        equity_series = pd.Series(equity_points, copy=False)
         stats = {
             "final_equity": equity,
             "return_pct": (equity / self.config.starting_equity) - 1,
-            "max_drawdown": self._max_drawdown(equity_series),
+            "max_drawdown": self._max_drawdown(equity_points),
             "num_trades": len(trades),
         }
         return BacktestResult(equity_curve=equity_series, trades=trades, stats=stats)
 
-    def _infer_entry_price(self, signal: TradingSignal, context: StrategyContext) -> Optional[float]:
-        if signal.entry_price:
-            return signal.entry_price
-        quote = context.option_quote
-        if isinstance(quote, dict) and ("CALL" in quote or "PUT" in quote):
-            quote = quote.get(signal.direction) or quote.get("CALL") or quote.get("PUT")
-        bid = None
-        ask = None
-        if isinstance(quote, dict):
-            bid = quote.get("bid", quote.get("bid_price"))
-            ask = quote.get("ask", quote.get("ask_price"))
-        if bid is None or ask is None:
-            return None
-        mid = (float(bid) + float(ask)) / 2
-        return mid
+    def _size_positions(self, batch: Dict[str, np.ndarray], unit_pnl: np.ndarray) -> np.ndarray:
+        """Contract counts per context; every fill moves the equity later sizes are based on.
 
-    def _simulate_exit_price(self, signal: TradingSignal, context: StrategyContext, entry_price: float) -> float:
-        if signal.target_price:
-            return signal.target_price
+        Sizes are computed in windows at the current equity. Rows before the first fill in a
+        window are final (equity has not changed yet); the window restarts after each fill and
+        doubles while nothing fills, so sparse trading costs a handful of NumPy calls.
+        """
 
-        agg_exit = self._option_aggregate_exit(signal, context, entry_price)
-        if agg_exit is not None:
-            return agg_exit
+        sizes = np.zeros(len(unit_pnl), dtype=np.int64)
+        rows = np.flatnonzero(batch["tradable"])
+        entry = batch["entry"][rows]
+        confidence = batch["confidence"][rows]
+        equity = self.config.starting_equity
+        start, window = 0, _SIZING_WINDOW
+        while start < rows.size:
+            stop = min(start + window, rows.size)
+            chunk = self.risk_manager.size_position_batch(
+                equity,
+                entry[start:stop],
+                confidence[start:stop],
+                trade_risk_fraction=self.config.risk_fraction,
+                max_positions=self.config.max_positions,
+            )
+            filled = np.flatnonzero(chunk)
+            if filled.size == 0:
+                start, window = stop, window * 2
+                continue
+            row = rows[start + filled[0]]
+            sizes[row] = chunk[filled[0]]
+            equity += float(unit_pnl[row]) * int(sizes[row])
+            start, window = start + int(filled[0]) + 1, _SIZING_WINDOW
+        return sizes
 
-        underlying_return = self._underlying_return(context)
-        if underlying_return is not None:
-            direction = 1 if signal.direction == "CALL" else -1
-            delta_hint = self._signal_delta_hint(signal)
-            leverage = max(1.5, min(8.0, abs(delta_hint) * 12))
-            option_return = direction * underlying_return * leverage
-            projected = entry_price * (1 + option_return)
-            floor_price = entry_price * 0.1
-            return max(floor_price, projected)
+    def _build_batch(self, contexts: List[StrategyContext]) -> Tuple[List[TradingSignal], Dict[str, np.ndarray]]:
+        """Score each context and lay the per-trade inputs out as parallel arrays."""
 
-        direction = 1 if signal.direction == "CALL" else -1
-        return entry_price * (1 + direction * 0.2 * signal.confidence)
+        n = len(contexts)
+        signals: List[TradingSignal] = []
+        batch = {
+            "entry": np.full(n, np.nan, dtype=np.float64),
+            "confidence": np.empty(n, dtype=np.float64),
+            "delta": np.zeros(n, dtype=np.float64),
+            "underlying_return": np.full(n, np.nan, dtype=np.float64),
+            "fixed_exit": np.full(n, np.nan, dtype=np.float64),
+            "direction": np.empty(n, dtype=np.int8),
+            "pnl_sign": np.empty(n, dtype=np.int8),
+            "tradable": np.zeros(n, dtype=bool),
+        }
 
-    def _underlying_return(self, context: StrategyContext) -> Optional[float]:
+        for i, context in enumerate(contexts):
+            signal = self._generate_signal(context)
+            signals.append(signal)
+            batch["confidence"][i] = signal.confidence
+            batch["direction"][i] = 1 if signal.direction == "CALL" else -1
+            batch["pnl_sign"][i] = -1 if signal.direction == "PUT" else 1
+
+            entry_price = None
+            if signal.direction != "NONE" and signal.confidence > 0 and signal.confidence >= self.config.min_confidence:
+                entry_price = self._infer_entry_price(signal, context)
+            if entry_price is None or entry_price < self.config.min_contract_price:
+                continue
+
+            batch["tradable"][i] = True
+            batch["entry"][i] = entry_price
+            batch["delta"][i] = self._signal_delta_hint(signal)
+            exit_price = signal.target_price or self._option_aggregate_exit(signal, context, entry_price)
+            if exit_price is not None:
+                batch["fixed_exit"][i] = exit_price
+                continue
+            move = self._underlying_return(context)
+            if move is not None:
+                batch["underlying_return"][i] = move
+
+        return signals, batch
+
+    def _generate_signal(self, context: StrategyContext) -> TradingSignal:
+        if not self.cache_signals:
+            return self.strategy.generate_signal(context)
+        key = self._context_fingerprint(context)
+        if key is None:
+            return self.strategy.generate_signal(context)
+        signal = self._signal_cache.get(key)
+        if signal is None:
+            signal = self.strategy.generate_signal(context)
+            self._signal_cache[key] = signal
+        return signal
+
+    def _context_fingerprint(self, context: StrategyContext) -> Optional[Tuple[str, bytes]]:
+        """Digest over every strategy input, or None when the context cannot be hashed faithfully.
+
+        Bar frames are hashed in full (index, column labels, dtypes, and values) and NaN/inf are
+        tagged rather than collapsed into null. Contexts carrying values orjson cannot encode
+        natively (e.g. pandas Timestamps) are not cached instead of being hashed by ``repr``.
+        """
+
+        digest = hashlib.blake2b(digest_size=16)
         bars = context.underlying_bars
-        if not isinstance(bars, pd.DataFrame) or bars.empty or "close" not in bars:
-            return None
         try:
-            close = bars["close"].astype(float)
-            start = float(close.iloc[0])
-            end = float(close.iloc[-1])
-        except (TypeError, ValueError, IndexError):
+            if isinstance(bars, pd.DataFrame):
+                _hash_frame(digest, bars)
+                bars = None
+            if context.underlying_close is not None:
+                digest.update(context.underlying_close.tobytes())
+            payload = [
+                bars,
+                context.option_chain,
+                context.option_metrics,
+                context.option_quote,
+                context.news_items,
+                context.features,
+                context.option_aggregates,
+                context.call_mid,
+                context.put_mid,
+            ]
+            digest.update(orjson.dumps(_tag_non_finite(payload), option=_FINGERPRINT_OPTIONS))
+        except TypeError:  # orjson.JSONEncodeError, or unhashable values in an object column
+            return None
+        return context.ticker, digest.digest()
+
+    def _project_exit_prices(self, batch: Dict[str, np.ndarray]) -> np.ndarray:
+        """Exit prices for the whole batch: explicit exits first, else an underlying-move projection."""
+
+        entry = batch["entry"]
+        direction = batch["direction"]
+        underlying_return = batch["underlying_return"]
+        leverage = np.clip(np.abs(batch["delta"]) * 12, 1.5, 8.0)
+        projected = np.maximum(entry * 0.1, entry * (1 + direction * underlying_return * leverage))
+        drift = entry * (1 + direction * 0.2 * batch["confidence"])
+        modelled = np.where(np.isnan(underlying_return), drift, projected)
+        return np.where(np.isnan(batch["fixed_exit"]), modelled, batch["fixed_exit"])
+
+    def _infer_entry_price(self, signal: TradingSignal, context: StrategyContext) -> Optional[float]:
+        if signal.entry_price:
+            return signal.entry_price
+        mid = context.put_mid if signal.direction == "PUT" else context.call_mid
+        if mid is None or np.isnan(mid):
+            return None
+        return mid
+
+    def _underlying_return(self, context: StrategyContext) -> Optional[float]:
+        close = context.underlying_close
+        if close is None or close.size == 0:
             return None
-        if start <= 0:
+        start = float(close[0])
+        end = float(close[-1])
+        if not start > 0 or np.isnan(end):
             return None
         return (end - start) / start
 
     def _signal_delta_hint(self, signal: TradingSignal) -> float:
         metadata = signal.metadata or {}
         delta = metadata.get("delta") or metadata.get("delta_bias")
-        try:
+        if isinstance(delta, (int, float)):
             return float(delta)
-        except (TypeError, ValueError):
-            if signal.direction == "CALL":
-                return 0.5
-            if signal.direction == "PUT":
-                return -0.4
-            return 0.3
+        if delta is not None:
+            try:
+                return float(delta)
+            except (TypeError, ValueError):
+                pass
+        return _DEFAULT_DELTA.get(signal.direction, 0.3)
 
     def _option_aggregate_exit(self, signal: TradingSignal, context: StrategyContext, entry_price: float) -> Optional[float]:
         aggs = context.option_aggregates or {}
@@ -187,7 +290,46 @@ class BacktestRunner:
             return None
         return max(exit_price, 0.01)
 
-    def _max_drawdown(self, equity: pd.Series) -> float:
-        running_max = equity.cummax()
-        drawdown = (equity - running_max) / running_max
-        return abs(drawdown.min()) if not drawdown.empty else 0.0
+    def _max_drawdown(self, equity: np.ndarray) -> float:
+        if equity.size == 0:
+            return 0.0
+        running_max = np.maximum.accumulate(equity)
+        # The running max never decreases, so rows with a positive peak form a suffix; the
+        # prefix contributes zero drawdown and needs no mask or zero-filled buffer.
+        start = int(np.searchsorted(running_max, 0.0, side="right"))
+        if start == equity.size:
+            return 0.0
+        peaks = running_max[start:]
+        drawdown = equity[start:] - peaks
+        np.divide(drawdown, peaks, out=drawdown)
+        return float(abs(drawdown.min()))
+
+
+def _tag_non_finite(value: Any) -> Any:
+    """Copy of ``value`` with NaN/inf floats replaced by tagged markers, recursing into containers."""
+
+    if isinstance(value, (float, np.floating)):
+        return value if math.isfinite(value) else {_NON_FINITE_TAG: repr(float(value))}
+    if isinstance(value, dict):
+        return {key: _tag_non_finite(item) for key, item in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [_tag_non_finite(item) for item in value]
+    if isinstance(value, np.ndarray):
+        inexact = value.dtype.kind in "fc"
+        if value.dtype == object or (inexact and not np.isfinite(value).all()):
+            return _tag_non_finite(value.tolist())
+    return value
+
+
+def _hash_frame(digest: hashlib.blake2b, frame: pd.DataFrame) -> None:
+    """Feed the index, column labels, dtypes, and every column's values of ``frame`` into ``digest``."""
+
+    labels = [[repr(column), str(dtype)] for column, dtype in frame.dtypes.items()]
+    digest.update(orjson.dumps(labels))
+    digest.update(pd.util.hash_pandas_object(frame.index).to_numpy().tobytes())
+    for _, values in frame.items():
+        if values.dtype == object:
+            # hash_pandas_object folds None into NaN, so object columns take the tagged JSON path.
+            digest.update(orjson.dumps(_tag_non_finite(values.tolist()), option=_FINGERPRINT_OPTIONS))
+        else:
+            digest.update(pd.util.hash_pandas_object(values, index=False).to_numpy().tobytes())
@@ -5,16 +5,17 @@ from __future__ import annotations
 import argparse
 from datetime import datetime, timedelta
 from pathlib import Path
-from typing import Any, Dict
+from typing import TYPE_CHECKING, Any, Dict
 
 import orjson
-import pandas as pd
 
-from trading_ai.core.pipeline import SignalPipeline
-from trading_ai.risk.manager import RiskManager
-from trading_ai.service.auto_trader import AutoTrader, AutoTraderConfig
 from trading_ai.settings import get_settings
-from trading_ai.strategies.momentum_iv import MomentumIVStrategy
+
+if TYPE_CHECKING:
+    import pandas as pd
+
+# Pipeline, trader and pandas imports are deferred to the commands that use them so
+# lightweight commands such as check-config start without loading the data stack.
 
 
 def command_check_config(args: argparse.Namespace) -> None:
@@ -29,6 +30,8 @@ def command_check_config(args: argparse.Namespace) -> None:
 def command_collect_snapshots(args: argparse.Namespace) -> None:
     """Collect and persist market snapshots for later analysis."""
 
+    from trading_ai.core.pipeline import SignalPipeline
+
     settings = get_settings()
     pipeline = SignalPipeline(settings)
     lookback = timedelta(minutes=args.lookback_minutes)
@@ -37,21 +40,30 @@ def command_collect_snapshots(args: argparse.Namespace) -> None:
         f"Collecting snapshots for {len(settings.target_tickers)} tickers "
         f"(lookback={args.lookback_minutes}m, news={args.news_hours}h, timeframe={args.timeframe})..."
     )
-    snapshot = pipeline.collect_market_snapshot(
-        lookback=lookback,
-        news_lookback=news_lookback,
-        timeframe=args.timeframe,
-        use_cache=not args.no_cache,
-        include_news=not args.skip_news,
-    )
+    try:
+        snapshot = pipeline.collect_market_snapshot(
+            lookback=lookback,
+            news_lookback=news_lookback,
+            timeframe=args.timeframe,
+            use_cache=not args.no_cache,
+            include_news=not args.skip_news,
+        )
+    finally:
+        pipeline.close()
 
     output_dir: Path = args.output
     output_dir.mkdir(parents=True, exist_ok=True)
     timestamp = datetime.utcnow().strftime("%Y%m%d_%H%M%S")
+    if args.format == "parquet":
+        from trading_ai.backtest.data_loader import write_snapshot_parquet
+
+        path = write_snapshot_parquet(snapshot, output_dir / f"snapshots_{timestamp}")
+        print(f"Snapshot saved to {path}")
+        return
     path = output_dir / f"snapshots_{timestamp}.json"
     payload = orjson.dumps(
         _to_serializable(snapshot),
-        option=orjson.OPT_INDENT_2,
+        option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY,
         default=str,
     )
     path.write_bytes(payload)
@@ -61,6 +73,11 @@ def command_collect_snapshots(args: argparse.Namespace) -> None:
 def command_auto_trade(args: argparse.Namespace) -> None:
     """Execute AutoTrader once or in a loop."""
 
+    from trading_ai.core.pipeline import SignalPipeline
+    from trading_ai.risk.manager import RiskManager
+    from trading_ai.service.auto_trader import AutoTrader, AutoTraderConfig
+    from trading_ai.strategies.momentum_iv import MomentumIVStrategy
+
     settings = get_settings()
     min_conf = args.min_confidence if args.min_confidence is not None else settings.auto_min_confidence
     risk_fraction = args.risk_fraction if args.risk_fraction is not None else settings.auto_risk_fraction
@@ -112,12 +129,18 @@ def build_parser() -> argparse.ArgumentParser:
     check.set_defaults(func=command_check_config)
 
     collect = sub.add_parser("collect-snapshots", help="Collect and persist market snapshots.")
-    collect.add_argument("--output", type=Path, default=Path("data/snapshots"), help="Output directory for JSON snapshots.")
+    collect.add_argument("--output", type=Path, default=Path("data/snapshots"), help="Output directory for snapshots.")
     collect.add_argument("--lookback-minutes", type=int, default=390, help="Underlying bar lookback window in minutes.")
     collect.add_argument("--news-hours", type=int, default=12, help="News lookback window in hours.")
     collect.add_argument("--timeframe", type=str, default="1Min", help="Underlying bar timeframe (Alpaca syntax).")
     collect.add_argument("--no-cache", action="store_true", help="Bypass local cache when collecting data.")
     collect.add_argument("--skip-news", action="store_true", help="Skip news ingestion when collecting snapshots.")
+    collect.add_argument(
+        "--format",
+        choices=("json", "parquet"),
+        default="json",
+        help="Snapshot format: a single JSON file or a directory of Parquet tables plus JSON sidecar.",
+    )
     collect.set_defaults(func=command_collect_snapshots)
 
     auto = sub.add_parser("auto-trade", help="Score live signals and (optionally) submit orders.")
@@ -158,19 +181,31 @@ def run(argv: list[str] | None = None) -> None:
 
 
 def _to_serializable(snapshot: Dict[str, Dict[str, Any]]) -> Dict[str, Dict[str, Any]]:
+    import pandas as pd
+
     serializable: Dict[str, Dict[str, Any]] = {}
     for ticker, data in snapshot.items():
         entry: Dict[str, Any] = {}
         for key, value in data.items():
-            if key == "underlying_bars" and isinstance(value, pd.DataFrame):
-                entry[key] = value.to_dict(orient="records")
-            elif key == "option_chain" and isinstance(value, pd.DataFrame):
-                entry[key] = value.to_dict(orient="records")
+            if key in {"underlying_bars", "option_chain"} and isinstance(value, pd.DataFrame):
+                entry[key] = _frame_columns(value)
             else:
                 entry[key] = value
         serializable[ticker] = entry
     return serializable
 
 
+def _frame_columns(frame: "pd.DataFrame") -> Dict[str, Any]:
+    """Column-oriented view of a frame; numeric columns stay NumPy arrays for orjson."""
+
+    columns: Dict[str, Any] = {}
+    for name, series in frame.items():
+        if series.dtype.kind in "biuf":
+            columns[str(name)] = series.to_numpy()
+        else:
+            columns[str(name)] = series.tolist()
+    return columns
+
+
 if __name__ == "__main__":
     run()
@@ -2,8 +2,12 @@
 
 from __future__ import annotations
 
+import re
 from datetime import datetime
-from typing import Any
+from functools import lru_cache
+from typing import Any, Dict, List, Sequence
+
+import pandas as pd
 
 from alpaca.data.enums import DataFeed
 from alpaca.data.historical import OptionHistoricalDataClient, StockHistoricalDataClient
@@ -19,9 +23,28 @@ from alpaca.trading.requests import MarketOrderRequest
 from alpaca.trading.enums import OrderSide, TimeInForce, PositionIntent
 from loguru import logger
 
-from trading_ai.clients.base import APIClientError, BaseClient
+from trading_ai.clients.base import APIClientError, BaseClient, pooled_adapter
 from trading_ai.settings import Settings
 
+# Alpaca caps the number of symbols accepted by a single multi-symbol bars request.
+MAX_BAR_SYMBOLS = 200
+
+# Timeframe strings such as "1Min", "15minute", "1Hour", or "day".
+_TIMEFRAME_RE = re.compile(r"^(\d*)\s*(min|minute|hour|day|week|month)s?$", re.IGNORECASE)
+_TIMEFRAME_UNITS = {
+    "min": TimeFrameUnit.Minute,
+    "minute": TimeFrameUnit.Minute,
+    "hour": TimeFrameUnit.Hour,
+    "day": TimeFrameUnit.Day,
+    "week": TimeFrameUnit.Week,
+    "month": TimeFrameUnit.Month,
+}
+
+_DATA_FEEDS = {
+    "IEX": DataFeed.IEX,
+    "SIP": DataFeed.SIP,
+}
+
 
 class AlpacaClient(BaseClient):
     """Lightweight wrapper around Alpaca clients."""
@@ -43,6 +66,19 @@ class AlpacaClient(BaseClient):
             api_key=settings.alpaca_api_key_id,
             secret_key=settings.alpaca_api_secret_key,
         )
+        # The SDK's sessions default to 10 pooled connections per host, fewer than the collector's
+        # concurrent workers, so surplus connections were dropped and re-handshaken.
+        for sdk_client in self._sdk_clients:
+            sdk_client._session.mount("https://", pooled_adapter())
+
+    @property
+    def _sdk_clients(self) -> tuple:
+        return (self._trading_client, self._option_client, self._equity_client)
+
+    def close(self) -> None:
+        super().close()
+        for sdk_client in self._sdk_clients:
+            sdk_client._session.close()
 
     def fetch_option_chain(self, symbol: str, expiration: datetime | None = None) -> Any:
         """
@@ -98,6 +134,43 @@ class AlpacaClient(BaseClient):
         self._log("Fetched equity bars", symbol=symbol, feed="alpaca")
         return bars
 
+    def fetch_underlying_bars_batch(
+        self,
+        symbols: Sequence[str],
+        start: datetime,
+        end: datetime,
+        timeframe: str = "1Min",
+    ) -> Dict[str, pd.DataFrame]:
+        """Fetch bars for many symbols with one request per ``MAX_BAR_SYMBOLS`` chunk.
+
+        Returns one flat frame per requested symbol (empty when Alpaca has no bars for it),
+        shaped like ``fetch_underlying_bars(...).df.reset_index()``.
+        """
+
+        bar_timeframe = self._parse_timeframe(timeframe)
+        unique: List[str] = list(dict.fromkeys(symbols))
+        frames: Dict[str, pd.DataFrame] = {}
+        for offset in range(0, len(unique), MAX_BAR_SYMBOLS):
+            chunk = unique[offset : offset + MAX_BAR_SYMBOLS]
+            request = StockBarsRequest(
+                symbol_or_symbols=chunk,
+                start=start,
+                end=end,
+                timeframe=bar_timeframe,
+                feed=self._data_feed,
+            )
+            try:
+                bars = self._equity_client.get_stock_bars(request)
+            except Exception as exc:  # pragma: no cover - network failure path
+                logger.exception("Failed to fetch stock bars from Alpaca", symbols=len(chunk))
+                raise APIClientError(f"Alpaca stock bars error: {exc}") from exc
+            flat = bars.df.reset_index()
+            if "symbol" in flat.columns:
+                for symbol, group in flat.groupby("symbol", sort=False):
+                    frames[str(symbol)] = group.reset_index(drop=True)
+            self._log("Fetched equity bars", symbols=len(chunk), feed="alpaca")
+        return {symbol: frames.get(symbol, pd.DataFrame()) for symbol in unique}
+
     def submit_market_order(
         self,
         symbol: str,
@@ -159,34 +232,38 @@ class AlpacaClient(BaseClient):
         self._log("Fetched latest trade", symbol=symbol)
         return data
 
+    def fetch_latest_trades(self, symbols: Sequence[str]) -> Dict[str, Any]:
+        """Fetch the most recent trade for many stocks in a single request, keyed by symbol."""
+
+        unique: List[str] = list(dict.fromkeys(symbols))
+        if not unique:
+            return {}
+        request = StockLatestTradeRequest(symbol_or_symbols=unique)
+        try:
+            data = self._equity_client.get_stock_latest_trade(request)
+        except Exception as exc:  # pragma: no cover - network failure path
+            logger.exception("Failed to fetch latest stock trades from Alpaca", symbols=len(unique))
+            raise APIClientError(f"Alpaca latest trade error: {exc}") from exc
+        self._log("Fetched latest trades", symbols=len(unique))
+        return dict(data)
+
     def _parse_timeframe(self, value: str | TimeFrame) -> TimeFrame:
         if isinstance(value, TimeFrame):
             return value
-        raw = str(value).strip().lower()
-        units = [
-            ("min", TimeFrameUnit.Minute),
-            ("minute", TimeFrameUnit.Minute),
-            ("hour", TimeFrameUnit.Hour),
-            ("day", TimeFrameUnit.Day),
-            ("week", TimeFrameUnit.Week),
-            ("month", TimeFrameUnit.Month),
-        ]
-        for suffix, unit in units:
-            if raw.endswith(suffix):
-                amount_part = raw[: -len(suffix)].strip()
-                if not amount_part:
-                    amount = 1
-                else:
-                    amount = int(amount_part)
-                return TimeFrame(amount, unit)
-        raise ValueError(f"Unsupported timeframe: {value}")
+        return _timeframe_from_string(str(value))
 
     def _resolve_data_feed(self, feed_name: str) -> DataFeed:
         normalized = (feed_name or "IEX").strip().upper()
-        mapping = {
-            "IEX": DataFeed.IEX,
-            "SIP": DataFeed.SIP,
-        }
-        if normalized not in mapping:
+        if normalized not in _DATA_FEEDS:
             logger.warning("Unknown alpaca data feed '%s', defaulting to IEX", normalized)
-        return mapping.get(normalized, DataFeed.IEX)
+        return _DATA_FEEDS.get(normalized, DataFeed.IEX)
+
+
+@lru_cache(maxsize=32)
+def _timeframe_from_string(value: str) -> TimeFrame:
+    # Only a handful of distinct strings are ever used; TimeFrame values are not mutated.
+    match = _TIMEFRAME_RE.match(value.strip())
+    if match:
+        amount = int(match.group(1)) if match.group(1) else 1
+        return TimeFrame(amount, _TIMEFRAME_UNITS[match.group(2).lower()])
+    raise ValueError(f"Unsupported timeframe: {value}")
@@ -5,20 +5,34 @@ from __future__ import annotations
 from datetime import datetime
 from typing import Any, Dict, List
 
+import orjson
 import requests
 from loguru import logger
 
-from trading_ai.clients.base import APIClientError, BaseClient
+from trading_ai.clients.base import APIClientError, BaseClient, floor_minute
+from trading_ai.utils.ratelimit import shared_bucket
 
 
 class AlphaVantageNewsClient(BaseClient):
     """Fetches news & sentiment data from Alpha Vantage."""
 
+    _warmup_url = "https://www.alphavantage.co/"
+
     def __init__(self, api_key: str) -> None:
         super().__init__("alpha_vantage")
+        # Free tier: 5 requests per minute.
+        self._rate_limiter = shared_bucket("www.alphavantage.co", rate=5 / 60, burst=5)
         self._api_key = api_key
 
     def fetch_headlines(self, ticker: str, *, since: datetime | None = None, limit: int = 50) -> List[Dict[str, Any]]:
+        # Minute-floored so repeated passes share a cache entry; at most a minute of extra lookback.
+        since = floor_minute(since)
+        return self._cached(
+            ("headlines", ticker, since, limit),
+            lambda: self._fetch_headlines(ticker, since=since, limit=limit),
+        )
+
+    def _fetch_headlines(self, ticker: str, *, since: datetime | None = None, limit: int = 50) -> List[Dict[str, Any]]:
         params = {
             "function": "NEWS_SENTIMENT",
             "tickers": ticker,
@@ -28,13 +42,14 @@ class AlphaVantageNewsClient(BaseClient):
         if since:
             params["time_from"] = since.strftime("%Y%m%dT%H%M")
         try:
-            response = requests.get("https://www.alphavantage.co/query", params=params, timeout=10)
-            response.raise_for_status()
+            response = self._request_with_retry(
+                lambda: self._http.get("https://www.alphavantage.co/query", params=params, timeout=10)
+            )
         except requests.RequestException as exc:  # pragma: no cover - network path
             logger.exception("Alpha Vantage news fetch failed", ticker=ticker)
             raise APIClientError(f"Alpha Vantage error: {exc}") from exc
 
-        data = response.json()
+        data = orjson.loads(response.content)
         items = data.get("feed", [])
         normalized: List[Dict[str, Any]] = []
         for item in items:
@@ -2,24 +2,166 @@
 
 from __future__ import annotations
 
-from typing import Any, Mapping
+import copy
+import random
+import time
+from datetime import datetime, timedelta
+from typing import Any, Callable, Hashable, Mapping, Optional, TypeVar
 
+import requests
 from loguru import logger
+from requests.adapters import HTTPAdapter
+
+from trading_ai.utils.ratelimit import TokenBucket
+from trading_ai.utils.ttl import TTLCache
+
+T = TypeVar("T")
+MaybeDatetime = TypeVar("MaybeDatetime", datetime, Optional[datetime])
+
+# Keep-alive connections held per host, sized for the collector's concurrent ticker workers.
+POOL_MAXSIZE = 32
+
+# Status codes worth retrying: rate limiting and transient gateway/server failures.
+RETRY_STATUSES = frozenset({429, 502, 503, 504})
 
 
 class APIClientError(Exception):
     """Raised when a client-level error occurs."""
 
 
+class RateLimitExceeded(APIClientError):
+    """Raised when the client-side quota guard holds a request back; the provider was not called."""
+
+
 class BaseClient:
     """Base functionality for API client implementations."""
 
+    # Host root probed by warmup() to pre-establish DNS, TCP, and TLS for the pooled session.
+    _warmup_url: str | None = None
+
     def __init__(self, name: str, extra_context: Mapping[str, Any] | None = None) -> None:
         self.name = name
         self._context = dict(extra_context or {})
+        # Bound once; per-call kwargs go through debug(), which returns early when DEBUG is off.
+        self._logger = logger.bind(client=name, **self._context)
+        self._session: requests.Session | None = None
+        # Short-lived response memo so repeated screening passes skip identical upstream calls.
+        self._response_cache = TTLCache(maxsize=512, ttl=60.0)
+        # Optional provider quota guard; subclasses attach a shared per-host bucket.
+        self._rate_limiter: TokenBucket | None = None
+        self._rate_limit_wait = 15.0
+
+    @property
+    def _http(self) -> requests.Session:
+        """Keep-alive session for REST calls, created on first use and reused afterwards."""
+
+        if self._session is None:
+            session = requests.Session()
+            session.mount("https://", pooled_adapter())
+            self._session = session
+        return self._session
+
+    def close(self) -> None:
+        """Release pooled connections; the session is recreated if the client is used again."""
+
+        if self._session is not None:
+            self._session.close()
+            self._session = None
+
+    def warmup(self) -> None:
+        """Open a kept-alive connection to the provider ahead of the first real request."""
+
+        if self._warmup_url is None:
+            return
+        try:
+            self._http.head(self._warmup_url, timeout=5)
+        except requests.RequestException as exc:
+            self._log("Warmup request failed", error=str(exc))
 
     def _log(self, message: str, **kwargs: Any) -> None:
         """Convenience logger hook."""
 
-        logger.bind(client=self.name, **self._context, **kwargs).debug(message)
+        self._logger.debug(message, **kwargs)
+
+    def _cached(self, key: Hashable, fetch: Callable[[], T]) -> T:
+        """Return ``fetch()`` memoised under ``key``; callers get a copy they may mutate."""
+
+        return copy.deepcopy(self._response_cache.get_or_set(key, fetch))
+
+    def _throttle(self) -> None:
+        """Wait for the provider's rate limiter; fail fast when the quota is exhausted."""
+
+        if self._rate_limiter is not None and not self._rate_limiter.acquire(timeout=self._rate_limit_wait):
+            raise RateLimitExceeded(f"{self.name} client-side rate limit exhausted")
+
+    def _request_with_retry(
+        self,
+        send: Callable[[], requests.Response],
+        *,
+        max_retries: int = 3,
+        base_delay: float = 1.0,
+        jitter: float = 0.5,
+        cap: float = 30.0,
+    ) -> requests.Response:
+        """Call ``send`` with exponential backoff on 429/502/503/504 and connection failures.
+
+        Every attempt first takes a token from the client's rate limiter, if one is attached.
+        Honours a numeric ``Retry-After`` header. Once retries are exhausted the last error is
+        raised as the usual ``requests`` exception, so callers keep their existing handling.
+        """
+
+        attempt = 0
+        while True:
+            self._throttle()
+            try:
+                response = send()
+            except requests.ConnectionError:
+                # Covers ConnectTimeout; a ReadTimeout means the provider hung, so it fails fast.
+                if attempt >= max_retries:
+                    raise
+                retry_after = None
+            else:
+                if response.status_code not in RETRY_STATUSES or attempt >= max_retries:
+                    response.raise_for_status()
+                    return response
+                retry_after = _parse_retry_after(response.headers.get("Retry-After"))
+            if retry_after is None:
+                delay = min(cap, base_delay * 2**attempt) * (1 + random.random() * jitter)
+            else:
+                delay = min(cap, retry_after)
+            self._log("Retrying request", attempt=attempt + 1, delay=round(delay, 2))
+            time.sleep(delay)
+            attempt += 1
+
+
+def pooled_adapter() -> HTTPAdapter:
+    """HTTPS adapter keeping up to ``POOL_MAXSIZE`` connections alive per host."""
+
+    # urllib3 already sets TCP_NODELAY; the adapter just sizes the per-host pool.
+    return HTTPAdapter(pool_connections=4, pool_maxsize=POOL_MAXSIZE, max_retries=0)
+
+
+def floor_minute(value: MaybeDatetime) -> MaybeDatetime:
+    """Round ``value`` down to the minute so ``now - lookback`` windows share cache keys.
+
+    The collector recomputes its windows at microsecond precision on every snapshot; bucketed
+    bounds let the 60 s response cache actually hit across screening passes.
+    """
+
+    return value.replace(second=0, microsecond=0) if value is not None else None
+
+
+def ceil_minute(value: datetime) -> datetime:
+    """Round ``value`` up to the minute; the upper-bound counterpart of ``floor_minute``."""
+
+    floored = value.replace(second=0, microsecond=0)
+    return floored if floored == value else floored + timedelta(minutes=1)
+
 
+def _parse_retry_after(value: str | None) -> float | None:
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        return None  # HTTP-date form; fall back to exponential backoff
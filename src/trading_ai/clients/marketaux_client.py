@@ -5,20 +5,34 @@ from __future__ import annotations
 from datetime import datetime
 from typing import Any, Dict, List
 
+import orjson
 import requests
 from loguru import logger
 
-from trading_ai.clients.base import APIClientError, BaseClient
+from trading_ai.clients.base import APIClientError, BaseClient, floor_minute
+from trading_ai.utils.ratelimit import shared_bucket
 
 
 class MarketauxClient(BaseClient):
     """Fetches curated news from the Marketaux API."""
 
+    _warmup_url = "https://api.marketaux.com/"
+
     def __init__(self, api_token: str) -> None:
         super().__init__("marketaux")
+        # Free tier: roughly 100 requests per day, spendable in bursts.
+        self._rate_limiter = shared_bucket("api.marketaux.com", rate=100 / 86_400, burst=100)
         self._token = api_token
 
     def fetch_headlines(self, ticker: str, *, since: datetime | None = None, limit: int = 50) -> List[Dict[str, Any]]:
+        # Minute-floored so repeated passes share a cache entry; at most a minute of extra lookback.
+        since = floor_minute(since)
+        return self._cached(
+            ("headlines", ticker, since, limit),
+            lambda: self._fetch_headlines(ticker, since=since, limit=limit),
+        )
+
+    def _fetch_headlines(self, ticker: str, *, since: datetime | None = None, limit: int = 50) -> List[Dict[str, Any]]:
         params = {
             "symbols": ticker,
             "api_token": self._token,
@@ -29,13 +43,14 @@ class MarketauxClient(BaseClient):
         if since:
             params["published_after"] = since.isoformat()
         try:
-            response = requests.get("https://api.marketaux.com/v1/news/all", params=params, timeout=10)
-            response.raise_for_status()
+            response = self._request_with_retry(
+                lambda: self._http.get("https://api.marketaux.com/v1/news/all", params=params, timeout=10)
+            )
         except requests.RequestException as exc:  # pragma: no cover
             logger.exception("Marketaux news fetch failed", ticker=ticker)
             raise APIClientError(f"Marketaux error: {exc}") from exc
 
-        data = response.json()
+        data = orjson.loads(response.content)
         articles = data.get("data", [])
         normalized: List[Dict[str, Any]] = []
         for article in articles:
@@ -2,23 +2,30 @@
 
 from __future__ import annotations
 
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
-from typing import Any, Callable, Dict, Iterable, List, Optional
+from threading import Lock
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional
 
+import numpy as np
 from loguru import logger
 
 from trading_ai.clients.alpha_vantage_client import AlphaVantageNewsClient
-from trading_ai.clients.base import APIClientError
+from trading_ai.clients.base import APIClientError, RateLimitExceeded
 from trading_ai.clients.marketaux_client import MarketauxClient
 from trading_ai.clients.news_client import NewsClient
 from trading_ai.clients.polygon_client import PolygonClient
 from trading_ai.clients.yahoo_client import YahooNewsClient
+from trading_ai.utils.circuit import CircuitBreaker
+
+# Fields exposed column-wise by NewsAggregator.gather_columns.
+COLUMN_FIELDS = ("title", "link", "published_at", "source")
 
 ProviderFn = Callable[[str, datetime | None, int], List[Dict[str, Any]]]
 
 
 class NewsAggregator:
-    """Combines multiple news providers and handles graceful degradation."""
+    """Combines multiple news providers concurrently and handles graceful degradation."""
 
     def __init__(
         self,
@@ -28,47 +35,151 @@ class NewsAggregator:
         yahoo_client: Optional[YahooNewsClient] = None,
         alpha_client: Optional[AlphaVantageNewsClient] = None,
         marketaux_client: Optional[MarketauxClient] = None,
+        failure_threshold: int = 3,
+        cooldown_seconds: float = 60.0,
     ) -> None:
         self.providers: List[ProviderFn] = []
+        # One breaker per provider so a provider that keeps timing out is skipped for a while.
+        self.failure_threshold = failure_threshold
+        self.cooldown_seconds = cooldown_seconds
+        self._breakers: Dict[ProviderFn, CircuitBreaker] = {}
+        # Readable names for logs and breakers; providers appended directly fall back to __qualname__.
+        self._provider_names: Dict[ProviderFn, str] = {}
+        self._breakers_lock = Lock()
+        candidates = (polygon_client, yahoo_client, alpha_client, marketaux_client, news_api_client)
+        self._clients: List[Any] = [client for client in candidates if client]
         if polygon_client:
-            self.providers.append(lambda ticker, since, limit: list(polygon_client.fetch_reference_news(ticker=ticker, published_gte=since, limit=limit)))
+            self._add_provider("polygon", lambda ticker, since, limit: list(polygon_client.fetch_reference_news(ticker=ticker, published_gte=since, limit=limit)))
         if yahoo_client:
-            self.providers.append(lambda ticker, since, limit: yahoo_client.fetch_headlines(ticker=ticker, since=since, limit=limit))
+            self._add_provider("yahoo", lambda ticker, since, limit: yahoo_client.fetch_headlines(ticker=ticker, since=since, limit=limit))
         if alpha_client:
-            self.providers.append(lambda ticker, since, limit: alpha_client.fetch_headlines(ticker=ticker, since=since, limit=limit))
+            self._add_provider("alpha_vantage", lambda ticker, since, limit: alpha_client.fetch_headlines(ticker=ticker, since=since, limit=limit))
         if marketaux_client:
-            self.providers.append(lambda ticker, since, limit: marketaux_client.fetch_headlines(ticker=ticker, since=since, limit=limit))
+            self._add_provider("marketaux", lambda ticker, since, limit: marketaux_client.fetch_headlines(ticker=ticker, since=since, limit=limit))
         if news_api_client:
-            self.providers.append(lambda ticker, since, limit: news_api_client.fetch_headlines(ticker=ticker, from_date=since, limit=limit))
+            self._add_provider("newsapi", lambda ticker, since, limit: news_api_client.fetch_headlines(ticker=ticker, from_date=since, limit=limit))
+
+    def _add_provider(self, name: str, provider: ProviderFn) -> None:
+        self.providers.append(provider)
+        self._provider_names[provider] = name
+
+    def warmup(self) -> None:
+        """Pre-open connections to every configured provider concurrently."""
+
+        if not self._clients:
+            return
+        with ThreadPoolExecutor(max_workers=len(self._clients), thread_name_prefix="news") as executor:
+            for client in self._clients:
+                executor.submit(client.warmup)
+
+    def close(self) -> None:
+        """Release every provider's pooled connections."""
+
+        for client in self._clients:
+            client.close()
 
     def gather(self, ticker: str, *, since: datetime, limit: int = 50) -> List[Dict[str, Any]]:
         seen = set()
         combined: List[Dict[str, Any]] = []
-        for provider in self.providers:
-            try:
-                articles = provider(ticker, since, limit)
-            except APIClientError:
-                logger.warning("News provider failed", ticker=ticker, provider=provider.__qualname__)
-                continue
-            except Exception as exc:
-                logger.debug(
-                    "News provider disabled or misconfigured",
-                    ticker=ticker,
-                    provider=provider.__qualname__,
-                    error=str(exc),
-                )
-                continue
-            for article in articles:
-                normalized = _normalize_article(article)
-                title = (normalized.get("title") or "").strip()
-                key = (title, normalized.get("link"))
-                if title and key not in seen:
-                    combined.append(normalized)
-                    seen.add(key)
-            if len(combined) >= limit:
-                break
+        results = self._iter_results(ticker, since, limit)
+        try:
+            for articles in results:
+                for article in articles:
+                    normalized = _normalize_article(article)
+                    title = (normalized.get("title") or "").strip()
+                    # Case-insensitive titles catch the same story syndicated with different casing.
+                    key = (title.casefold(), normalized.get("link"))
+                    if title and key not in seen:
+                        combined.append(normalized)
+                        seen.add(key)
+                if len(combined) >= limit:
+                    break
+        finally:
+            results.close()
         return combined[:limit]
 
+    def gather_columns(self, ticker: str, *, since: datetime, limit: int = 50) -> Dict[str, Any]:
+        """Like ``gather`` but column-oriented: one list per field plus a float sentiment array.
+
+        Non-numeric or missing sentiment scores are NaN, so callers can aggregate with NumPy.
+        """
+
+        articles = self.gather(ticker, since=since, limit=limit)
+        columns: Dict[str, Any] = {
+            name: [article.get(name) for article in articles] for name in COLUMN_FIELDS
+        }
+        columns["sentiment"] = np.array(
+            [_sentiment_score(article.get("sentiment")) for article in articles],
+            dtype=np.float64,
+        )
+        return columns
+
+    def _iter_results(self, ticker: str, since: datetime, limit: int) -> Iterator[List[Any]]:
+        """Yield provider results in priority order while every provider is queried concurrently.
+
+        Closing the iterator early (once ``limit`` is met) stops waiting on slower providers.
+        """
+
+        if len(self.providers) <= 1:
+            for provider in self.providers:
+                yield self._fetch_one(provider, ticker, since, limit)
+            return
+        executor = ThreadPoolExecutor(max_workers=len(self.providers), thread_name_prefix="news")
+        try:
+            futures = [
+                executor.submit(self._fetch_one, provider, ticker, since, limit)
+                for provider in self.providers
+            ]
+            for future in futures:
+                yield future.result()
+        finally:
+            executor.shutdown(wait=False, cancel_futures=True)
+
+    def _fetch_one(self, provider: ProviderFn, ticker: str, since: datetime, limit: int) -> List[Any]:
+        breaker = self._breaker_for(provider)
+        if not breaker.allow():
+            logger.debug("News provider skipped; circuit open", ticker=ticker, provider=breaker.name)
+            return []
+        try:
+            articles = list(provider(ticker, since, limit))
+        except RateLimitExceeded:
+            # Held back by our own quota guard; the provider is healthy, so the breaker is not charged.
+            logger.debug("News provider held back by local rate limit", ticker=ticker, provider=breaker.name)
+            breaker.release()
+            return []
+        except APIClientError:
+            logger.warning("News provider failed", ticker=ticker, provider=breaker.name)
+        except Exception as exc:
+            logger.debug(
+                "News provider disabled or misconfigured",
+                ticker=ticker,
+                provider=breaker.name,
+                error=str(exc),
+            )
+        else:
+            breaker.record_success()
+            return articles
+        breaker.record_failure()
+        return []
+
+    def _breaker_for(self, provider: ProviderFn) -> CircuitBreaker:
+        with self._breakers_lock:
+            breaker = self._breakers.get(provider)
+            if breaker is None:
+                name = self._provider_names.get(provider, provider.__qualname__)
+                breaker = self._breakers[provider] = CircuitBreaker(
+                    f"news:{name}",
+                    failure_threshold=self.failure_threshold,
+                    cooldown=self.cooldown_seconds,
+                )
+            return breaker
+
+
+def _sentiment_score(value: Any) -> float:
+    if isinstance(value, (int, float)) and not isinstance(value, bool):
+        return float(value)
+    return float("nan")
+
 
 def _normalize_article(article: Any) -> Dict[str, Any]:
     if isinstance(article, dict):
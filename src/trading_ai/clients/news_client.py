@@ -5,18 +5,24 @@ from __future__ import annotations
 from datetime import datetime
 from typing import Any, Dict, Iterable
 
+import orjson
 import requests
 from loguru import logger
 
-from trading_ai.clients.base import APIClientError, BaseClient
+from trading_ai.clients.base import APIClientError, BaseClient, floor_minute
+from trading_ai.utils.ratelimit import shared_bucket
 from trading_ai.settings import Settings
 
 
 class NewsClient(BaseClient):
     """Simple REST client for generic news APIs (e.g., NewsAPI.org)."""
 
+    _warmup_url = "https://newsapi.org/"
+
     def __init__(self, settings: Settings) -> None:
         super().__init__("news")
+        # NewsAPI: about one request per second.
+        self._rate_limiter = shared_bucket("newsapi.org", rate=1.0, burst=1)
         self._api_key = settings.news_api_key
         if not self._api_key:
             logger.warning("News API key is not configured; news ingestion will be disabled.")
@@ -26,7 +32,14 @@ class NewsClient(BaseClient):
 
         if not self._api_key:
             raise APIClientError("News API key not configured")
+        # Minute-floored so repeated passes share a cache entry; at most a minute of extra lookback.
+        from_date = floor_minute(from_date)
+        return self._cached(
+            ("headlines", ticker, from_date, limit),
+            lambda: self._fetch_headlines(ticker, from_date, limit),
+        )
 
+    def _fetch_headlines(self, ticker: str, from_date: datetime | None, limit: int) -> Iterable[Dict[str, Any]]:
         params: Dict[str, Any] = {
             "q": ticker,
             "pageSize": limit,
@@ -38,13 +51,14 @@ class NewsClient(BaseClient):
             params["from"] = from_date.isoformat()
 
         try:
-            response = requests.get("https://newsapi.org/v2/everything", params=params, timeout=10)
-            response.raise_for_status()
+            response = self._request_with_retry(
+                lambda: self._http.get("https://newsapi.org/v2/everything", params=params, timeout=10)
+            )
         except requests.RequestException as exc:  # pragma: no cover - network failure path
             logger.exception("Failed to fetch news headlines", ticker=ticker)
             raise APIClientError(f"News API error: {exc}") from exc
 
-        data = response.json()
+        data = orjson.loads(response.content)
         articles = data.get("articles", [])
         self._log("Fetched news headlines", ticker=ticker, count=len(articles))
         return articles
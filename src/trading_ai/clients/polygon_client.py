@@ -3,14 +3,15 @@
 from __future__ import annotations
 
 from datetime import datetime
-from typing import Any, Iterable, Optional
+from operator import attrgetter, methodcaller
+from typing import Any, Iterable, List, Optional
 
 from urllib.parse import urlparse
 
 from loguru import logger
 from polygon import RESTClient
 
-from trading_ai.clients.base import APIClientError, BaseClient
+from trading_ai.clients.base import POOL_MAXSIZE, APIClientError, BaseClient, ceil_minute, floor_minute
 from trading_ai.settings import Settings
 from trading_ai.utils.dns import apply_dns_override
 
@@ -24,6 +25,12 @@ class PolygonClient(BaseClient):
             override_host = urlparse(settings.polygon_base_url).netloc or "api.polygon.io"
             apply_dns_override(override_host, settings.polygon_api_override_ip)
         self._client = RESTClient(api_key=settings.polygon_api_key, base=settings.polygon_base_url)
+        # urllib3 keeps a single connection per host by default; concurrent tickers need more.
+        self._client.client.connection_pool_kw["maxsize"] = POOL_MAXSIZE
+
+    def close(self) -> None:
+        super().close()
+        self._client.client.clear()
 
     def fetch_option_aggregates(
         self,
@@ -48,14 +55,7 @@ class PolygonClient(BaseClient):
         except Exception as exc:  # pragma: no cover - network failure path
             logger.exception("Failed to fetch Polygon aggregates", symbol=symbol)
             raise APIClientError(f"Polygon aggregate error: {exc}") from exc
-        payload = []
-        for agg in response:
-            if hasattr(agg, "model_dump"):
-                payload.append(agg.model_dump())
-            elif hasattr(agg, "__dict__"):
-                payload.append(agg.__dict__)
-            else:
-                payload.append(agg)
+        payload = _to_records(list(response))
         self._log("Fetched Polygon aggregates", symbol=symbol, count=len(payload))
         return payload
 
@@ -67,16 +67,27 @@ class PolygonClient(BaseClient):
     ) -> Iterable[Any]:
         """Fetch recent news articles for a ticker."""
 
+        # Minute-floored so repeated passes share a cache entry; at most a minute of extra lookback.
+        published_gte = floor_minute(published_gte)
+        return self._cached(
+            ("news", ticker, published_gte, limit),
+            lambda: self._fetch_reference_news(ticker, published_gte, limit),
+        )
+
+    def _fetch_reference_news(self, ticker: str, published_gte: Optional[datetime], limit: int) -> List[Any]:
         try:
-            response = self._client.list_ticker_news(
-                ticker=ticker,
-                published_utc=published_gte,
-                limit=limit,
+            # Materialise the SDK's lazy pager so the cached value can be replayed.
+            response = list(
+                self._client.list_ticker_news(
+                    ticker=ticker,
+                    published_utc=published_gte,
+                    limit=limit,
+                )
             )
         except Exception as exc:  # pragma: no cover - network failure path
             logger.exception("Failed to fetch Polygon news", ticker=ticker)
             raise APIClientError(f"Polygon news error: {exc}") from exc
-        self._log("Fetched Polygon news", ticker=ticker)
+        self._log("Fetched Polygon news", ticker=ticker, count=len(response))
         return response
 
     def fetch_option_contracts(
@@ -112,6 +123,21 @@ class PolygonClient(BaseClient):
     ) -> Iterable[Any]:
         """Fetch equity bars for underlying via Polygon."""
 
+        # Widened outward to whole minutes so repeated passes share a cache entry.
+        start, end = floor_minute(start), ceil_minute(end)
+        return self._cached(
+            ("equity_bars", ticker, start, end, timeframe, limit),
+            lambda: self._fetch_equity_bars(ticker, start, end, timeframe, limit),
+        )
+
+    def _fetch_equity_bars(
+        self,
+        ticker: str,
+        start: datetime,
+        end: datetime,
+        timeframe: str,
+        limit: int,
+    ) -> List[Any]:
         try:
             response = list(
                 self._client.list_aggs(
@@ -127,13 +153,23 @@ class PolygonClient(BaseClient):
         except Exception as exc:  # pragma: no cover
             logger.exception("Failed to fetch Polygon equity bars", ticker=ticker)
             raise APIClientError(f"Polygon equity bars error: {exc}") from exc
-        payload = []
-        for bar in response:
-            if hasattr(bar, "model_dump"):
-                payload.append(bar.model_dump())
-            elif hasattr(bar, "__dict__"):
-                payload.append(bar.__dict__)
-            else:
-                payload.append(bar)
+        payload = _to_records(response)
         self._log("Fetched Polygon equity bars", ticker=ticker)
         return payload
+
+
+def _to_records(items: List[Any]) -> List[Any]:
+    """Convert SDK models to plain records, picking the conversion once from the first item.
+
+    Polygon responses are homogeneous, so this avoids two reflective lookups per bar.
+    """
+
+    if not items:
+        return []
+    first = items[0]
+    # map() with C-level attrgetter/methodcaller keeps the per-bar work out of bytecode.
+    if hasattr(first, "model_dump"):
+        return list(map(methodcaller("model_dump"), items))
+    if hasattr(first, "__dict__"):
+        return list(map(attrgetter("__dict__"), items))
+    return list(items)
@@ -6,6 +6,7 @@ from datetime import datetime, timezone
 from typing import Any, Dict, Iterable, List
 
 import feedparser
+import requests
 from loguru import logger
 
 from trading_ai.clients.base import APIClientError, BaseClient
@@ -14,19 +15,17 @@ from trading_ai.clients.base import APIClientError, BaseClient
 class YahooNewsClient(BaseClient):
     """Fetches ticker-specific RSS feeds from Yahoo Finance."""
 
+    _warmup_url = "https://feeds.finance.yahoo.com/"
+
     def __init__(self) -> None:
         super().__init__("yahoo_rss")
 
     def fetch_headlines(self, ticker: str, *, since: datetime | None = None, limit: int = 50) -> List[Dict[str, Any]]:
-        feed_url = f"https://feeds.finance.yahoo.com/rss/2.0/headline?s={ticker}&region=US&lang=en-US"
-        try:
-            parsed = feedparser.parse(feed_url)
-        except Exception as exc:  # pragma: no cover - network path
-            logger.exception("Failed to fetch Yahoo RSS", ticker=ticker)
-            raise APIClientError(f"Yahoo RSS error: {exc}") from exc
+        # The feed is per ticker and filtered locally, so one cached fetch serves any since/limit.
+        feed_entries = self._response_cache.get_or_set(("feed", ticker), lambda: self._fetch_feed(ticker))
 
         entries = []
-        for entry in parsed.entries[:limit]:
+        for entry in feed_entries[:limit]:
             published = entry.get("published_parsed")
             published_dt = datetime(*published[:6], tzinfo=timezone.utc) if published else None
             if since and published_dt and published_dt < since:
@@ -43,3 +42,20 @@ class YahooNewsClient(BaseClient):
             )
         self._log("Fetched Yahoo headlines", ticker=ticker, count=len(entries))
         return entries
+
+    def _fetch_feed(self, ticker: str) -> List[Any]:
+        feed_url = f"https://feeds.finance.yahoo.com/rss/2.0/headline?s={ticker}&region=US&lang=en-US"
+        # Fetch through the pooled session and hand feedparser bytes, so it never does its own I/O.
+        try:
+            response = self._request_with_retry(lambda: self._http.get(feed_url, timeout=5))
+        except requests.RequestException as exc:  # pragma: no cover - network path
+            logger.exception("Failed to fetch Yahoo RSS", ticker=ticker)
+            raise APIClientError(f"Yahoo RSS error: {exc}") from exc
+        # Headlines are stored, never rendered, so skip the HTML sanitiser and URI rewriting passes.
+        parsed = feedparser.parse(
+            response.content,
+            response_headers={"content-type": response.headers.get("Content-Type", "")},
+            sanitize_html=False,
+            resolve_relative_uris=False,
+        )
+        return list(parsed.entries)
@@ -2,9 +2,12 @@
 
 from __future__ import annotations
 
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta, timezone
-from typing import Any, Dict, Iterable, List, Optional, Tuple
+from functools import cached_property
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
 
+import numpy as np
 import pandas as pd
 from loguru import logger
 
@@ -22,9 +25,36 @@ from trading_ai.data.cache import LocalDataCache
 from trading_ai.settings import Settings
 
 
+# Values _serialize_payload passes through unchanged.
+_SCALAR_TYPES = frozenset({str, int, float, bool, type(None)})
+
+# Collector timeframe strings mapped to bar spacing and to Polygon's aggregate timespan.
+_TIMEFRAME_STEPS = {
+    "1Min": timedelta(minutes=1),
+    "5Min": timedelta(minutes=5),
+    "15Min": timedelta(minutes=15),
+    "1Hour": timedelta(hours=1),
+    "1Day": timedelta(days=1),
+}
+_DEFAULT_TIMEFRAME_STEP = timedelta(minutes=1)
+_POLYGON_TIMESPANS = {
+    "1Min": "minute",
+    "5Min": "minute",
+    "15Min": "minute",
+    "1Hour": "hour",
+    "1Day": "day",
+}
+
+# Scratch column used to de-duplicate and order bars on a normalised timestamp.
+_BAR_TIME = "__bar_time"
+
+
 class MarketDataCollector:
     """Coordinates incremental data pulls across providers with local caching."""
 
+    # Upper bound on tickers collected concurrently by collect_market_snapshot.
+    max_workers = 32
+
     def __init__(
         self,
         settings: Settings,
@@ -42,8 +72,18 @@ class MarketDataCollector:
         self.enable_news = settings.enable_news
         self.use_polygon_bars = settings.use_polygon_bars
 
-        base_news_client = news_client or (NewsClient(settings) if settings.news_api_key else None)
-        yahoo_client = YahooNewsClient()
+        self._news_client = news_client
+        if aggregator is not None:
+            self.aggregator = aggregator
+
+    @cached_property
+    def aggregator(self) -> NewsAggregator:
+        """News providers, built on first use; empty when news is disabled."""
+
+        if not self.enable_news:
+            return NewsAggregator()
+        settings = self.settings
+        base_news_client = self._news_client or (NewsClient(settings) if settings.news_api_key else None)
         alpha_client = (
             AlphaVantageNewsClient(settings.alpha_vantage_api_key)
             if settings.alpha_vantage_api_key
@@ -54,26 +94,47 @@ class MarketDataCollector:
             if settings.marketaux_api_key
             else None
         )
-        self.aggregator = aggregator or NewsAggregator(
+        return NewsAggregator(
             polygon_client=self.polygon,
             news_api_client=base_news_client,
-            yahoo_client=yahoo_client,
+            yahoo_client=YahooNewsClient(),
             alpha_client=alpha_client,
             marketaux_client=marketaux_client,
         )
 
+    def warmup(self) -> None:
+        """Pre-open provider connections so the first snapshot skips DNS/TLS setup."""
+
+        if self.enable_news:
+            self.aggregator.warmup()
+
+    def close(self) -> None:
+        """Release pooled provider connections."""
+
+        self.alpaca.close()
+        self.polygon.close()
+        if "aggregator" in self.__dict__:  # never built means nothing to release
+            self.aggregator.close()
+
+    def __enter__(self) -> "MarketDataCollector":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+
     # --------------------------------------------------------------------- helpers
 
     def _frame_from_payload(self, payload: Any) -> pd.DataFrame:
         if payload is None:
             return pd.DataFrame()
+        # Frames pass through uncopied: nothing downstream mutates bars in place.
         if isinstance(payload, pd.DataFrame):
-            return payload.copy()
+            return payload
         if hasattr(payload, "df"):
             frame = getattr(payload, "df")
             if hasattr(frame, "reset_index"):
                 frame = frame.reset_index()
-            return pd.DataFrame(frame)
+            return frame if isinstance(frame, pd.DataFrame) else pd.DataFrame(frame)
         if isinstance(payload, list):
             return pd.DataFrame(payload)
         if isinstance(payload, dict):
@@ -81,8 +142,20 @@ class MarketDataCollector:
         return pd.DataFrame()
 
     def _serialize_payload(self, payload: Any) -> Any:
-        if payload is None:
-            return None
+        # Exact-type dispatch first: chain payloads are mostly plain dicts, lists, and scalars.
+        kind = type(payload)
+        if kind in _SCALAR_TYPES:
+            return payload
+        if kind is dict:
+            serialize = self._serialize_payload
+            return {
+                key: value if type(value) in _SCALAR_TYPES else serialize(value)
+                for key, value in payload.items()
+            }
+        if kind is list:
+            serialize = self._serialize_payload
+            return [item if type(item) in _SCALAR_TYPES else serialize(item) for item in payload]
+        # Subclasses of the exact types above (str/int enums, OrderedDict, ...) land here.
         if isinstance(payload, (str, int, float, bool)):
             return payload
         if isinstance(payload, list):
@@ -107,13 +180,67 @@ class MarketDataCollector:
         end: datetime,
         timeframe: str = "1Min",
         use_cache: bool = True,
+        prefetched: Optional[pd.DataFrame] = None,
+        prefetched_trade: Optional[pd.DataFrame] = None,
     ) -> pd.DataFrame:
-        duration_key = f"{int((end - start).total_seconds())}s"
-        end_bucket = end.strftime("%Y%m%d")
-        cache_key = ("alpaca", "bars", ticker, timeframe, duration_key, end_bucket)
-        if use_cache and self.cache.exists(*cache_key):
-            return self.cache.read_dataframe(*cache_key)
+        """Bars for ``ticker`` over ``[start, end]``, topped up incrementally from the bar store.
+
+        The store keeps one frame per ticker/timeframe plus the window it covers, so a warm call
+        only fetches bars since the last stored one. ``prefetched``/``prefetched_trade`` stand in
+        for Alpaca calls that were already batched across tickers.
+        """
+
+        store_key = _bars_store_key(ticker, timeframe)
+        stored = pd.DataFrame()
+        fetch_start = start
+        if use_cache:
+            resume = _bar_resume_point(self._bar_coverage(store_key), start)
+            if resume is not None:
+                stored = self._read_bar_window(store_key, start)
+            if not stored.empty:
+                step = _timeframe_step(timeframe)
+                if _utc(end) - _utc(resume) < step:
+                    return stored
+                # Re-fetch the last stored bar too; it may have still been forming.
+                fetch_start = max(start, resume - step)
+
+        frame = self._fetch_bar_frame(
+            ticker,
+            start=fetch_start,
+            end=end,
+            timeframe=timeframe,
+            prefetched=prefetched,
+        )
+        if not stored.empty and _switched_provider(stored, frame):
+            # Stored bars came from the other provider and cannot be merged with this tail;
+            # refetch the whole window so this call does not return only the resumed bars.
+            refetched = self._fetch_bar_frame(ticker, start=start, end=end, timeframe=timeframe)
+            if not refetched.empty:
+                frame, fetch_start = refetched, start
+        if use_cache and (not stored.empty or not frame.empty):
+            frame = self._update_bar_store(
+                store_key,
+                stored,
+                frame,
+                start=start,
+                fetch_start=fetch_start,
+                end=end,
+            )
+        if frame.empty and prefetched_trade is not None:
+            frame = prefetched_trade
+        elif frame.empty:
+            frame = self._frame_from_latest_trade(ticker)
+        return frame
 
+    def _fetch_bar_frame(
+        self,
+        ticker: str,
+        *,
+        start: datetime,
+        end: datetime,
+        timeframe: str,
+        prefetched: Optional[pd.DataFrame] = None,
+    ) -> pd.DataFrame:
         frame = pd.DataFrame()
         if self.use_polygon_bars:
             try:
@@ -134,7 +261,9 @@ class MarketDataCollector:
                 # Avoid hammering Polygon with repeated unauthorized requests in the same run.
                 self.use_polygon_bars = False
 
-        if frame.empty:
+        if frame.empty and prefetched is not None:
+            frame = prefetched
+        elif frame.empty:
             try:
                 alpaca_bars = self.alpaca.fetch_underlying_bars(symbol=ticker, start=start, end=end, timeframe=timeframe)
                 frame = self._frame_from_payload(alpaca_bars)
@@ -154,15 +283,138 @@ class MarketDataCollector:
                 logger.info("Polygon fallback delivered equity bars", ticker=ticker)
             except APIClientError:
                 logger.warning("Polygon fallback failed", ticker=ticker)
-        if frame.empty:
-            frame = self._frame_from_latest_trade(ticker)
-        if not frame.empty:
-            try:
-                self.cache.write_dataframe(frame, *cache_key)
-            except ValueError:
-                logger.debug("Skipping cache write for empty frame", ticker=ticker)
         return frame
 
+    def _bar_coverage(self, store_key: Tuple[str, ...]) -> Optional[Tuple[datetime, datetime]]:
+        """Window ``[start, end]`` the stored bars were fetched for, if the store exists."""
+
+        coverage = self.cache.try_read_json(*store_key)
+        if coverage is None or not self.cache.exists(*store_key, suffix=".parquet"):
+            return None
+        try:
+            return datetime.fromisoformat(coverage["start"]), datetime.fromisoformat(coverage["end"])
+        except (KeyError, TypeError, ValueError):
+            return None
+
+    def _read_bar_window(self, store_key: Tuple[str, ...], start: datetime) -> pd.DataFrame:
+        frame = self.cache.read_dataframe(*store_key)
+        if frame.empty or "timestamp" not in frame.columns:
+            return pd.DataFrame()
+        return frame.loc[(_bar_times(frame) >= _utc(start)).to_numpy()].reset_index(drop=True)
+
+    def _update_bar_store(
+        self,
+        store_key: Tuple[str, ...],
+        stored: pd.DataFrame,
+        fetched: pd.DataFrame,
+        *,
+        start: datetime,
+        fetch_start: datetime,
+        end: datetime,
+    ) -> pd.DataFrame:
+        """Merge ``fetched`` into the stored window, persist it, and return the merged bars."""
+
+        if fetched.empty:
+            # Likely an outage: keep the stored window and its coverage so the gap is refetched.
+            return stored
+        if "timestamp" not in fetched.columns:
+            return fetched  # nothing to key increments on; serve it uncached
+        if stored.empty:
+            combined = fetched
+        elif _switched_provider(stored, fetched):
+            # Restart the store from this fetch alone (the full window unless its refetch failed).
+            combined = fetched
+            start = fetch_start
+        else:
+            combined = pd.concat([stored, fetched], ignore_index=True)
+        times = _bar_times(combined)
+        if not _epoch_timestamps(combined):
+            # Stored and fetched datetimes may differ in unit or zone name; unify them.
+            combined = combined.assign(timestamp=times)
+        combined = (
+            combined.assign(**{_BAR_TIME: times})
+            .drop_duplicates(_BAR_TIME, keep="last")
+            .sort_values(_BAR_TIME, kind="stable")
+            .drop(columns=_BAR_TIME)
+            .reset_index(drop=True)
+        )
+        self.cache.write_dataframe(combined, *store_key)
+        self.cache.write_json({"start": start.isoformat(), "end": end.isoformat()}, *store_key)
+        return combined
+
+    def _prefetch_alpaca_bars(
+        self,
+        tickers: List[str],
+        *,
+        start: datetime,
+        end: datetime,
+        timeframe: str,
+        use_cache: bool,
+    ) -> Dict[str, pd.DataFrame]:
+        """Batch the Alpaca bar requests for tickers needing new bars into as few calls as possible.
+
+        The batch starts at the earliest point any of those tickers has to resume from.
+        """
+
+        if self.use_polygon_bars or len(tickers) < 2:
+            return {}
+        step = _timeframe_step(timeframe)
+        fetch_starts: Dict[str, datetime] = {}
+        for ticker in tickers:
+            if not use_cache:
+                fetch_starts[ticker] = start
+                continue
+            resume = _bar_resume_point(self._bar_coverage(_bars_store_key(ticker, timeframe)), start)
+            if resume is None:
+                fetch_starts[ticker] = start
+            elif _utc(end) - _utc(resume) >= step:
+                fetch_starts[ticker] = max(start, resume - step)
+        if len(fetch_starts) < 2:
+            return {}
+        pending = list(fetch_starts)
+        try:
+            return self.alpaca.fetch_underlying_bars_batch(
+                pending,
+                start=min(fetch_starts.values()),
+                end=end,
+                timeframe=timeframe,
+            )
+        except APIClientError:
+            logger.warning("Batched Alpaca equity bars unavailable; fetching per ticker", count=len(pending))
+            return {}
+
+    def _prefetch_latest_trades(
+        self,
+        prefetched_bars: Dict[str, pd.DataFrame],
+        *,
+        start: datetime,
+        timeframe: str,
+        use_cache: bool,
+    ) -> Dict[str, pd.DataFrame]:
+        """Batch the latest-trade fallback for tickers with no bars fetched or stored."""
+
+        missing = [
+            ticker
+            for ticker, frame in prefetched_bars.items()
+            if frame.empty
+            and not (
+                use_cache
+                and _bar_resume_point(self._bar_coverage(_bars_store_key(ticker, timeframe)), start)
+            )
+        ]
+        if len(missing) < 2:
+            return {}
+        try:
+            trades = self.alpaca.fetch_latest_trades(missing)
+        except APIClientError:
+            logger.warning("Batched latest trades unavailable; fetching per ticker", count=len(missing))
+            return {}
+        return {
+            ticker: _frame_from_trade_payload(_normalize_trade_payload(trades[ticker]))
+            for ticker in missing
+            if ticker in trades
+        }
+
     def collect_option_chain(
         self,
         ticker: str,
@@ -171,8 +423,9 @@ class MarketDataCollector:
         use_cache: bool = True,
     ) -> Any:
         cache_key = ("alpaca", "option-chain", ticker, expiration.isoformat() if expiration else "any")
-        if use_cache and self.cache.exists(*cache_key, suffix=".json"):
-            return self.cache.read_json(*cache_key)
+        cached = self.cache.try_read_json(*cache_key) if use_cache else None
+        if cached is not None:
+            return cached
 
         chain = self.alpaca.fetch_option_chain(symbol=ticker, expiration=expiration)
         serialized = self._serialize_payload(chain)
@@ -187,8 +440,9 @@ class MarketDataCollector:
         use_cache: bool = True,
     ) -> Dict[str, Any]:
         cache_key = ("polygon", "option-metrics", ticker, datetime.utcnow().date().isoformat())
-        if use_cache and self.cache.exists(*cache_key, suffix=".json"):
-            return self.cache.read_json(*cache_key)
+        cached = self.cache.try_read_json(*cache_key) if use_cache else None
+        if cached is not None:
+            return cached
 
         try:
             contracts = self.polygon.fetch_option_contracts(
@@ -226,13 +480,14 @@ class MarketDataCollector:
         option_chain: Any | None = None,
         bars: pd.DataFrame | None = None,
         use_cache: bool = False,
+        now: Optional[datetime] = None,
     ) -> Dict[str, Any]:
         """Derive representative call/put quotes from the option chain payload."""
 
         if option_chain is None:
             logger.debug("Skipping option quote fetch; option chain missing", ticker=ticker)
             return {}
-        quotes = self._select_reference_quotes(option_chain, bars)
+        quotes = self._select_reference_quotes(option_chain, bars, now=now)
         if use_cache and quotes:
             cache_key = ("alpaca", "option-quote", ticker)
             self.cache.write_json(quotes, *cache_key)
@@ -260,8 +515,9 @@ class MarketDataCollector:
             if not symbol.startswith("O:"):
                 symbol = f"O:{symbol}"
             cache_key = ("polygon", "option-aggs", symbol, timeframe, now_bucket)
-            if use_cache and self.cache.exists(*cache_key, suffix=".json"):
-                aggregates[leg] = self.cache.read_json(*cache_key)
+            cached = self.cache.try_read_json(*cache_key) if use_cache else None
+            if cached is not None:
+                aggregates[leg] = cached
                 continue
             try:
                 payload = list(
@@ -300,8 +556,8 @@ class MarketDataCollector:
             return []
 
         cache_key = ("news", ticker, since.date().isoformat(), str(limit))
-        if use_cache and self.cache.exists(*cache_key, suffix=".json"):
-            cached = self.cache.read_json(*cache_key)
+        cached = self.cache.try_read_json(*cache_key) if use_cache else None
+        if cached is not None:
             return list(cached)
 
         stories = self.aggregator.gather(ticker, since=since, limit=limit)
@@ -315,16 +571,17 @@ class MarketDataCollector:
         self,
         option_chain: Any,
         bars: pd.DataFrame | None = None,
+        *,
+        now: Optional[datetime] = None,
     ) -> Dict[str, Dict[str, Any]]:
-        """Pick representative call/put contracts near the underlying price."""
+        """Pick representative call/put contracts near the underlying price as of ``now``."""
 
-        def iter_contracts(chain: Any) -> Iterable[Dict[str, Any]]:
-            if isinstance(chain, dict):
-                yield from chain.values()
-            elif isinstance(chain, list):
-                yield from chain
-            else:
-                return
+        if isinstance(option_chain, dict):
+            contracts: Iterable[Dict[str, Any]] = option_chain.values()
+        elif isinstance(option_chain, list):
+            contracts = option_chain
+        else:
+            return {}
 
         price = None
         if isinstance(bars, pd.DataFrame) and not bars.empty and "close" in bars:
@@ -332,41 +589,56 @@ class MarketDataCollector:
                 price = float(bars["close"].astype(float).iloc[-1])
             except (ValueError, TypeError):
                 price = None
-        now = datetime.utcnow().replace(tzinfo=timezone.utc)
-        best: Dict[str, Tuple[Tuple[float, float, float], Dict[str, Any]]] = {}
-        for contract in iter_contracts(option_chain):
-            symbol = str(contract.get("symbol") or "")
-            expiration, option_type, strike = _parse_option_symbol(symbol)
-            if option_type not in {"CALL", "PUT"} or expiration is None or strike is None:
-                continue
+
+        # Pull the raw fields in one pass, then parse and score the whole chain as arrays.
+        symbols: List[str] = []
+        bids: List[Optional[float]] = []
+        asks: List[Optional[float]] = []
+        for contract in contracts:
             quote = contract.get("latest_quote") or {}
-            bid = _sanitize_quote_value(quote.get("bid_price") or quote.get("bid"))
-            ask = _sanitize_quote_value(quote.get("ask_price") or quote.get("ask"))
-            if ask is None or ask <= 0:
-                continue
-            if bid is None or bid < 0:
-                bid = 0.0
-            mid = (bid + ask) / 2 if bid else ask
-            exp_dt = expiration if expiration.tzinfo else expiration.replace(tzinfo=timezone.utc)
-            days_to_exp = max((exp_dt - now).total_seconds() / 86400.0, 0.0)
-            price_diff = abs(strike - price) if price is not None else 0.0
-            score = (price_diff, days_to_exp, -bid)
-            payload = {
-                "symbol": symbol,
+            symbols.append(str(contract.get("symbol") or ""))
+            bids.append(_sanitize_quote_value(quote.get("bid_price") or quote.get("bid")))
+            asks.append(_sanitize_quote_value(quote.get("ask_price") or quote.get("ask")))
+        if not symbols:
+            return {}
+
+        expiration, type_code, strike = _parse_occ_symbols(symbols)
+        ask = np.array(asks, dtype=float)
+        bid = np.array(bids, dtype=float)
+        bid = np.where(np.isnan(bid) | (bid < 0), 0.0, bid)
+        valid = ~np.isnat(expiration) & (ask > 0)
+        # OCC expirations are naive UTC dates, so compare against a naive UTC "now".
+        as_of = np.datetime64(_utc(now or datetime.now(timezone.utc)).tz_localize(None), "us")
+        days_to_exp = np.maximum((expiration - as_of) / np.timedelta64(1, "s") / 86400.0, 0.0)
+        price_diff = np.abs(strike - price) if price is not None else np.zeros(len(strike))
+
+        best: List[Tuple[int, int, str]] = []
+        for code, option_type in (("C", "CALL"), ("P", "PUT")):
+            rows = np.flatnonzero(valid & (type_code == code))
+            if rows.size:
+                # Lexicographic (price_diff, days_to_exp, -bid); the row index keeps the first on ties.
+                order = np.lexsort((rows, -bid[rows], days_to_exp[rows], price_diff[rows]))
+                best.append((int(rows[0]), int(rows[order[0]]), option_type))
+
+        selected: Dict[str, Dict[str, Any]] = {}
+        # Emit types in the order they first appear in the chain.
+        for _, row, option_type in sorted(best):
+            row_bid = float(bid[row])
+            row_ask = float(ask[row])
+            payload: Dict[str, Any] = {
+                "symbol": symbols[row],
                 "option_type": option_type,
-                "strike": strike,
-                "expiration": expiration.isoformat(),
-                "bid": bid,
-                "ask": ask,
-                "mid": mid,
+                "strike": float(strike[row]),
+                "expiration": pd.Timestamp(expiration[row]).to_pydatetime().isoformat(),
+                "bid": row_bid,
+                "ask": row_ask,
+                "mid": (row_bid + row_ask) / 2 if row_bid else row_ask,
                 "source": "alpaca",
             }
             if price is not None:
                 payload["underlying_price"] = price
-            current = best.get(option_type)
-            if current is None or score < current[0]:
-                best[option_type] = (score, payload)
-        return {opt_type: payload for opt_type, (_, payload) in best.items()}
+            selected[option_type] = payload
+        return selected
 
     def _frame_from_latest_trade(self, ticker: str) -> pd.DataFrame:
         try:
@@ -391,63 +663,161 @@ class MarketDataCollector:
         timeframe: str = "1Min",
         use_cache: bool = True,
         include_news: bool = True,
+        features: Optional[Callable[[pd.DataFrame], Any]] = None,
     ) -> Dict[str, Dict[str, Any]]:
-        now = datetime.utcnow().replace(tzinfo=timezone.utc)
+        """Collect each ticker's snapshot; ``features``, if given, runs on the bars as they arrive
+        and its result is stored under ``"features"``."""
+
+        now = datetime.now(timezone.utc)
         bar_start = now - lookback
         news_since = now - news_lookback
-        snapshot: Dict[str, Dict[str, Any]] = {}
         ticker_list = list(tickers or self.settings.target_tickers)
+        if include_news:
+            _ = self.aggregator  # build it here once rather than racing to in the worker threads
+        prefetched_bars = self._prefetch_alpaca_bars(
+            ticker_list,
+            start=bar_start,
+            end=now,
+            timeframe=timeframe,
+            use_cache=use_cache,
+        )
+        prefetched_trades = self._prefetch_latest_trades(
+            prefetched_bars,
+            start=bar_start,
+            timeframe=timeframe,
+            use_cache=use_cache,
+        )
 
-        for ticker in ticker_list:
-            logger.info("Collecting market snapshot", ticker=ticker)
-            bars = self.collect_underlying_bars(
+        def collect(ticker: str) -> Dict[str, Any]:
+            return self._collect_ticker(
                 ticker,
+                now=now,
+                bar_start=bar_start,
+                news_since=news_since,
+                timeframe=timeframe,
+                use_cache=use_cache,
+                include_news=include_news,
+                prefetched_bars=prefetched_bars.get(ticker),
+                prefetched_trade=prefetched_trades.get(ticker),
+                features=features,
+            )
+
+        if len(ticker_list) <= 1:
+            results = [collect(ticker) for ticker in ticker_list]
+        else:
+            # Each ticker is a chain of blocking HTTP calls writing to distinct cache keys, so
+            # tickers overlap their network waits; map() keeps the snapshot in ticker order.
+            workers = min(self.max_workers, len(ticker_list))
+            with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="collector") as executor:
+                results = list(executor.map(collect, ticker_list))
+        return dict(zip(ticker_list, results))
+
+    def _collect_ticker(
+        self,
+        ticker: str,
+        *,
+        now: datetime,
+        bar_start: datetime,
+        news_since: datetime,
+        timeframe: str,
+        use_cache: bool,
+        include_news: bool,
+        prefetched_bars: Optional[pd.DataFrame],
+        prefetched_trade: Optional[pd.DataFrame] = None,
+        features: Optional[Callable[[pd.DataFrame], Any]] = None,
+    ) -> Dict[str, Any]:
+        logger.info("Collecting market snapshot", ticker=ticker)
+        bars = self.collect_underlying_bars(
+            ticker,
+            start=bar_start,
+            end=now,
+            timeframe=timeframe,
+            use_cache=use_cache,
+            prefetched=prefetched_bars,
+            prefetched_trade=prefetched_trade,
+        )
+        # Computed while the bars are hot, on this ticker's worker thread.
+        bar_features = features(bars) if features is not None else None
+        option_chain = self.collect_option_chain(ticker, use_cache=use_cache)
+        option_metrics = self.collect_option_metrics(ticker, use_cache=use_cache)
+        option_quote = self.collect_option_quote(
+            ticker,
+            option_chain=option_chain,
+            bars=bars,
+            now=now,
+        )
+        option_aggs: Dict[str, Any] = {}
+        if option_quote:
+            option_aggs = self.collect_option_aggregates(
+                option_quote=option_quote,
                 start=bar_start,
                 end=now,
                 timeframe=timeframe,
                 use_cache=use_cache,
             )
-            option_chain = self.collect_option_chain(ticker, use_cache=use_cache)
-            option_metrics = self.collect_option_metrics(ticker, use_cache=use_cache)
-            option_quote = self.collect_option_quote(
-                ticker,
-                option_chain=option_chain,
-                bars=bars,
-            )
-            option_aggs: Dict[str, Any] = {}
-            if option_quote:
-                option_aggs = self.collect_option_aggregates(
-                    option_quote=option_quote,
-                    start=bar_start,
-                    end=now,
-                    timeframe=timeframe,
-                    use_cache=use_cache,
-                )
-            news_items: List[Dict[str, Any]] = []
-            if include_news:
-                news_items = self.collect_news(ticker, since=news_since, use_cache=use_cache)
-
-            snapshot[ticker] = {
-                "collected_at": now.isoformat(),
-                "underlying_bars": bars,
-                "option_chain": option_chain,
-                "option_metrics": option_metrics,
-                "option_quote": option_quote,
-                "option_aggregates": option_aggs,
-                "news": news_items,
-            }
+        news_items: List[Dict[str, Any]] = []
+        if include_news:
+            news_items = self.collect_news(ticker, since=news_since, use_cache=use_cache)
+
+        snapshot = {
+            "collected_at": now.isoformat(),
+            "underlying_bars": bars,
+            "option_chain": option_chain,
+            "option_metrics": option_metrics,
+            "option_quote": option_quote,
+            "option_aggregates": option_aggs,
+            "news": news_items,
+        }
+        if features is not None:
+            snapshot["features"] = bar_features
         return snapshot
 
 
+def _bars_store_key(ticker: str, timeframe: str) -> Tuple[str, ...]:
+    return ("bars", ticker, timeframe)
+
+
+def _bar_resume_point(coverage: Optional[Tuple[datetime, datetime]], start: datetime) -> Optional[datetime]:
+    """End of the stored window if it reaches back to ``start`` without a gap, else None."""
+
+    if coverage is None:
+        return None
+    covered_from, covered_to = coverage
+    if _utc(covered_from) <= _utc(start) <= _utc(covered_to):
+        return covered_to
+    return None
+
+
+def _epoch_timestamps(frame: pd.DataFrame) -> bool:
+    # Polygon aggregates carry epoch milliseconds; Alpaca bars carry datetimes.
+    return pd.api.types.is_numeric_dtype(frame["timestamp"])
+
+
+def _switched_provider(stored: pd.DataFrame, fetched: pd.DataFrame) -> bool:
+    """True when ``fetched`` keys its bars differently from the non-empty ``stored`` frame."""
+
+    if fetched.empty or "timestamp" not in fetched.columns:
+        return False
+    return _epoch_timestamps(stored) != _epoch_timestamps(fetched)
+
+
+def _bar_times(frame: pd.DataFrame) -> pd.Series:
+    if _epoch_timestamps(frame):
+        return pd.to_datetime(frame["timestamp"], unit="ms", utc=True)
+    return pd.to_datetime(frame["timestamp"], utc=True)
+
+
+def _utc(value: datetime) -> pd.Timestamp:
+    stamp = pd.Timestamp(value)
+    return stamp.tz_localize("UTC") if stamp.tzinfo is None else stamp.tz_convert("UTC")
+
+
+def _timeframe_step(timeframe: str) -> timedelta:
+    return _TIMEFRAME_STEPS.get(timeframe, _DEFAULT_TIMEFRAME_STEP)
+
+
 def _polygon_timespan(timeframe: str) -> str:
-    mapping = {
-        "1Min": "minute",
-        "5Min": "minute",
-        "15Min": "minute",
-        "1Hour": "hour",
-        "1Day": "day",
-    }
-    return mapping.get(timeframe, "minute")
+    return _POLYGON_TIMESPANS.get(timeframe, "minute")
 
 
 def _normalize_trade_payload(trade_resp: Any) -> Dict[str, Any]:
@@ -501,21 +871,39 @@ def _frame_from_trade_payload(payload: Dict[str, Any]) -> pd.DataFrame:
     )
 
 
-def _parse_option_symbol(symbol: str) -> Tuple[Optional[datetime], Optional[str], Optional[float]]:
-    """Return expiration, option_type, strike from OCC-style symbols."""
-
-    if len(symbol) < 15:
-        return None, None, None
-    try:
-        date_part = symbol[-15:-9]
-        option_type_code = symbol[-9:-8].upper()
-        strike_part = symbol[-8:]
-        expiration = datetime.strptime(date_part, "%y%m%d")
-        option_type = "CALL" if option_type_code == "C" else "PUT" if option_type_code == "P" else None
-        strike = int(strike_part) / 1000.0
-    except (ValueError, TypeError):
-        return None, None, None
-    return expiration, option_type, strike
+def _parse_occ_symbols(symbols: List[str]) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Parse the OCC tail (``YYMMDD`` + ``C``/``P`` + 8-digit strike) of many symbols at once.
+
+    Returns ``(expiration, type_code, strike)``: ``datetime64[us]`` (NaT when the symbol does not
+    parse), ``"C"``/``"P"`` codes (``""`` when invalid), and strikes (NaN when invalid).
+    """
+
+    count = len(symbols)
+    raw = np.array(symbols, dtype=np.str_).reshape(count)
+    width = max(raw.dtype.itemsize // 4, 15)
+    # Right-align so the tail sits in the last 15 code points of every row, whatever the root.
+    tail = np.char.rjust(raw, width).view(np.uint32).reshape(count, width)[:, -15:].astype(np.int64)
+
+    digits = tail - ord("0")
+    date_digits, strike_digits = digits[:, :6], digits[:, 7:]
+    numeric = ((date_digits >= 0) & (date_digits <= 9)).all(axis=1)
+    numeric &= ((strike_digits >= 0) & (strike_digits <= 9)).all(axis=1)
+    letter = tail[:, 6] & ~0x20  # ASCII upper-case
+    is_call, is_put = letter == ord("C"), letter == ord("P")
+
+    yy = date_digits[:, 0] * 10 + date_digits[:, 1]
+    month = date_digits[:, 2] * 10 + date_digits[:, 3]
+    day = date_digits[:, 4] * 10 + date_digits[:, 5]
+    year = np.where(yy < 69, 2000 + yy, 1900 + yy)  # strptime's %y pivot
+    month_start = ((year - 1970) * 12 + month - 1).astype("datetime64[M]")
+    date = month_start.astype("datetime64[D]") + (day - 1)
+    in_month = (month >= 1) & (month <= 12) & (day >= 1) & (date < month_start + 1)
+    valid = numeric & in_month & (is_call | is_put)
+
+    expiration = np.where(valid, date.astype("datetime64[us]"), np.datetime64("NaT", "us"))
+    type_code = np.where(valid & is_call, "C", np.where(valid & is_put, "P", ""))
+    strike = np.where(valid, strike_digits @ (10 ** np.arange(7, -1, -1)) / 1000.0, np.nan)
+    return expiration, type_code, strike
 
 
 def _sanitize_quote_value(value: Any) -> Optional[float]:
@@ -17,6 +17,16 @@ class SignalPipeline:
         self.settings = settings
         self.collector = collector or MarketDataCollector(settings)
 
+    def warmup(self) -> None:
+        """Pre-open provider connections; call once at service start-up."""
+
+        self.collector.warmup()
+
+    def close(self) -> None:
+        """Release the collector's provider connections."""
+
+        self.collector.close()
+
     def collect_market_snapshot(
         self,
         tickers: Optional[Iterable[str]] = None,
@@ -29,14 +39,12 @@ class SignalPipeline:
     ) -> Dict[str, Any]:
         """Collect underlying bars, option chains, quotes, and news for target tickers."""
 
-        snapshot = self.collector.collect_market_snapshot(
+        return self.collector.collect_market_snapshot(
             tickers=tickers,
             lookback=lookback,
             news_lookback=news_lookback,
             timeframe=timeframe,
             use_cache=use_cache,
             include_news=include_news,
+            features=compute_intraday_features,
         )
-        for ticker, data in snapshot.items():
-            data["features"] = compute_intraday_features(data["underlying_bars"])
-        return snapshot
@@ -2,37 +2,57 @@
 
 from __future__ import annotations
 
+import hashlib
+import os
+import threading
+from functools import lru_cache
 from pathlib import Path
-from typing import Any, Iterable
+from typing import Any, Callable, Dict, Iterable, Tuple
 
+import duckdb
 import orjson
 import pandas as pd
 
+from trading_ai.utils.ttl import TTLCache
+
+_MISSING = object()
 
-class LocalDataCache:
-    """Lightweight cache that writes JSON blobs under a root folder."""
 
-    def __init__(self, root: str | Path = Path("data/cache")) -> None:
+class LocalDataCache:
+    """Lightweight cache that writes JSON blobs and Parquet frames under a root folder.
+
+    Reads are memoised in process for ``memory_ttl`` seconds (0 disables this), so repeated
+    pipeline ticks skip the disk and the decode. Memoised JSON payloads are shared between
+    callers and must be treated as read-only.
+    """
+
+    def __init__(
+        self,
+        root: str | Path = Path("data/cache"),
+        *,
+        memory_ttl: float = 60.0,
+        memory_size: int = 256,
+    ) -> None:
         self.root = Path(root)
         self.root.mkdir(parents=True, exist_ok=True)
-
-    def _sanitize(self, part: str) -> str:
-        return part.replace("/", "_").replace(":", "-")
+        self._memory = TTLCache(memory_size, memory_ttl) if memory_ttl > 0 else None
+        self._written: Dict[str, bytes] = {}
 
     def _build_path(self, *parts: str, suffix: str) -> Path:
-        safe_parts = [self._sanitize(part) for part in parts if part]
-        path = self.root.joinpath(*safe_parts)
-        return path.with_suffix(suffix)
+        return _cache_path(self.root, parts, suffix)
 
     def exists(self, *parts: str, suffix: str = ".json") -> bool:
         """Return True if a cached artifact exists."""
 
-        return self._build_path(*parts, suffix=suffix).exists()
+        path = self._build_path(*parts, suffix=suffix)
+        return self._remembers(path) or path.exists()
 
     def remove(self, *parts: str, suffix: str = ".json") -> None:
         """Remove a cached artifact if it exists."""
 
         path = self._build_path(*parts, suffix=suffix)
+        self._forget(path)
+        self._written.pop(str(path), None)
         if path.exists():
             path.unlink()
 
@@ -40,28 +60,73 @@ class LocalDataCache:
 
     def read_json(self, *parts: str) -> Any:
         path = self._build_path(*parts, suffix=".json")
-        with path.open("rb") as f:
-            return orjson.loads(f.read())
+        return self._remember(path, lambda: _load_json(path))
+
+    def try_read_json(self, *parts: str) -> Any:
+        """Return the cached payload, or None if absent; one open() instead of stat + open."""
+
+        path = self._build_path(*parts, suffix=".json")
+        try:
+            return self._remember(path, lambda: _load_json(path))
+        except FileNotFoundError:
+            return None
 
     def write_json(self, data: Any, *parts: str) -> Path:
         path = self._build_path(*parts, suffix=".json")
         path.parent.mkdir(parents=True, exist_ok=True)
-        payload = orjson.dumps(data, option=orjson.OPT_INDENT_2, default=str)
-        with path.open("wb") as f:
-            f.write(payload)
+        # Machine-read only, so no indentation; one unbuffered write skips the file-object layer.
+        payload = orjson.dumps(data, default=str)
+        digest = hashlib.blake2b(payload, digest_size=8).digest()
+        key = str(path)
+        if self._written.get(key) == digest and path.exists():
+            return path  # identical to what this process last wrote; skip the disk churn
+        staging = _staging_path(path)
+        fd = os.open(staging, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+        try:
+            view = memoryview(payload)
+            while view:
+                view = view[os.write(fd, view) :]
+        finally:
+            os.close(fd)
+        os.replace(staging, path)
+        self._written[key] = digest
+        self._forget(path)
         return path
 
     # Parquet helpers --------------------------------------------------------------
 
     def read_dataframe(self, *parts: str) -> pd.DataFrame:
-        payload = self.read_json(*parts)
-        return pd.DataFrame(payload)
+        path = self._build_path(*parts, suffix=".parquet")
+        # Shallow copy: callers may add or drop columns without touching the memoised frame.
+        return self._remember(path, lambda: _load_parquet(path)).copy(deep=False)
 
     def write_dataframe(self, frame: pd.DataFrame, *parts: str) -> Path:
         if frame.empty:
             raise ValueError("Cannot cache empty DataFrame")
-        records = frame.to_dict(orient="records")
-        return self.write_json(records, *parts)
+        path = self._build_path(*parts, suffix=".parquet")
+        path.parent.mkdir(parents=True, exist_ok=True)
+        staging = _staging_path(path)
+        target = str(staging).replace("'", "''")
+        with duckdb.connect() as conn:
+            conn.register("cached_frame", frame)
+            conn.execute(f"COPY cached_frame TO '{target}' (FORMAT parquet, COMPRESSION zstd)")
+        os.replace(staging, path)
+        self._forget(path)
+        return path
+
+    # Memoisation ------------------------------------------------------------------
+
+    def _remember(self, path: Path, load: Callable[[], Any]) -> Any:
+        if self._memory is None:
+            return load()
+        return self._memory.get_or_set(str(path), load)
+
+    def _remembers(self, path: Path) -> bool:
+        return self._memory is not None and self._memory.get(str(path), _MISSING) is not _MISSING
+
+    def _forget(self, path: Path) -> None:
+        if self._memory is not None:
+            self._memory.discard(str(path))
 
     # Utility ----------------------------------------------------------------------
 
@@ -71,3 +136,45 @@ class LocalDataCache:
         for path in self.root.glob("**/*"):
             if path.is_file():
                 yield path
+
+
+def _sanitize_part(part: str) -> str:
+    return part.replace("/", "_").replace(":", "-")
+
+
+@lru_cache(maxsize=4096)
+def _cache_path(root: Path, parts: Tuple[str, ...], suffix: str) -> Path:
+    # The same few hundred keys are probed on every snapshot; Path objects are immutable.
+    safe_parts = [_sanitize_part(part) for part in parts if part]
+    return root.joinpath(*safe_parts).with_suffix(suffix)
+
+
+def _staging_path(path: Path) -> Path:
+    # Writes land beside the target and are renamed over it, so readers never see a torn
+    # file; the pid/thread suffix keeps concurrent writers of the same key apart.
+    return path.with_name(f"{path.name}.tmp.{os.getpid()}.{threading.get_ident()}")
+
+
+def _load_json(path: Path) -> Any:
+    with path.open("rb") as f:
+        return orjson.loads(f.read())
+
+
+def _load_parquet(path: Path) -> pd.DataFrame:
+    with duckdb.connect() as conn:
+        return read_parquet_frame(conn, path)
+
+
+def read_parquet_frame(conn: duckdb.DuckDBPyConnection, path: Path | str) -> pd.DataFrame:
+    """Read a Parquet file through ``conn`` with tz-aware timestamps as ``datetime64[ns, UTC]``.
+
+    DuckDB hands TIMESTAMPTZ columns back in the session time zone at microsecond resolution,
+    so without this a cache hit would differ from a fresh provider fetch by host TZ and unit.
+    """
+
+    conn.execute("SET TimeZone = 'UTC'")
+    frame = conn.execute("SELECT * FROM read_parquet(?)", [str(path)]).df()
+    for column, dtype in frame.dtypes.items():
+        if isinstance(dtype, pd.DatetimeTZDtype) and dtype.unit != "ns":
+            frame[column] = frame[column].astype("datetime64[ns, UTC]")
+    return frame
@@ -3,11 +3,16 @@
 from __future__ import annotations
 
 from pathlib import Path
-from typing import Any, Dict, Iterable
+from typing import Any, Dict, Iterable, List, Tuple
 
 import duckdb
+import orjson
 import pandas as pd
 
+# Tables holding one JSON payload per (snapshot_ts, ticker) row.
+JSON_TABLES = ("option_chain", "news_items", "option_metrics")
+BAR_VALUE_COLUMNS = ("open", "high", "low", "close", "volume")
+
 
 class SnapshotStore:
     """Append snapshots into a DuckDB database for backtesting."""
@@ -65,45 +70,71 @@ class SnapshotStore:
         )
 
     def ingest_snapshot(self, snapshot: Dict[str, Dict[str, Any]]) -> None:
+        # Rows are gathered across tickers and inserted with one statement per table.
+        bar_frames: List[pd.DataFrame] = []
+        json_rows: Dict[str, List[Tuple[str, str, str]]] = {table: [] for table in JSON_TABLES}
         for ticker, data in snapshot.items():
             snapshot_ts = data["collected_at"]
             bars = data.get("underlying_bars")
-            if isinstance(bars, list):
+            if isinstance(bars, (list, dict)):
                 bars = pd.DataFrame(bars)
             if isinstance(bars, pd.DataFrame) and not bars.empty:
-                bars = bars.copy()
-                if "timestamp" in bars.columns:
-                    bars["timestamp"] = pd.to_datetime(bars["timestamp"])
-                bars["snapshot_ts"] = snapshot_ts
-                bars["ticker"] = ticker
-                cols = ["snapshot_ts", "ticker", "timestamp", "open", "high", "low", "close", "volume"]
-                bars = bars[cols]
-                self.conn.register("bars_df", bars)
-                self.conn.execute("INSERT INTO underlying_bars SELECT * FROM bars_df")
+                bar_frames.append(_bar_rows(bars, snapshot_ts, ticker))
 
             chain = data.get("option_chain")
             if chain:
-                self.conn.execute(
-                    "INSERT INTO option_chain VALUES (?, ?, ?::JSON)",
-                    (snapshot_ts, ticker, chain),
-                )
-
-            news = data.get("news") or []
-            if news:
-                for story in news:
-                    self.conn.execute(
-                        "INSERT INTO news_items VALUES (?, ?, ?::JSON)",
-                        (snapshot_ts, ticker, story),
-                    )
-
+                json_rows["option_chain"].append((snapshot_ts, ticker, _dump_json(chain)))
+            for story in data.get("news") or []:
+                json_rows["news_items"].append((snapshot_ts, ticker, _dump_json(story)))
             option_metrics = data.get("option_metrics") or {}
             if option_metrics:
+                json_rows["option_metrics"].append((snapshot_ts, ticker, _dump_json(option_metrics)))
+
+        # A snapshot lands as one transaction: a single commit, and no partial snapshot on failure.
+        self.conn.begin()
+        try:
+            if bar_frames:
+                # One append for every ticker's bars; append() matches columns by position.
+                self.conn.append("underlying_bars", pd.concat(bar_frames, ignore_index=True))
+
+            for table, rows in json_rows.items():
+                if not rows:
+                    continue
+                frame = pd.DataFrame(rows, columns=["snapshot_ts", "ticker", "payload"])
+                self.conn.register("json_rows_df", frame)
                 self.conn.execute(
-                    "INSERT INTO option_metrics VALUES (?, ?, ?::JSON)",
-                    (snapshot_ts, ticker, option_metrics),
+                    f"INSERT INTO {table} "
+                    "SELECT snapshot_ts::TIMESTAMP, ticker, payload::JSON FROM json_rows_df"
                 )
+                self.conn.unregister("json_rows_df")
+        except Exception:
+            self.conn.rollback()
+            raise
+        self.conn.commit()
 
     def list_snapshots(self) -> pd.DataFrame:
         return self.conn.execute(
             "SELECT DISTINCT snapshot_ts, ticker FROM underlying_bars ORDER BY snapshot_ts DESC"
         ).fetchdf()
+
+
+def _bar_rows(bars: pd.DataFrame, snapshot_ts: str, ticker: str) -> pd.DataFrame:
+    # Built column by column in table order; no copy of the caller's frame is needed.
+    columns: Dict[str, Any] = {
+        "snapshot_ts": pd.to_datetime(snapshot_ts, utc=True).tz_localize(None),
+        "ticker": ticker,
+    }
+    timestamps = bars["timestamp"]
+    if not pd.api.types.is_datetime64_any_dtype(timestamps):
+        timestamps = pd.to_datetime(timestamps)
+    if isinstance(timestamps.dtype, pd.DatetimeTZDtype):
+        # TIMESTAMP columns hold naive UTC; normalise zones here so frames concatenate cleanly.
+        timestamps = timestamps.dt.tz_convert("UTC").dt.tz_localize(None)
+    columns["timestamp"] = timestamps
+    for name in BAR_VALUE_COLUMNS:
+        columns[name] = bars[name]
+    return pd.DataFrame(columns, index=bars.index)
+
+
+def _dump_json(payload: Any) -> str:
+    return orjson.dumps(payload, option=orjson.OPT_SERIALIZE_NUMPY, default=str).decode()
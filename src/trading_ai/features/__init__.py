@@ -1,5 +1,5 @@
 """Feature engineering utilities."""
 
-from trading_ai.features.technicals import compute_intraday_features
+from trading_ai.features.technicals import close_features, compute_intraday_features
 
-__all__ = ["compute_intraday_features"]
+__all__ = ["close_features", "compute_intraday_features"]
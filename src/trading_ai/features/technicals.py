@@ -7,17 +7,44 @@ from typing import Dict
 import numpy as np
 import pandas as pd
 
+# Annualising factor for per-minute return volatility: sqrt(390 minutes per session).
+_SQRT_SESSION_MINUTES = float(np.sqrt(390))
+
 
 def compute_intraday_features(bars: pd.DataFrame) -> Dict[str, float]:
     """Return simple momentum/volatility features for a bar dataframe."""
 
     if bars.empty:
-        return {"momentum_15": 0.0, "momentum_60": 0.0, "volatility": 0.0}
+        return close_features(np.empty(0))
+    return close_features(bars["close"].to_numpy(dtype=np.float64))
+
 
-    close = bars["close"].astype(float)
+def close_features(close: np.ndarray) -> Dict[str, float]:
+    """``compute_intraday_features`` over a bare close-price array, for callers that already hold one."""
+
+    close = np.asarray(close, dtype=np.float64)
+    if close.size == 0:
+        return {"momentum_15": 0.0, "momentum_60": 0.0, "volatility": 0.0}
+    if np.isnan(close).any():
+        return _features_from_series(pd.Series(close))  # keep pandas' NaN-skipping semantics
     momentum_15 = _pct_change(close, 15)
     momentum_60 = _pct_change(close, 60)
-    volatility = close.pct_change().tail(60).std(ddof=0) * np.sqrt(390) if len(close) > 1 else 0.0
+    volatility = 0.0
+    if len(close) > 1:
+        # Same arithmetic as Series.pct_change().tail(60).std(ddof=0), without the Series.
+        tail = close[-61:]
+        volatility = (tail[1:] / tail[:-1] - 1.0).std() * _SQRT_SESSION_MINUTES
+    return {
+        "momentum_15": float(momentum_15),
+        "momentum_60": float(momentum_60),
+        "volatility": float(volatility),
+    }
+
+
+def _features_from_series(close: pd.Series) -> Dict[str, float]:
+    momentum_15 = _pct_change(close.to_numpy(), 15)
+    momentum_60 = _pct_change(close.to_numpy(), 60)
+    volatility = close.pct_change().tail(60).std(ddof=0) * _SQRT_SESSION_MINUTES if len(close) > 1 else 0.0
     return {
         "momentum_15": float(momentum_15),
         "momentum_60": float(momentum_60),
@@ -25,11 +52,11 @@ def compute_intraday_features(bars: pd.DataFrame) -> Dict[str, float]:
     }
 
 
-def _pct_change(series: pd.Series, window: int) -> float:
-    if len(series) < window + 1:
-        window = len(series) - 1
+def _pct_change(close: np.ndarray, window: int) -> float:
+    if len(close) < window + 1:
+        window = len(close) - 1
     if window <= 0:
         return 0.0
-    start = series.iloc[-window - 1]
-    end = series.iloc[-1]
+    start = close[-window - 1]
+    end = close[-1]
     return (end - start) / start if start else 0.0
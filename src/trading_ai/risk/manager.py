@@ -2,11 +2,14 @@
 
 from __future__ import annotations
 
+import math
 from dataclasses import dataclass
 from typing import Optional
 
+import numpy as np
 
-@dataclass
+
+@dataclass(slots=True)
 class PositionSizingInput:
     account_equity: float
     trade_risk_fraction: float  # e.g., 0.02 for 2%
@@ -26,16 +29,36 @@ class RiskManager:
         return equity * self.max_daily_loss_pct
 
     def size_position(self, params: PositionSizingInput) -> int:
-        if params.confidence < self.min_confidence:
-            return 0
+        priced = params.contract_price > 0
+        eligible = priced and params.confidence >= self.min_confidence
         risk_capital = params.account_equity * min(params.trade_risk_fraction, self.max_daily_loss_pct)
-        confidence_scalar = params.confidence ** 0.5  # smooth
-        budget = risk_capital * confidence_scalar
-        if params.contract_price <= 0:
-            return 0
-        qty = int(budget // params.contract_price)
+        budget = risk_capital * math.sqrt(max(params.confidence, 0.0))  # smooth
+        qty = int(budget // (params.contract_price if priced else 1.0)) * eligible
         return max(0, min(qty, params.max_positions))
 
+    def size_position_batch(
+        self,
+        account_equity: float | np.ndarray,
+        contract_price: np.ndarray,
+        confidence: np.ndarray,
+        *,
+        trade_risk_fraction: float,
+        max_positions: int = 1,
+    ) -> np.ndarray:
+        """Vectorised ``size_position`` over aligned price/confidence arrays."""
+
+        contract_price = np.asarray(contract_price, dtype=np.float64)
+        confidence = np.asarray(confidence, dtype=np.float64)
+        risk_capital = np.asarray(account_equity, dtype=np.float64) * min(
+            trade_risk_fraction, self.max_daily_loss_pct
+        )
+        budget = risk_capital * np.sqrt(np.maximum(confidence, 0.0))
+        priced = contract_price > 0
+        qty = np.floor_divide(budget, np.where(priced, contract_price, 1.0))
+        qty = np.clip(qty, 0, max_positions)
+        qty[~(priced & (confidence >= self.min_confidence))] = 0
+        return qty.astype(np.int64)
+
     def stop_loss_price(self, entry_price: float, risk_fraction: float) -> float:
         return max(0.01, entry_price * (1 - risk_fraction))
 
@@ -2,19 +2,22 @@
 
 from __future__ import annotations
 
+import math
 import time
 from dataclasses import dataclass
 from datetime import datetime, timedelta
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import BinaryIO, Dict, List, Optional, Tuple
 
+import numpy as np
 import orjson
+from alpaca.trading.enums import OrderSide, PositionIntent
 from loguru import logger
 
 from trading_ai.backtest.data_loader import contexts_from_snapshot
 from trading_ai.clients import AlpacaClient
 from trading_ai.core.pipeline import SignalPipeline
-from trading_ai.risk.manager import PositionSizingInput, RiskManager
+from trading_ai.risk.manager import RiskManager
 from trading_ai.settings import Settings
 from trading_ai.strategies.base import StrategyContext, TradingSignal
 from trading_ai.strategies.momentum_iv import MomentumIVStrategy
@@ -41,7 +44,7 @@ class AutoTraderConfig:
     min_option_agg_vwap: float = 0.0
 
 
-@dataclass
+@dataclass(slots=True)
 class TradeIntent:
     """Represents a pending order derived from a signal."""
 
@@ -92,45 +95,70 @@ class AutoTrader:
             include_news=self.config.include_news,
         )
         contexts = contexts_from_snapshot(snapshot)
-        intents: List[TradeIntent] = []
-        for context in contexts:
-            intent = self._build_intent(context)
-            if intent:
-                intents.append(intent)
-                result = self._execute_intent(intent)
-                self._record_intent(intent, result)
+        intents = self._build_intents(contexts)
+        if intents:
+            with self._open_log() as log_file:
+                for intent in intents:
+                    result = self._execute_intent(intent)
+                    self._record_intent(intent, result, log_file)
         logger.info("AutoTrader cycle completed", intents=len(intents))
         return intents
 
     def run_loop(self) -> None:
         """Continuously run until interrupted."""
 
+        if self.config.include_news:
+            self.pipeline.warmup()
+        interval = max(1, self.config.sleep_seconds)
+        next_run = time.monotonic()
         while True:
             self.run_once()
-            time.sleep(max(1, self.config.sleep_seconds))
+            # Schedule against the monotonic clock so cycle work does not stretch the cadence.
+            next_run += interval
+            delay = next_run - time.monotonic()
+            if delay > 0:
+                time.sleep(delay)
+            else:
+                next_run = time.monotonic()  # overran the interval; restart the schedule from now
 
-    def _build_intent(self, context: StrategyContext) -> Optional[TradeIntent]:
-        signal = self.strategy.generate_signal(context)
-        if signal.direction == "NONE" or signal.confidence < self.config.min_confidence:
-            return None
-        entry_price = self._infer_entry_price(signal, context)
-        if entry_price is None or entry_price <= 0:
-            logger.debug("Skipping signal without price", ticker=context.ticker)
-            return None
-        size = self.risk_manager.size_position(
-            PositionSizingInput(
-                account_equity=self.config.account_equity,
-                trade_risk_fraction=self.config.trade_risk_fraction,
-                contract_price=entry_price,
-                confidence=signal.confidence,
-                max_positions=self.config.max_positions,
-            )
+    def _build_intents(self, contexts: List[StrategyContext]) -> List[TradeIntent]:
+        """Score every context, then size all priced candidates in one RiskManager pass."""
+
+        candidates: List[Tuple[StrategyContext, TradingSignal, float]] = []
+        for context in contexts:
+            signal = self.strategy.generate_signal(context)
+            if signal.direction == "NONE" or signal.confidence < self.config.min_confidence:
+                continue
+            entry_price = self._infer_entry_price(signal, context)
+            if entry_price is None or entry_price <= 0:
+                logger.debug("Skipping signal without price", ticker=context.ticker)
+                continue
+            candidates.append((context, signal, entry_price))
+        if not candidates:
+            return []
+        sizes = self.risk_manager.size_position_batch(
+            self.config.account_equity,
+            np.array([entry_price for _, _, entry_price in candidates], dtype=np.float64),
+            np.array([signal.confidence for _, signal, _ in candidates], dtype=np.float64),
+            trade_risk_fraction=self.config.trade_risk_fraction,
+            max_positions=self.config.max_positions,
         )
+        intents: List[TradeIntent] = []
+        for (context, signal, entry_price), size in zip(candidates, sizes.tolist()):
+            intent = self._build_intent(context, signal, entry_price, size)
+            if intent:
+                intents.append(intent)
+        return intents
+
+    def _build_intent(
+        self, context: StrategyContext, signal: TradingSignal, entry_price: float, size: int
+    ) -> Optional[TradeIntent]:
         if size <= 0:
             return None
         option_symbol = self._option_symbol(context, signal.direction)
-        agg_stats = self._aggregate_health(context, signal.direction)
-        agg_vwap = self._aggregate_vwap_trend(context, signal.direction)
+        aggregates = _option_agg_series(context, signal.direction)
+        agg_stats = self._aggregate_health(aggregates)
+        agg_vwap = self._aggregate_vwap_trend(aggregates)
         if (
             agg_stats["bars"] < self.config.min_option_agg_bars
             or agg_stats["volume"] < self.config.min_option_agg_volume
@@ -197,15 +225,13 @@ class AutoTrader:
         bid = quote.get("bid") or quote.get("bid_price")
         ask = quote.get("ask") or quote.get("ask_price")
         try:
-            bid_f = float(bid) if bid is not None else None
-            ask_f = float(ask) if ask is not None else None
+            bid_f = math.nan if bid is None else float(bid)
+            ask_f = math.nan if ask is None else float(ask)
         except (TypeError, ValueError):
             return None
-        if bid_f is None and ask_f is None:
-            return None
-        if bid_f is None:
-            return ask_f
-        if ask_f is None:
+        if math.isnan(bid_f):
+            return None if math.isnan(ask_f) else ask_f
+        if math.isnan(ask_f):
             return bid_f
         return (bid_f + ask_f) / 2
 
@@ -218,7 +244,13 @@ class AutoTrader:
             return leg.get("symbol")
         return None
 
-    def _record_intent(self, intent: TradeIntent, result: Dict[str, Optional[str]]) -> None:
+    def _open_log(self) -> BinaryIO:
+        """Open the intent log for appending; one handle serves a whole cycle."""
+
+        self.log_path.parent.mkdir(parents=True, exist_ok=True)
+        return self.log_path.open("ab")
+
+    def _record_intent(self, intent: TradeIntent, result: Dict[str, Optional[str]], log_file: BinaryIO) -> None:
         entry = {
             "timestamp": datetime.utcnow().isoformat(),
             "ticker": intent.ticker,
@@ -231,52 +263,66 @@ class AutoTrader:
             "order_id": result.get("order_id"),
             "metadata": intent.metadata,
         }
-        payload = orjson.dumps(entry, option=orjson.OPT_SERIALIZE_NUMPY)
-        self.log_path.parent.mkdir(parents=True, exist_ok=True)
-        with self.log_path.open("ab") as log_file:
-            log_file.write(payload + b"\n")
+        log_file.write(orjson.dumps(entry, option=orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_APPEND_NEWLINE))
         logger.debug("Intent recorded", status=entry["status"], option=intent.option_symbol)
 
-    def _aggregate_health(self, context: StrategyContext, direction: str) -> Dict[str, float]:
-        aggregates = context.option_aggregates or {}
-        series = aggregates.get(direction) or []
-        if not isinstance(series, list):
-            return {"bars": 0, "volume": 0.0}
-        bars = len(series)
-        volume = 0.0
-        for bar in series[-self.config.min_option_agg_bars or len(series) :]:
-            if isinstance(bar, dict):
-                try:
-                    volume += float(bar.get("volume") or 0.0)
-                except (TypeError, ValueError):
-                    continue
-        return {"bars": bars, "volume": volume}
-
-    def _aggregate_vwap_trend(self, context: StrategyContext, direction: str) -> float:
-        aggregates = context.option_aggregates or {}
-        series = aggregates.get(direction) or []
-        if not isinstance(series, list) or len(series) < 2:
-            return 0.0
-        vwaps = [bar.get("vwap") for bar in series if isinstance(bar, dict) and bar.get("vwap") is not None]
-        if len(vwaps) < 2:
-            return 0.0
-        try:
-            start = float(vwaps[0])
-            end = float(vwaps[-1])
-        except (TypeError, ValueError):
+    def _aggregate_health(self, aggregates: "OptionAggSeries") -> Dict[str, float]:
+        # Volume covers the trailing ``min_option_agg_bars`` bars the gate checks, or every bar when unset.
+        window = self.config.min_option_agg_bars if self.config.min_option_agg_bars > 0 else aggregates.bars
+        volume = float(aggregates.volume[-window:].sum()) if window > 0 else 0.0
+        return {"bars": aggregates.bars, "volume": volume}
+
+    def _aggregate_vwap_trend(self, aggregates: "OptionAggSeries") -> float:
+        vwap = aggregates.vwap
+        if vwap.size < 2:
             return 0.0
-        if start == 0:
+        start = float(vwap[0])
+        end = float(vwap[-1])
+        if start == 0 or np.isnan(start) or np.isnan(end):
             return 0.0
         return (end - start) / start
 
 
-def _direction_to_side(direction: str):
-    from alpaca.trading.enums import OrderSide
+@dataclass(slots=True)
+class OptionAggSeries:
+    """Column arrays for one option leg's aggregate bars.
+
+    ``volume`` has one slot per bar (0.0 where missing); ``vwap`` keeps only bars that reported one,
+    with NaN for values that do not parse.
+    """
+
+    bars: int
+    volume: np.ndarray
+    vwap: np.ndarray
+
+
+def _option_agg_series(context: StrategyContext, direction: str) -> OptionAggSeries:
+    aggregates = context.option_aggregates or {}
+    series = aggregates.get(direction) or []
+    if not isinstance(series, list):
+        return OptionAggSeries(0, np.empty(0), np.empty(0))
+    volume = np.zeros(len(series))
+    vwaps: List[float] = []
+    for index, bar in enumerate(series):
+        if not isinstance(bar, dict):
+            continue
+        volume[index] = _as_float(bar.get("volume") or 0.0, 0.0)
+        vwap = bar.get("vwap")
+        if vwap is not None:
+            vwaps.append(_as_float(vwap, np.nan))
+    return OptionAggSeries(len(series), volume, np.asarray(vwaps, dtype=np.float64))
+
+
+def _as_float(value: object, default: float) -> float:
+    try:
+        return float(value)  # type: ignore[arg-type]
+    except (TypeError, ValueError):
+        return default
 
-    return OrderSide.BUY if direction.upper() in {"CALL", "PUT"} else OrderSide.BUY
 
+def _direction_to_side(direction: str) -> OrderSide:
+    return OrderSide.BUY  # long calls and long puts are both opened with a buy
 
-def _direction_to_position_intent(direction: str):
-    from alpaca.trading.enums import PositionIntent
 
+def _direction_to_position_intent(direction: str) -> PositionIntent:
     return PositionIntent.BUY_TO_OPEN
@@ -3,12 +3,13 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
-from typing import Any, Dict, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
+import numpy as np
 import pandas as pd
 
 
-@dataclass
+@dataclass(slots=True)
 class TradingSignal:
     """Represents an actionable decision produced by a strategy."""
 
@@ -21,18 +22,77 @@ class TradingSignal:
     metadata: Dict[str, Any] | None = None
 
 
-@dataclass
+@dataclass(slots=True)
 class StrategyContext:
     """Bundle of inputs needed to evaluate a strategy for a specific ticker."""
 
     ticker: str
-    underlying_bars: pd.DataFrame
+    underlying_bars: pd.DataFrame | List[Dict[str, Any]] | Dict[str, List[Any]]
     option_chain: Any
     option_metrics: Dict[str, Any] | None
     option_quote: Any
     news_items: list[Dict[str, Any]]
     features: Dict[str, Any] | None = None
     option_aggregates: Dict[str, Any] | None = None
+    underlying_close: np.ndarray | None = None
+    call_mid: float | None = None  # NaN when the quote lacks a usable bid/ask
+    put_mid: float | None = None
+
+    def __post_init__(self) -> None:
+        if self.underlying_close is None:
+            self.underlying_close = close_prices(self.underlying_bars)
+        if self.call_mid is None or self.put_mid is None:
+            self.call_mid, self.put_mid = quote_mids(self.option_quote)
+
+    def bars_frame(self) -> pd.DataFrame:
+        """Return the underlying bars as a DataFrame, materialising raw records on first use."""
+
+        if not isinstance(self.underlying_bars, pd.DataFrame):
+            self.underlying_bars = pd.DataFrame(self.underlying_bars or [])
+        return self.underlying_bars
+
+
+def close_prices(bars: Any) -> np.ndarray:
+    """Extract the close column from a bar DataFrame, row records, or column lists as float64."""
+
+    try:
+        if isinstance(bars, pd.DataFrame):
+            if bars.empty or "close" not in bars:
+                return np.empty(0, dtype=np.float64)
+            return bars["close"].to_numpy(dtype=np.float64)
+        if isinstance(bars, dict) and bars.get("close") is not None:
+            return np.array(bars["close"], dtype=np.float64)
+        if isinstance(bars, list) and any(isinstance(bar, dict) and "close" in bar for bar in bars):
+            return np.array([bar.get("close") if isinstance(bar, dict) else None for bar in bars], dtype=np.float64)
+    except (TypeError, ValueError):
+        pass
+    return np.empty(0, dtype=np.float64)
+
+
+def quote_mids(option_quote: Any) -> Tuple[float, float]:
+    """Return (call_mid, put_mid) from a directional or flat quote; a missing leg borrows the other."""
+
+    if not isinstance(option_quote, dict):
+        return np.nan, np.nan
+    if "CALL" in option_quote or "PUT" in option_quote:
+        call_leg = option_quote.get("CALL")
+        put_leg = option_quote.get("PUT")
+        return _leg_mid(call_leg or put_leg), _leg_mid(put_leg or call_leg)
+    mid = _leg_mid(option_quote)
+    return mid, mid
+
+
+def _leg_mid(leg: Any) -> float:
+    if not isinstance(leg, dict):
+        return np.nan
+    bid = leg.get("bid", leg.get("bid_price"))
+    ask = leg.get("ask", leg.get("ask_price"))
+    if bid is None or ask is None:
+        return np.nan
+    try:
+        return (float(bid) + float(ask)) / 2
+    except (TypeError, ValueError):
+        return np.nan
 
 
 class TradingStrategy:
@@ -2,16 +2,21 @@
 
 from __future__ import annotations
 
+import math
+import re
 from dataclasses import dataclass
-from typing import Any, Dict, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
 import numpy as np
-import pandas as pd
 
 from trading_ai.strategies.base import StrategyContext, TradingSignal, TradingStrategy
 
+# Headline keywords, each set compiled to one alternation so a summary is scanned once per side.
+_POSITIVE_NEWS = re.compile("beats|surge|upgrade|positive")
+_NEGATIVE_NEWS = re.compile("misses|downgrade|negative|lawsuit")
 
-@dataclass
+
+@dataclass(slots=True, frozen=True)
 class MomentumIVConfig:
     lookback_minutes: int = 60
     momentum_threshold: float = 0.0015  # 0.15% to fire in quiet sessions
@@ -37,15 +42,24 @@ class MomentumIVStrategy(TradingStrategy):
 
     def __init__(self, config: Optional[MomentumIVConfig] = None) -> None:
         self.config = config or MomentumIVConfig()
+        # The config is frozen, so the confidence blend's weights are fixed for the strategy's lifetime.
+        self._weights = (
+            self.config.momentum_weight,
+            self.config.iv_weight,
+            self.config.news_weight,
+            self.config.option_flow_weight,
+            self.config.option_agg_weight,
+            self.config.option_agg_vwap_weight,
+        )
+        self._total_weight = sum(self._weights) or 1.0
+        self._baseline = self.config.baseline_confidence / self.config.max_confidence
 
-    def _compute_momentum(self, bars: pd.DataFrame) -> float:
-        if bars.empty:
+    def _compute_momentum(self, close: np.ndarray) -> float:
+        window = min(self.config.lookback_minutes, close.size)
+        if window < 2:
             return 0.0
-        close = bars["close"].astype(float)
-        window = close.tail(self.config.lookback_minutes)
-        if len(window) < 2:
-            return 0.0
-        return (window.iloc[-1] - window.iloc[0]) / window.iloc[0]
+        first = float(close[-window])
+        return 0.0 if first == 0 else (float(close[-1]) - first) / first
 
     def _momentum_from_features(self, features: Optional[Dict[str, Any]]) -> float:
         if not features:
@@ -79,8 +93,14 @@ class MomentumIVStrategy(TradingStrategy):
     def _quote_mid(self, quote: Optional[Dict[str, Any]]) -> Optional[float]:
         if not isinstance(quote, dict):
             return None
-        bid = quote.get("bid") or quote.get("bid_price")
-        ask = quote.get("ask") or quote.get("ask_price")
+        get = quote.get
+        # Fall back to the alias keys only when the primary key is absent, so a 0.0 bid still counts.
+        bid = get("bid")
+        if bid is None:
+            bid = get("bid_price")
+        ask = get("ask")
+        if ask is None:
+            ask = get("ask_price")
         try:
             bid = float(bid) if bid is not None else None
             ask = float(ask) if ask is not None else None
@@ -152,36 +172,45 @@ class MomentumIVStrategy(TradingStrategy):
             return 0.0
         return (end - start) / start
 
-    def _extract_iv_metrics(self, option_chain: Dict, option_metrics: Dict[str, Any] | None = None) -> Dict[str, float]:
-        if not option_chain:
-            return {"avg_iv": np.nan, "iv_change": np.nan}
-        ivs = []
-        iv_changes = []
-        for leg in option_chain if isinstance(option_chain, list) else option_chain.values():
+    def _chain_metrics(
+        self, option_chain: Any, option_metrics: Optional[Dict[str, Any]]
+    ) -> Tuple[Dict[str, float], Dict[str, float]]:
+        """IV and option-flow metrics from one walk over each source (the chain twice only as flow fallback)."""
+
+        legs = _legs(option_chain)
+        payloads = _legs(option_metrics)
+        # Raw values (None included) are gathered per leg and converted to float64 in one go below.
+        raw_ivs: List[Any] = []
+        raw_iv_changes: List[Any] = []
+        for leg in legs:
             if isinstance(leg, dict):
-                iv = leg.get("implied_volatility")
-                if iv is not None:
-                    ivs.append(float(iv))
-                iv_change = leg.get("iv_change")
-                if iv_change is not None:
-                    iv_changes.append(float(iv_change))
-        if option_metrics:
-            for payload in option_metrics.values():
-                iv = payload.get("implied_volatility")
-                if iv is not None:
-                    ivs.append(float(iv))
-                greeks = payload.get("greeks") or {}
-                iv_change = greeks.get("vega")  # proxy if explicit iv change missing
-                if iv_change is not None:
-                    iv_changes.append(float(iv_change))
-        return {
-            "avg_iv": float(np.nanmean(ivs)) if ivs else np.nan,
-            "iv_change": float(np.nanmean(iv_changes)) if iv_changes else np.nan,
-        }
+                raw_ivs.append(leg.get("implied_volatility"))
+                raw_iv_changes.append(leg.get("iv_change"))
+        flow_legs: List[Tuple[Dict[str, Any], bool]] = []
+        for payload in payloads:
+            if not isinstance(payload, dict):
+                continue
+            raw_ivs.append(payload.get("implied_volatility"))
+            greeks = payload.get("greeks") or {}
+            raw_iv_changes.append(greeks.get("vega"))  # proxy if explicit iv change missing
+            side = self._flow_side(payload)
+            if side is not None:
+                flow_legs.append((payload, side))
+        weights, deltas, is_call = self._flow_columns(flow_legs)
+        if weights.sum() == 0:
+            weights, deltas, is_call = self._flow_arrays(legs)
+        if option_chain:
+            iv_metrics = {
+                "avg_iv": _nanmean(_float_column(raw_ivs)),
+                "iv_change": _nanmean(_float_column(raw_iv_changes)),
+            }
+        else:
+            iv_metrics = {"avg_iv": np.nan, "iv_change": np.nan}
+        return iv_metrics, self._option_flow_metrics(weights, deltas, is_call)
 
     def _determine_direction(self, momentum: float, iv_change: float, flow_bias: float) -> str:
         effective_threshold = self.config.momentum_threshold
-        if np.isnan(iv_change):
+        if math.isnan(iv_change):
             effective_threshold *= 0.5  # relax requirement when IV data is sparse
         if momentum > effective_threshold and iv_change <= self.config.iv_squeeze_threshold:
             return "CALL"
@@ -205,19 +234,11 @@ class MomentumIVStrategy(TradingStrategy):
         agg_vwap: float,
     ) -> float:
         momentum_score = min(abs(momentum) / (self.config.momentum_threshold * 2), 1.0)
-        iv_score = 0.0 if np.isnan(iv_change) else min(abs(iv_change) / 0.1, 1.0)
+        iv_score = 0.0 if math.isnan(iv_change) else min(abs(iv_change) / 0.1, 1.0)
         flow_score = min(abs(flow_bias), 1.0)
         agg_score = min(abs(agg_momentum) / max(self.config.momentum_threshold, 1e-6), 1.0)
         agg_vwap_score = min(abs(agg_vwap) / max(self.config.momentum_threshold, 1e-6), 1.0)
-        weights = (
-            self.config.momentum_weight,
-            self.config.iv_weight,
-            self.config.news_weight,
-            self.config.option_flow_weight,
-            self.config.option_agg_weight,
-            self.config.option_agg_vwap_weight,
-        )
-        total_weight = sum(weights) or 1.0
+        weights = self._weights
         raw = (
             weights[0] * momentum_score
             + weights[1] * iv_score
@@ -225,9 +246,8 @@ class MomentumIVStrategy(TradingStrategy):
             + weights[3] * flow_score
             + weights[4] * agg_score
             + weights[5] * agg_vwap_score
-        ) / total_weight
-        baseline = self.config.baseline_confidence / self.config.max_confidence
-        raw = max(baseline, raw)
+        ) / self._total_weight
+        raw = max(self._baseline, raw)
         return max(0.0, min(raw * self.config.max_confidence, self.config.max_confidence))
 
     def _news_bias(self, news_items: list[dict]) -> float:
@@ -237,9 +257,9 @@ class MomentumIVStrategy(TradingStrategy):
         negative = 0
         for article in news_items:
             summary = str(article.get("description") or article.get("title") or "").lower()
-            if any(keyword in summary for keyword in ("beats", "surge", "upgrade", "positive")):
+            if _POSITIVE_NEWS.search(summary):
                 positive += 1
-            if any(keyword in summary for keyword in ("misses", "downgrade", "negative", "lawsuit")):
+            if _NEGATIVE_NEWS.search(summary):
                 negative += 1
         total = positive + negative
         if total == 0:
@@ -247,51 +267,13 @@ class MomentumIVStrategy(TradingStrategy):
         return max(0.0, min(positive / total, 1.0))
 
     def _option_flow_metrics(
-        self,
-        option_metrics: Optional[Dict[str, Any]],
-        option_chain: Optional[Dict[str, Any]],
+        self, weights: np.ndarray, deltas: np.ndarray, is_call: np.ndarray
     ) -> Dict[str, float]:
-        call_oi = 0.0
-        put_oi = 0.0
-        call_delta = 0.0
-        put_delta = 0.0
-
-        def _ingest(source: Optional[Any]) -> None:
-            nonlocal call_oi, put_oi, call_delta, put_delta
-            if not source:
-                return
-            if isinstance(source, dict):
-                iterable = source.values()
-            elif isinstance(source, list):
-                iterable = source
-            else:
-                return
-            for payload in iterable:
-                if not isinstance(payload, dict):
-                    continue
-                contract_type = str(payload.get("contract_type") or "").upper()
-                if not contract_type:
-                    contract_type = self._infer_contract_type(payload.get("symbol"))
-                if contract_type not in {"CALL", "PUT"}:
-                    continue
-                open_interest = self._coerce_float(payload.get("open_interest"))
-                if open_interest is None or open_interest < 0:
-                    open_interest = self._estimate_liquidity(payload)
-                greeks = payload.get("greeks") or {}
-                delta = self._coerce_float(greeks.get("delta")) or 0.0
-                weight = open_interest if open_interest and open_interest > 0 else abs(delta)
-                if weight is None or weight <= 0:
-                    continue
-                if contract_type == "CALL":
-                    call_oi += weight
-                    call_delta += delta * weight
-                else:
-                    put_oi += weight
-                    put_delta += delta * weight
-
-        _ingest(option_metrics)
-        if call_oi + put_oi == 0:
-            _ingest(option_chain)
+        call_oi = float(weights[is_call].sum())
+        put_oi = float(weights[~is_call].sum())
+        weighted_delta = deltas * weights
+        call_delta = float(weighted_delta[is_call].sum())
+        put_delta = float(weighted_delta[~is_call].sum())
 
         total_weight = call_oi + put_oi
         if total_weight > 0:
@@ -309,6 +291,46 @@ class MomentumIVStrategy(TradingStrategy):
             "delta_bias": aggregated_delta,
         }
 
+    def _flow_arrays(self, legs: List[Any]) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        flow_legs = []
+        for payload in legs:
+            side = self._flow_side(payload) if isinstance(payload, dict) else None
+            if side is not None:
+                flow_legs.append((payload, side))
+        return self._flow_columns(flow_legs)
+
+    def _flow_side(self, payload: Dict[str, Any]) -> Optional[bool]:
+        """True for a call, False for a put, None when the leg's side is unknown."""
+
+        contract_type = str(payload.get("contract_type") or "").upper()
+        if not contract_type:
+            contract_type = self._infer_contract_type(payload.get("symbol"))
+        if contract_type not in {"CALL", "PUT"}:
+            return None
+        return contract_type == "CALL"
+
+    def _flow_columns(
+        self, flow_legs: List[Tuple[Dict[str, Any], bool]]
+    ) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """(weight, delta, is_call) columns for sided legs; legs without a positive weight get weight 0.
+
+        Open interest and delta are converted column-wise; a missing, unparsable or negative open
+        interest falls back to the leg's quote/trade liquidity estimate.
+        """
+
+        is_call = np.fromiter((side for _, side in flow_legs), dtype=bool, count=len(flow_legs))
+        open_interest = _float_column([payload.get("open_interest") for payload, _ in flow_legs])
+        deltas = _float_column([(payload.get("greeks") or {}).get("delta") for payload, _ in flow_legs])
+        deltas[np.isnan(deltas)] = 0.0
+        for index in np.flatnonzero(~(open_interest >= 0)).tolist():
+            estimate = self._estimate_liquidity(flow_legs[index][0])
+            open_interest[index] = np.nan if estimate is None else estimate
+        weights = np.where(open_interest > 0, open_interest, np.abs(deltas))
+        unweighted = ~(weights > 0)
+        weights[unweighted] = 0.0
+        deltas[unweighted] = 0.0
+        return weights, deltas, is_call
+
     def _coerce_float(self, value: Any) -> Optional[float]:
         if value is None:
             return None
@@ -336,8 +358,8 @@ class MomentumIVStrategy(TradingStrategy):
         return None
 
     def generate_signal(self, context: StrategyContext) -> TradingSignal:
-        bars = context.underlying_bars
-        momentum = self._compute_momentum(bars)
+        # The context already carries the close column as float64, so no bar frame is built here.
+        momentum = self._compute_momentum(context.underlying_close)
         if abs(momentum) < self.config.momentum_threshold:
             fallback_momentum = self._momentum_from_features(context.features)
             if abs(fallback_momentum) > abs(momentum):
@@ -350,13 +372,17 @@ class MomentumIVStrategy(TradingStrategy):
         agg_vwap = self._vwap_trend(context.option_aggregates)
         if abs(agg_momentum) > abs(momentum):
             momentum = np.sign(agg_momentum) * max(abs(momentum), abs(agg_momentum))
-        iv_metrics = self._extract_iv_metrics(context.option_chain, context.option_metrics)
+        iv_metrics, flow_metrics = self._chain_metrics(context.option_chain, context.option_metrics)
         iv_change = iv_metrics["iv_change"]
-        flow_metrics = self._option_flow_metrics(context.option_metrics, context.option_chain)
         flow_bias = flow_metrics["flow_ratio"]
         if abs(flow_metrics["delta_bias"]) > abs(flow_bias):
             flow_bias = flow_metrics["delta_bias"]
         direction = self._determine_direction(momentum, iv_change, flow_bias)
+        if direction == "NONE":
+            # Nothing downstream trades a NONE signal, so skip the news scan and confidence blend.
+            return TradingSignal(
+                ticker=context.ticker, direction="NONE", confidence=0.0, metadata={"momentum": momentum}
+            )
         news_bias = self._news_bias(context.news_items)
         confidence = self._confidence_score(momentum, iv_change, news_bias, flow_bias, agg_momentum, agg_vwap)
 
@@ -376,3 +402,34 @@ class MomentumIVStrategy(TradingStrategy):
             },
         )
         return signal
+
+
+def _legs(source: Any) -> List[Any]:
+    if isinstance(source, dict):
+        return list(source.values())
+    if isinstance(source, list):
+        return source
+    return []
+
+
+def _float_column(values: List[Any]) -> np.ndarray:
+    """float64 array with NaN for None or unparsable entries; numeric lists take NumPy's bulk path."""
+
+    try:
+        return np.array([np.nan if value is None else value for value in values], dtype=np.float64)
+    except (TypeError, ValueError):
+        return np.array([_to_float(value) for value in values], dtype=np.float64)
+
+
+def _to_float(value: Any) -> float:
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return np.nan
+
+
+def _nanmean(values: np.ndarray) -> float:
+    """Mean of the non-NaN entries, or NaN when there are none (np.nanmean without its warning path)."""
+
+    valid = values[~np.isnan(values)]
+    return float(valid.mean()) if valid.size else np.nan
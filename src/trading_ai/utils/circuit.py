@@ -0,0 +1,82 @@
+"""Minimal circuit breaker used to skip upstream providers that keep failing."""
+
+from __future__ import annotations
+
+import time
+from threading import Lock
+from typing import Callable
+
+from loguru import logger
+
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half_open"
+
+
+class CircuitBreaker:
+    """Opens after ``failure_threshold`` consecutive failures and stays open for ``cooldown``.
+
+    Once the cooldown elapses a single probe call is let through: success closes the circuit,
+    failure re-opens it for another cooldown.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        *,
+        failure_threshold: int = 3,
+        cooldown: float = 60.0,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.name = name
+        self.failure_threshold = failure_threshold
+        self.cooldown = cooldown
+        self._clock = clock
+        self._state = CLOSED
+        self._failures = 0
+        self._open_until = 0.0
+        self._lock = Lock()
+
+    @property
+    def state(self) -> str:
+        return self._state
+
+    def allow(self) -> bool:
+        """Return True if a call may proceed now."""
+
+        with self._lock:
+            if self._state == CLOSED:
+                return True
+            if self._state == OPEN and self._clock() >= self._open_until:
+                self._transition(HALF_OPEN)
+                return True
+            return False  # open and cooling down, or a half-open probe is already in flight
+
+    def record_success(self) -> None:
+        with self._lock:
+            self._failures = 0
+            if self._state != CLOSED:
+                self._transition(CLOSED)
+
+    def record_failure(self) -> None:
+        with self._lock:
+            self._failures += 1
+            if self._state == HALF_OPEN or self._failures >= self.failure_threshold:
+                self._open_until = self._clock() + self.cooldown
+                if self._state != OPEN:
+                    self._transition(OPEN)
+
+    def release(self) -> None:
+        """Hand back a call that never reached the provider without counting it either way.
+
+        A half-open probe released this way returns to open with its cooldown already elapsed,
+        so the next caller probes again instead of the circuit staying half-open for good.
+        """
+
+        with self._lock:
+            if self._state == HALF_OPEN:
+                self._state = OPEN
+
+    def _transition(self, state: str) -> None:
+        logger.info("Circuit breaker state change", breaker=self.name, old=self._state, new=state)
+        self._state = state
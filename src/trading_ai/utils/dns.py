@@ -5,7 +5,12 @@ from __future__ import annotations
 import socket
 from threading import Lock
 
+from trading_ai.utils.ttl import TTLCache
+
 _dns_lock = Lock()
+# Short-lived memo of real resolver answers for hosts without an override; entries age out so
+# DNS changes are still picked up.
+_resolved = TTLCache(maxsize=256, ttl=60.0)
 
 
 def apply_dns_override(hostname: str, override_ip: str) -> None:
@@ -38,8 +43,8 @@ def apply_dns_override(hostname: str, override_ip: str) -> None:
                 proto: int = 0,
                 flags: int = 0,
             ):
-                if host in socket._dns_overrides:  # type: ignore[attr-defined]
-                    ip = socket._dns_overrides[host]  # type: ignore[attr-defined]
+                ip = overrides.get(host)
+                if ip is not None:
                     resolved_port = _normalize_port(port)
                     return [
                         (
@@ -50,7 +55,9 @@ def apply_dns_override(hostname: str, override_ip: str) -> None:
                             (ip, resolved_port),
                         )
                     ]
-                return socket._original_getaddrinfo(host, port, family, socktype, proto, flags)  # type: ignore[attr-defined]
+                key = (host, port, family, socktype, proto, flags)
+                # Copy so callers never mutate the cached result list.
+                return list(_resolved.get_or_set(key, lambda: original(*key)))
 
             socket.getaddrinfo = _patched_getaddrinfo  # type: ignore[assignment]
 
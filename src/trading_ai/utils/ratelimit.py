@@ -0,0 +1,61 @@
+"""Client-side token-bucket rate limiting for upstream APIs."""
+
+from __future__ import annotations
+
+import time
+from threading import Lock
+from typing import Callable, Dict
+
+_buckets: Dict[str, "TokenBucket"] = {}
+_buckets_lock = Lock()
+
+
+class TokenBucket:
+    """Thread-safe token bucket refilling at ``rate`` tokens per second up to ``burst``.
+
+    Callers reserve a token under the lock and sleep outside it, so concurrent callers queue
+    up behind each other instead of all waking at once.
+    """
+
+    def __init__(
+        self,
+        rate: float,
+        burst: float = 1.0,
+        *,
+        clock: Callable[[], float] = time.monotonic,
+        sleep: Callable[[float], None] = time.sleep,
+    ) -> None:
+        if rate <= 0 or burst < 1:
+            raise ValueError("rate must be positive and burst at least 1")
+        self.rate = rate
+        self.burst = burst
+        self._clock = clock
+        self._sleep = sleep
+        self._tokens = burst
+        self._updated = clock()
+        self._lock = Lock()
+
+    def acquire(self, timeout: float | None = None) -> bool:
+        """Take one token, waiting for it if needed; False if that wait would exceed ``timeout``."""
+
+        with self._lock:
+            now = self._clock()
+            self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+            self._updated = now
+            wait = 0.0 if self._tokens >= 1 else (1 - self._tokens) / self.rate
+            if timeout is not None and wait > timeout:
+                return False
+            self._tokens -= 1
+        if wait > 0:
+            self._sleep(wait)
+        return True
+
+
+def shared_bucket(host: str, rate: float, burst: float = 1.0) -> TokenBucket:
+    """Return the process-wide bucket for ``host``, creating it on first use."""
+
+    with _buckets_lock:
+        bucket = _buckets.get(host)
+        if bucket is None:
+            bucket = _buckets[host] = TokenBucket(rate, burst)
+        return bucket
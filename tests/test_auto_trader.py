@@ -2,6 +2,9 @@
 
 from __future__ import annotations
 
+import pytest
+
+from trading_ai.service import auto_trader
 from trading_ai.service.auto_trader import AutoTrader, AutoTraderConfig
 from trading_ai.settings import Settings
 from trading_ai.strategies.momentum_iv import MomentumIVStrategy
@@ -24,15 +27,13 @@ class DummyAlpaca:
         return "order-xyz"
 
 
-def build_settings(monkeypatch):
-    monkeypatch.setenv("ALPACA_API_KEY_ID", "key")
-    monkeypatch.setenv("ALPACA_API_SECRET_KEY", "secret")
-    monkeypatch.setenv("POLYGON_API_KEY", "polygon")
-    return Settings()
+@pytest.fixture(scope="session")
+def settings() -> Settings:
+    # Built once from init kwargs (by alias) rather than by round-tripping the environment.
+    return Settings(ALPACA_API_KEY_ID="key", ALPACA_API_SECRET_KEY="secret", POLYGON_API_KEY="polygon")
 
 
-def test_auto_trader_builds_intent_from_snapshot(monkeypatch, tmp_path):
-    settings = build_settings(monkeypatch)
+def test_auto_trader_builds_intent_from_snapshot(tmp_path, settings):
     snapshot = {
         "AAPL": {
             "underlying_bars": [
@@ -83,11 +84,11 @@ def test_auto_trader_builds_intent_from_snapshot(monkeypatch, tmp_path):
     assert len(intents) == 1
     assert intents[0].option_symbol == "AAPL240118C00100000"
     assert intents[0].direction == "CALL"
+    assert intents[0].metadata["option_agg_volume"] == 100.0
     assert (tmp_path / "auto.log").exists()
 
 
-def test_auto_trader_calls_live_path(monkeypatch, tmp_path):
-    settings = build_settings(monkeypatch)
+def test_auto_trader_calls_live_path(tmp_path, settings):
     snapshot = {
         "AAPL": {
             "underlying_bars": [
@@ -127,8 +128,7 @@ def test_auto_trader_calls_live_path(monkeypatch, tmp_path):
     assert alpaca.calls[0]["symbol"] == "CHAIN"
 
 
-def test_auto_trader_respects_option_aggregate_threshold(monkeypatch, tmp_path):
-    settings = build_settings(monkeypatch)
+def test_auto_trader_respects_option_aggregate_threshold(tmp_path, settings):
     snapshot = {
         "AAPL": {
             "underlying_bars": [
@@ -169,8 +169,7 @@ def test_auto_trader_respects_option_aggregate_threshold(monkeypatch, tmp_path):
     assert len(intents) == 0
 
 
-def test_auto_trader_respects_option_agg_vwap(monkeypatch, tmp_path):
-    settings = build_settings(monkeypatch)
+def test_auto_trader_respects_option_agg_vwap(tmp_path, settings):
     snapshot = {
         "AAPL": {
             "underlying_bars": [
@@ -207,3 +206,36 @@ def test_auto_trader_respects_option_agg_vwap(monkeypatch, tmp_path):
     intents = trader.run_once()
 
     assert len(intents) == 0
+
+
+def test_auto_trader_loop_keeps_cadence(monkeypatch, tmp_path, settings):
+    trader = AutoTrader(
+        settings,
+        pipeline=DummyPipeline({}),
+        alpaca_client=DummyAlpaca(),  # type: ignore[arg-type]
+        config=AutoTraderConfig(sleep_seconds=60, log_path=tmp_path / "auto.log"),
+    )
+    clock = [0.0]
+    sleeps = []
+    cycle_costs = iter([5.0, 70.0, 10.0])
+
+    def fake_run_once():
+        try:
+            clock[0] += next(cycle_costs)
+        except StopIteration:
+            raise KeyboardInterrupt from None
+        return []
+
+    def fake_sleep(seconds):
+        sleeps.append(seconds)
+        clock[0] += seconds
+
+    monkeypatch.setattr(trader, "run_once", fake_run_once)
+    monkeypatch.setattr(auto_trader.time, "monotonic", lambda: clock[0])
+    monkeypatch.setattr(auto_trader.time, "sleep", fake_sleep)
+
+    with pytest.raises(KeyboardInterrupt):
+        trader.run_loop()
+
+    # The overrunning second cycle skips its sleep and the schedule restarts from its end.
+    assert sleeps == [55.0, 50.0]
@@ -3,6 +3,12 @@
 import pandas as pd
 import pytest
 
+from trading_ai.backtest.data_loader import (
+    CONTEXT_KEYS,
+    contexts_from_snapshot,
+    load_snapshot_file,
+    write_snapshot_parquet,
+)
 from trading_ai.backtest.engine import BacktestRunner
 from trading_ai.strategies.base import StrategyContext, TradingSignal, TradingStrategy
 
@@ -18,6 +24,15 @@ class AlwaysCallStrategy(TradingStrategy):
         )
 
 
+class CountingCallStrategy(AlwaysCallStrategy):
+    def __init__(self) -> None:
+        self.calls = 0
+
+    def generate_signal(self, context: StrategyContext) -> TradingSignal:
+        self.calls += 1
+        return super().generate_signal(context)
+
+
 class AlwaysPutStrategy(TradingStrategy):
     name = "always_put"
 
@@ -91,3 +106,127 @@ def test_backtest_runner_puts_gain_when_underlying_falls() -> None:
 
     trade = result.trades[0]
     assert trade.exit_price > trade.entry_price
+
+
+def test_contexts_from_snapshot_keeps_raw_bars_lazy() -> None:
+    snapshot = {
+        "AAPL": {
+            "underlying_bars": [{"timestamp": 1, "close": 100.0}, {"timestamp": 2, "close": 103.0}],
+            "option_quote": {"CALL": {"bid": 1.0, "ask": 1.2}},
+        }
+    }
+
+    (context,) = contexts_from_snapshot(snapshot)
+
+    assert isinstance(context.underlying_bars, list)
+    assert context.underlying_close.tolist() == [100.0, 103.0]
+    assert context.bars_frame()["close"].iloc[-1] == 103.0
+
+    result = BacktestRunner(strategy=AlwaysCallStrategy()).run([context])
+    assert result.trades[0].exit_price > result.trades[0].entry_price
+
+
+def test_backtest_runner_reuses_cached_signals_across_runs() -> None:
+    context = StrategyContext(
+        ticker="AAPL",
+        underlying_bars=pd.DataFrame({"close": [100.0, 101.0]}),
+        option_chain={},
+        option_metrics={},
+        option_quote={"CALL": {"bid": 1.0, "ask": 2.0}},
+        news_items=[],
+        features={},
+    )
+    strategy = CountingCallStrategy()
+    runner = BacktestRunner(strategy=strategy, cache_signals=True)
+
+    first = runner.run([context])
+    runner.config.commission_per_contract = 0.0
+    second = runner.run([context])
+
+    assert strategy.calls == 1
+    assert second.trades[0].pnl > first.trades[0].pnl
+
+    runner.clear_signal_cache()
+    runner.run([context])
+    assert strategy.calls == 2
+
+
+def test_backtest_runner_skips_repeated_contexts_within_a_run() -> None:
+    def make_context(quote_ask: float) -> StrategyContext:
+        return StrategyContext(
+            ticker="AAPL",
+            underlying_bars=[{"close": 100.0}, {"close": 101.0}],
+            option_chain={},
+            option_metrics={},
+            option_quote={"CALL": {"bid": 1.0, "ask": quote_ask}},
+            news_items=[],
+            features={},
+        )
+
+    strategy = CountingCallStrategy()
+    runner = BacktestRunner(strategy=strategy, cache_signals=True)
+
+    result = runner.run([make_context(2.0), make_context(2.0), make_context(2.2), make_context(2.0)])
+
+    assert strategy.calls == 2
+    assert result.stats["num_trades"] == 4
+
+
+def test_backtest_runner_signal_cache_keeps_distinct_contexts_apart() -> None:
+    def make_context(features=None, volume=10, news_items=()) -> StrategyContext:
+        return StrategyContext(
+            ticker="AAPL",
+            underlying_bars=pd.DataFrame({"close": [100.0, 101.0], "volume": [10, volume]}),
+            option_chain={},
+            option_metrics={},
+            option_quote={"CALL": {"bid": 1.0, "ask": 2.0}},
+            news_items=list(news_items),
+            features=features or {},
+        )
+
+    strategy = CountingCallStrategy()
+    runner = BacktestRunner(strategy=strategy, cache_signals=True)
+
+    runner.run(
+        [
+            make_context({"momentum_15": None}),
+            make_context({"momentum_15": float("nan")}),
+            make_context(volume=20),
+            make_context(),
+        ]
+    )
+    assert strategy.calls == 4
+
+    # Values orjson cannot encode natively bypass the cache instead of being hashed by repr.
+    timestamped = make_context(news_items=[{"published": pd.Timestamp("2025-11-06")}])
+    runner.run([timestamped, timestamped])
+    assert strategy.calls == 6
+
+
+def test_contexts_from_snapshot_accepts_column_layout() -> None:
+    snapshot = {"AAPL": {"underlying_bars": {"timestamp": [1, 2], "close": [100.0, 98.0]}}}
+
+    (context,) = contexts_from_snapshot(snapshot)
+
+    assert context.underlying_close.tolist() == [100.0, 98.0]
+    assert list(context.bars_frame()["close"]) == [100.0, 98.0]
+
+
+def test_parquet_snapshot_round_trip(tmp_path) -> None:
+    bars = pd.DataFrame({"close": [100.0, 101.0, 102.5], "volume": [10, 20, 30]})
+    snapshot = {
+        "SPY": {
+            "underlying_bars": bars,
+            "option_quote": {"bid": 1.0, "ask": 1.2},
+            "news": [{"title": "headline"}],
+            "collected_at": "2024-01-01T00:00:00",
+        }
+    }
+
+    bundle = write_snapshot_parquet(snapshot, tmp_path / "snapshots")
+    loaded = load_snapshot_file(bundle, keys=CONTEXT_KEYS)
+
+    assert set(loaded["SPY"]) == {"underlying_bars", "option_quote", "news"}
+    pd.testing.assert_frame_equal(loaded["SPY"]["underlying_bars"], bars, check_dtype=False)
+    context = contexts_from_snapshot(loaded)[0]
+    assert context.underlying_close.tolist() == [100.0, 101.0, 102.5]
@@ -1,11 +1,13 @@
-"""Tests for LocalDataCache."""
+"""Tests for LocalDataCache and the in-process TTL cache."""
 
+import os
 from pathlib import Path
 
 import pandas as pd
 import pytest
 
 from trading_ai.data.cache import LocalDataCache
+from trading_ai.utils.ttl import TTLCache
 
 
 def test_local_data_cache_json_roundtrip(tmp_path: Path) -> None:
@@ -29,6 +31,20 @@ def test_local_data_cache_dataframe_roundtrip(tmp_path: Path) -> None:
     pd.testing.assert_frame_equal(reloaded, frame)
 
 
+def test_local_data_cache_dataframe_roundtrip_keeps_utc_timestamps(tmp_path: Path) -> None:
+    cache = LocalDataCache(root=tmp_path / "cache", memory_ttl=0)
+    frame = pd.DataFrame(
+        {"timestamp": pd.to_datetime(["2025-11-06T12:30:00Z", "2025-11-06T12:31:00Z"]), "close": [1.0, 2.0]}
+    )
+
+    cache.write_dataframe(frame, "alpaca", "bars", "AAPL")
+    reloaded = cache.read_dataframe("alpaca", "bars", "AAPL")
+
+    # A cache hit must match a fresh fetch: UTC at ns resolution, whatever the host zone.
+    assert str(reloaded["timestamp"].dtype) == "datetime64[ns, UTC]"
+    pd.testing.assert_frame_equal(reloaded, frame)
+
+
 def test_local_data_cache_remove(tmp_path: Path) -> None:
     cache = LocalDataCache(root=tmp_path / "cache")
     cache.write_json({"foo": "bar"}, "alpaca", "delete-me")
@@ -41,3 +57,59 @@ def test_write_dataframe_raises_on_empty_frame(tmp_path: Path) -> None:
     cache = LocalDataCache(root=tmp_path / "cache")
     with pytest.raises(ValueError):
         cache.write_dataframe(pd.DataFrame(), "alpaca", "empty")
+
+
+def test_ttl_cache_expires_and_evicts_least_recent() -> None:
+    now = [0.0]
+    cache = TTLCache(maxsize=2, ttl=10.0, clock=lambda: now[0])
+
+    cache.set("a", 1)
+    cache.set("b", 2)
+    assert cache.get("a") == 1  # refreshes "a", so "b" is evicted next
+    cache.set("c", 3)
+    assert cache.get("b") is None
+    assert cache.get_or_set("a", lambda: 99) == 1
+
+    now[0] = 10.0
+    assert cache.get("a") is None
+    assert cache.get_or_set("a", lambda: 99) == 99
+
+
+def test_local_data_cache_memoises_reads_until_written(tmp_path: Path) -> None:
+    cache = LocalDataCache(root=tmp_path / "cache")
+    frame = pd.DataFrame({"ticker": ["AAPL"], "close": [150.0]})
+    path = cache.write_dataframe(frame, "bars", "AAPL")
+    cache.write_json({"v": 1}, "meta")
+
+    first = cache.read_dataframe("bars", "AAPL")
+    first["extra"] = 1.0
+    assert cache.read_json("meta") == {"v": 1}
+    path.unlink()
+
+    # Served from memory without touching the deleted file, and unaffected by the mutation.
+    assert cache.exists("bars", "AAPL", suffix=".parquet")
+    pd.testing.assert_frame_equal(cache.read_dataframe("bars", "AAPL"), frame)
+
+    cache.write_json({"v": 2}, "meta")
+    assert cache.read_json("meta") == {"v": 2}
+
+
+def test_local_data_cache_skips_identical_json_writes(tmp_path: Path) -> None:
+    cache = LocalDataCache(root=tmp_path / "cache")
+    path = cache.write_json({"v": 1}, "meta")
+    os.utime(path, (0, 0))
+
+    cache.write_json({"v": 1}, "meta")
+    assert path.stat().st_mtime == 0
+
+    cache.write_json({"v": 2}, "meta")
+    assert path.stat().st_mtime > 0
+    assert [p.name for p in path.parent.iterdir()] == ["meta.json"]
+
+
+def test_local_data_cache_try_read_json_returns_none_when_missing(tmp_path: Path) -> None:
+    cache = LocalDataCache(root=tmp_path / "cache")
+    assert cache.try_read_json("missing") is None
+
+    cache.write_json([1, 2], "present")
+    assert cache.try_read_json("present") == [1, 2]
@@ -0,0 +1,162 @@
+"""Tests for REST client plumbing shared through BaseClient."""
+
+from datetime import datetime, timedelta, timezone
+from typing import Any, Dict, List
+
+import orjson
+import pytest
+import requests
+
+from trading_ai.clients import base
+from trading_ai.clients.base import BaseClient, RateLimitExceeded
+from trading_ai.clients.marketaux_client import MarketauxClient
+from trading_ai.clients.yahoo_client import YahooNewsClient
+from trading_ai.utils.ratelimit import TokenBucket
+
+
+class DummyResponse:
+    status_code = 200
+
+    def __init__(self, payload: Dict[str, Any]) -> None:
+        self._payload = payload
+
+    def raise_for_status(self) -> None:
+        return None
+
+    @property
+    def content(self) -> bytes:
+        return orjson.dumps(self._payload)
+
+
+class DummySession:
+    def __init__(self, response: Any = None) -> None:
+        self.calls: List[Dict[str, Any]] = []
+        self._response = response or DummyResponse(
+            {"data": [{"title": "Headline", "url": "http://example.com/a", "entities": []}]}
+        )
+
+    def get(self, url: str, params: Dict[str, Any] | None = None, timeout: float | None = None) -> Any:
+        self.calls.append({"url": url, "params": params})
+        return self._response
+
+
+def test_marketaux_client_caches_repeat_headline_requests() -> None:
+    client = MarketauxClient(api_token="token")
+    session = DummySession()
+    client._session = session  # type: ignore[assignment]
+
+    first = client.fetch_headlines("AAPL", limit=5)
+    first[0]["title"] = "mutated"
+    second = client.fetch_headlines("AAPL", limit=5)
+    client.fetch_headlines("MSFT", limit=5)
+
+    assert len(session.calls) == 2
+    assert second[0]["title"] == "Headline"
+
+
+def test_marketaux_client_cache_hits_across_sliding_lookback_windows() -> None:
+    client = MarketauxClient(api_token="token")
+    session = DummySession()
+    client._session = session  # type: ignore[assignment]
+    now = datetime(2025, 11, 6, 15, 30, 5, 123456, tzinfo=timezone.utc)
+
+    # The collector passes ``now - lookback`` at microsecond precision on every snapshot.
+    client.fetch_headlines("AAPL", since=now - timedelta(hours=6), limit=5)
+    client.fetch_headlines("AAPL", since=now + timedelta(seconds=20) - timedelta(hours=6), limit=5)
+    client.fetch_headlines("AAPL", since=now + timedelta(minutes=1) - timedelta(hours=6), limit=5)
+
+    assert len(session.calls) == 2
+    assert session.calls[0]["params"]["published_after"] == "2025-11-06T09:30:00+00:00"
+
+
+def test_yahoo_client_parses_feed_fetched_through_session() -> None:
+    feed = (
+        b"<?xml version='1.0'?><rss version='2.0'><channel><title>AAPL</title>"
+        b"<item><title>Apple headline</title><link>http://example.com/apple</link></item>"
+        b"</channel></rss>"
+    )
+    response = requests.Response()
+    response.status_code = 200
+    response._content = feed
+    session = DummySession(response)
+    client = YahooNewsClient()
+    client._session = session  # type: ignore[assignment]
+
+    entries = client.fetch_headlines("AAPL", limit=5)
+    client.fetch_headlines("AAPL", limit=1)
+
+    assert [entry["title"] for entry in entries] == ["Apple headline"]
+    assert len(session.calls) == 1
+
+
+def test_request_with_retry_backs_off_on_rate_limit(monkeypatch) -> None:
+    sleeps: List[float] = []
+    monkeypatch.setattr(base.time, "sleep", sleeps.append)
+    responses = iter([429, 503, 200])
+
+    def send() -> requests.Response:
+        response = requests.Response()
+        response.status_code = next(responses)
+        if response.status_code == 429:
+            response.headers["Retry-After"] = "2"
+        return response
+
+    client = BaseClient("dummy")
+    response = client._request_with_retry(send, base_delay=1.0, jitter=0.0)
+
+    assert response.status_code == 200
+    assert sleeps == [2.0, 2.0]
+
+
+def test_request_with_retry_raises_after_exhausting_retries(monkeypatch) -> None:
+    monkeypatch.setattr(base.time, "sleep", lambda _: None)
+
+    def send() -> requests.Response:
+        response = requests.Response()
+        response.status_code = 503
+        return response
+
+    with pytest.raises(requests.HTTPError):
+        BaseClient("dummy")._request_with_retry(send, max_retries=2)
+
+
+def test_request_with_retry_retries_connect_but_not_read_timeouts(monkeypatch) -> None:
+    monkeypatch.setattr(base.time, "sleep", lambda _: None)
+    attempts: List[type] = []
+
+    def failing(error: type):
+        def send() -> requests.Response:
+            attempts.append(error)
+            raise error()
+
+        return send
+
+    client = BaseClient("dummy")
+    with pytest.raises(requests.ConnectTimeout):
+        client._request_with_retry(failing(requests.ConnectTimeout), max_retries=2)
+    with pytest.raises(requests.ReadTimeout):
+        client._request_with_retry(failing(requests.ReadTimeout), max_retries=2)
+
+    assert attempts == [requests.ConnectTimeout] * 3 + [requests.ReadTimeout]
+
+
+def test_token_bucket_paces_requests_and_fails_fast_past_timeout() -> None:
+    now = [0.0]
+    sleeps: List[float] = []
+
+    def sleep(seconds: float) -> None:
+        sleeps.append(seconds)
+        now[0] += seconds
+
+    bucket = TokenBucket(rate=0.5, burst=2, clock=lambda: now[0], sleep=sleep)
+
+    assert bucket.acquire() and bucket.acquire()
+    assert bucket.acquire()  # burst spent: waits two seconds for the next token
+    assert sleeps == [2.0]
+    assert not bucket.acquire(timeout=1.0)
+
+    client = BaseClient("dummy")
+    client._rate_limiter = bucket
+    client._rate_limit_wait = 1.0
+    with pytest.raises(RateLimitExceeded):
+        client._request_with_retry(requests.Response)
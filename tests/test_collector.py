@@ -1,15 +1,37 @@
 """Tests for MarketDataCollector caching behaviour."""
 
-from datetime import datetime, timedelta
+from datetime import datetime, timedelta, timezone
 from typing import Any, Dict, Iterable, List
 
 import pandas as pd
 import pytest
 
+from trading_ai.clients.base import APIClientError
 from trading_ai.core.collector import MarketDataCollector
 from trading_ai.data.cache import LocalDataCache
 from trading_ai.settings import Settings
 
+# Shared, read-only provider payloads; the collector copies rather than mutates what providers return.
+_BARS_FRAME = pd.DataFrame({"timestamp": [1, 2, 3], "close": [100.0, 101.0, 102.0]})
+_OPTION_CHAIN: Dict[str, Dict[str, Any]] = {
+    "AAPL251107C00100000": {
+        "symbol": "AAPL251107C00100000",
+        "latest_quote": {"bid_price": 1.2, "ask_price": 1.4},
+    },
+    "AAPL251107C00110000": {
+        "symbol": "AAPL251107C00110000",
+        "latest_quote": {"bid_price": 0.9, "ask_price": 1.05},
+    },
+    "AAPL251107P00100000": {
+        "symbol": "AAPL251107P00100000",
+        "latest_quote": {"bid_price": 0.8, "ask_price": 0.95},
+    },
+    "AAPL251107P00110000": {
+        "symbol": "AAPL251107P00110000",
+        "latest_quote": {"bid_price": 1.4, "ask_price": 1.55},
+    },
+}
+
 
 class DummyBars:
     def __init__(self, df: pd.DataFrame) -> None:
@@ -20,32 +42,19 @@ class DummyAlpaca:
     def __init__(self) -> None:
         self.bar_calls = 0
         self.chain_calls = 0
+        self.batch_calls: List[List[str]] = []
 
     def fetch_underlying_bars(self, **_: Any) -> DummyBars:
         self.bar_calls += 1
-        frame = pd.DataFrame({"timestamp": [1, 2, 3], "close": [100.0, 101.0, 102.0]})
-        return DummyBars(frame)
+        return DummyBars(_BARS_FRAME)
+
+    def fetch_underlying_bars_batch(self, symbols: List[str], **_: Any) -> Dict[str, pd.DataFrame]:
+        self.batch_calls.append(list(symbols))
+        return {symbol: _BARS_FRAME.assign(symbol=symbol) for symbol in symbols}
 
     def fetch_option_chain(self, **_: Any) -> Dict[str, Dict[str, Any]]:
         self.chain_calls += 1
-        return {
-            "AAPL251107C00100000": {
-                "symbol": "AAPL251107C00100000",
-                "latest_quote": {"bid_price": 1.2, "ask_price": 1.4},
-            },
-            "AAPL251107C00110000": {
-                "symbol": "AAPL251107C00110000",
-                "latest_quote": {"bid_price": 0.9, "ask_price": 1.05},
-            },
-            "AAPL251107P00100000": {
-                "symbol": "AAPL251107P00100000",
-                "latest_quote": {"bid_price": 0.8, "ask_price": 0.95},
-            },
-            "AAPL251107P00110000": {
-                "symbol": "AAPL251107P00110000",
-                "latest_quote": {"bid_price": 1.4, "ask_price": 1.55},
-            },
-        }
+        return _OPTION_CHAIN
 
     def fetch_latest_trade(self, **_: Any) -> Dict[str, Any]:
         return {"trade": {"timestamp": "2025-11-06T16:00:00Z", "price": 101.0, "size": 5}}
@@ -124,6 +133,17 @@ class EmptyBarsAlpaca(DummyAlpaca):
         self.trade_calls += 1
         return {"trade": {"timestamp": "2025-11-06T16:05:00Z", "price": 100.5, "size": 10}}
 
+    def fetch_underlying_bars_batch(self, symbols: List[str], **_: Any) -> Dict[str, pd.DataFrame]:
+        self.batch_calls.append(list(symbols))
+        return {symbol: pd.DataFrame() for symbol in symbols}
+
+    def fetch_latest_trades(self, symbols: List[str]) -> Dict[str, Any]:
+        self.batch_calls.append(list(symbols))
+        return {
+            symbol: {"timestamp": "2025-11-06T16:05:00Z", "price": 100.5 + index, "size": 10}
+            for index, symbol in enumerate(symbols)
+        }
+
 
 class EmptyPolygon(DummyPolygon):
     def fetch_equity_bars(self, **_: Any) -> Iterable[Dict[str, Any]]:
@@ -131,26 +151,34 @@ class EmptyPolygon(DummyPolygon):
         return []
 
 
-def build_settings(monkeypatch: pytest.MonkeyPatch, *, use_polygon_bars: bool = True) -> Settings:
-    monkeypatch.setenv("ALPACA_API_KEY_ID", "key")
-    monkeypatch.setenv("ALPACA_API_SECRET_KEY", "secret")
-    monkeypatch.setenv("POLYGON_API_KEY", "polygon")
-    monkeypatch.setenv("NEWS_API_KEY", "news")
-    monkeypatch.setenv("NEWS_SECRET_KEY", "secret")
-    monkeypatch.setenv("TARGET_TICKERS", '["AAPL"]')
-    monkeypatch.setenv("USE_POLYGON_BARS", "1" if use_polygon_bars else "0")
-    return Settings()
+@pytest.fixture(scope="session")
+def base_settings() -> Settings:
+    # Built from init kwargs (by alias) so nothing goes through os.environ or JSON decoding;
+    # tests that need other values derive them with model_copy().
+    return Settings(
+        ALPACA_API_KEY_ID="key",
+        ALPACA_API_SECRET_KEY="secret",
+        POLYGON_API_KEY="polygon",
+        NEWS_API_KEY="news",
+        NEWS_SECRET_KEY="secret",
+        TARGET_TICKERS=["AAPL"],
+        USE_POLYGON_BARS=True,
+    )
+
+
+@pytest.fixture(scope="session")
+def settings_no_polygon_bars(base_settings: Settings) -> Settings:
+    return base_settings.model_copy(update={"use_polygon_bars": False})
 
 
-def test_market_data_collector_uses_cache(tmp_path, monkeypatch: pytest.MonkeyPatch) -> None:
-    settings = build_settings(monkeypatch)
+def test_market_data_collector_uses_cache(tmp_path, base_settings: Settings) -> None:
     cache = LocalDataCache(root=tmp_path / "cache")
     alpaca = DummyAlpaca()
     polygon = DummyPolygon()
     aggregator = DummyAggregator()
 
     collector = MarketDataCollector(
-        settings,
+        base_settings,
         cache=cache,
         alpaca_client=alpaca,  # type: ignore[arg-type]
         polygon_client=polygon,  # type: ignore[arg-type]
@@ -186,11 +214,10 @@ def test_market_data_collector_uses_cache(tmp_path, monkeypatch: pytest.MonkeyPa
     assert len(result_second["AAPL"]["news"]) == 1  # cached stories
 
 
-def test_market_data_collector_selects_reference_quotes(tmp_path, monkeypatch: pytest.MonkeyPatch) -> None:
-    settings = build_settings(monkeypatch)
+def test_market_data_collector_selects_reference_quotes(tmp_path, base_settings: Settings) -> None:
     cache = LocalDataCache(root=tmp_path / "cache")
     collector = MarketDataCollector(
-        settings,
+        base_settings,
         cache=cache,
         alpaca_client=DummyAlpaca(),  # type: ignore[arg-type]
         polygon_client=DummyPolygon(),  # type: ignore[arg-type]
@@ -211,13 +238,12 @@ def test_market_data_collector_selects_reference_quotes(tmp_path, monkeypatch: p
     assert quotes["PUT"]["symbol"].endswith("P00100000")
 
 
-def test_market_data_collector_falls_back_to_latest_trade(tmp_path, monkeypatch: pytest.MonkeyPatch) -> None:
-    settings = build_settings(monkeypatch, use_polygon_bars=False)
+def test_market_data_collector_falls_back_to_latest_trade(tmp_path, settings_no_polygon_bars: Settings) -> None:
     cache = LocalDataCache(root=tmp_path / "cache")
     alpaca = EmptyBarsAlpaca()
     polygon = EmptyPolygon()
     collector = MarketDataCollector(
-        settings,
+        settings_no_polygon_bars,
         cache=cache,
         alpaca_client=alpaca,  # type: ignore[arg-type]
         polygon_client=polygon,  # type: ignore[arg-type]
@@ -238,11 +264,10 @@ def test_market_data_collector_falls_back_to_latest_trade(tmp_path, monkeypatch:
     assert alpaca.trade_calls == 1
 
 
-def test_market_data_collector_collects_option_metrics(tmp_path, monkeypatch: pytest.MonkeyPatch) -> None:
-    settings = build_settings(monkeypatch)
+def test_market_data_collector_collects_option_metrics(tmp_path, base_settings: Settings) -> None:
     cache = LocalDataCache(root=tmp_path / "cache")
     collector = MarketDataCollector(
-        settings,
+        base_settings,
         cache=cache,
         alpaca_client=DummyAlpaca(),  # type: ignore[arg-type]
         polygon_client=DummyPolygon(),  # type: ignore[arg-type]
@@ -262,12 +287,11 @@ def test_market_data_collector_collects_option_metrics(tmp_path, monkeypatch: py
     assert metrics["AAPL251107C00100000"]["implied_volatility"] == pytest.approx(0.25)
 
 
-def test_market_data_collector_fetches_option_aggregates(tmp_path, monkeypatch: pytest.MonkeyPatch) -> None:
-    settings = build_settings(monkeypatch)
+def test_market_data_collector_fetches_option_aggregates(tmp_path, base_settings: Settings) -> None:
     cache = LocalDataCache(root=tmp_path / "cache")
     polygon = DummyPolygon()
     collector = MarketDataCollector(
-        settings,
+        base_settings,
         cache=cache,
         alpaca_client=DummyAlpaca(),  # type: ignore[arg-type]
         polygon_client=polygon,  # type: ignore[arg-type]
@@ -286,3 +310,196 @@ def test_market_data_collector_fetches_option_aggregates(tmp_path, monkeypatch:
     assert "CALL" in aggs
     assert aggs["CALL"][0]["close"] == pytest.approx(1.1)
     assert polygon.agg_calls >= 1
+
+
+def test_market_data_collector_batches_alpaca_bars(tmp_path, settings_no_polygon_bars: Settings) -> None:
+    cache = LocalDataCache(root=tmp_path / "cache")
+    alpaca = DummyAlpaca()
+    collector = MarketDataCollector(
+        settings_no_polygon_bars,
+        cache=cache,
+        alpaca_client=alpaca,  # type: ignore[arg-type]
+        polygon_client=DummyPolygon(),  # type: ignore[arg-type]
+        aggregator=DummyAggregator(),  # type: ignore[arg-type]
+    )
+
+    result = collector.collect_market_snapshot(
+        tickers=["AAPL", "MSFT"],
+        lookback=timedelta(hours=1),
+        news_lookback=timedelta(minutes=30),
+        timeframe="1Min",
+        include_news=False,
+    )
+
+    assert alpaca.batch_calls == [["AAPL", "MSFT"]]
+    assert alpaca.bar_calls == 0
+    assert result["MSFT"]["underlying_bars"]["symbol"].tolist() == ["MSFT"] * 3
+
+
+def test_market_data_collector_batches_latest_trade_fallback(tmp_path, settings_no_polygon_bars: Settings) -> None:
+    cache = LocalDataCache(root=tmp_path / "cache")
+    alpaca = EmptyBarsAlpaca()
+    collector = MarketDataCollector(
+        settings_no_polygon_bars,
+        cache=cache,
+        alpaca_client=alpaca,  # type: ignore[arg-type]
+        polygon_client=EmptyPolygon(),  # type: ignore[arg-type]
+        aggregator=DummyAggregator(),  # type: ignore[arg-type]
+    )
+
+    result = collector.collect_market_snapshot(
+        tickers=["AAPL", "MSFT"],
+        lookback=timedelta(hours=1),
+        news_lookback=timedelta(minutes=30),
+        timeframe="1Min",
+        use_cache=False,
+        include_news=False,
+    )
+
+    assert alpaca.batch_calls == [["AAPL", "MSFT"], ["AAPL", "MSFT"]]
+    assert alpaca.trade_calls == 0
+    assert result["MSFT"]["underlying_bars"].iloc[0]["close"] == pytest.approx(101.5)
+
+
+class WindowAlpaca(DummyAlpaca):
+    """Returns one bar per minute of the requested window and records each window."""
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.windows: List[tuple] = []
+
+    def fetch_underlying_bars(self, *, start: datetime, end: datetime, **_: Any) -> DummyBars:
+        self.bar_calls += 1
+        self.windows.append((start, end))
+        stamps = pd.date_range(start.replace(second=0, microsecond=0), end, freq="1min")
+        return DummyBars(pd.DataFrame({"timestamp": stamps, "close": [float(s.minute) for s in stamps]}))
+
+
+def test_market_data_collector_fetches_only_new_bars(tmp_path, settings_no_polygon_bars: Settings) -> None:
+    alpaca = WindowAlpaca()
+    collector = MarketDataCollector(
+        settings_no_polygon_bars,
+        cache=LocalDataCache(root=tmp_path / "cache"),
+        alpaca_client=alpaca,  # type: ignore[arg-type]
+        polygon_client=EmptyPolygon(),  # type: ignore[arg-type]
+        aggregator=DummyAggregator(),  # type: ignore[arg-type]
+    )
+    end = datetime(2025, 11, 6, 15, 0, tzinfo=timezone.utc)
+
+    first = collector.collect_underlying_bars("AAPL", start=end - timedelta(hours=1), end=end)
+    later = end + timedelta(minutes=10)
+    second = collector.collect_underlying_bars("AAPL", start=later - timedelta(hours=1), end=later)
+    third = collector.collect_underlying_bars("AAPL", start=later - timedelta(hours=1), end=later)
+
+    assert len(first) == 61
+    assert alpaca.windows[1] == (end - timedelta(minutes=1), later)
+    assert alpaca.bar_calls == 2  # third call is served from the store
+    assert len(second) == 61
+    assert second["timestamp"].is_monotonic_increasing
+    assert second["timestamp"].is_unique
+    assert third["close"].tolist() == second["close"].tolist()
+
+
+def test_market_data_collector_computes_features_with_bars(tmp_path, base_settings: Settings) -> None:
+    collector = MarketDataCollector(
+        base_settings,
+        cache=LocalDataCache(root=tmp_path / "cache"),
+        alpaca_client=DummyAlpaca(),  # type: ignore[arg-type]
+        polygon_client=DummyPolygon(),  # type: ignore[arg-type]
+        aggregator=DummyAggregator(),  # type: ignore[arg-type]
+    )
+
+    result = collector.collect_market_snapshot(
+        tickers=["AAPL", "MSFT"],
+        lookback=timedelta(hours=1),
+        news_lookback=timedelta(minutes=30),
+        use_cache=False,
+        include_news=False,
+        features=lambda bars: {"rows": len(bars)},
+    )
+
+    assert result["AAPL"]["features"] == {"rows": 1}
+    assert result["MSFT"]["features"] == {"rows": 1}
+
+
+def test_market_data_collector_skips_news_clients_when_disabled(
+    tmp_path, monkeypatch: pytest.MonkeyPatch, base_settings: Settings
+) -> None:
+    monkeypatch.setattr("trading_ai.core.collector.YahooNewsClient", lambda: pytest.fail("built news client"))
+    collector = MarketDataCollector(
+        base_settings.model_copy(update={"enable_news": False}),
+        cache=LocalDataCache(root=tmp_path / "cache"),
+        alpaca_client=DummyAlpaca(),  # type: ignore[arg-type]
+        polygon_client=DummyPolygon(),  # type: ignore[arg-type]
+    )
+
+    assert collector.collect_news("AAPL", since=datetime(2025, 1, 1)) == []
+    assert collector.aggregator.providers == []
+
+
+def test_market_data_collector_refetches_gap_after_failed_top_up(tmp_path, settings_no_polygon_bars: Settings) -> None:
+    alpaca = WindowAlpaca()
+    collector = MarketDataCollector(
+        settings_no_polygon_bars,
+        cache=LocalDataCache(root=tmp_path / "cache"),
+        alpaca_client=alpaca,  # type: ignore[arg-type]
+        polygon_client=EmptyPolygon(),  # type: ignore[arg-type]
+        aggregator=DummyAggregator(),  # type: ignore[arg-type]
+    )
+    end = datetime(2025, 11, 6, 15, 0, tzinfo=timezone.utc)
+    collector.collect_underlying_bars("AAPL", start=end - timedelta(hours=1), end=end)
+
+    def unavailable(**_: Any) -> DummyBars:
+        raise APIClientError("Alpaca outage")
+
+    alpaca.fetch_underlying_bars = unavailable  # type: ignore[method-assign]
+    outage = end + timedelta(minutes=5)
+    during = collector.collect_underlying_bars("AAPL", start=outage - timedelta(hours=1), end=outage)
+    del alpaca.fetch_underlying_bars
+
+    later = end + timedelta(minutes=10)
+    after = collector.collect_underlying_bars("AAPL", start=later - timedelta(hours=1), end=later)
+
+    assert len(during) == 56  # stored bars only; the outage window is not recorded as covered
+    assert alpaca.windows[-1] == (end - timedelta(minutes=1), later)
+    assert len(after) == 61
+    assert after["timestamp"].is_unique
+
+
+class WindowPolygon(EmptyPolygon):
+    """Returns epoch-millisecond bars for each minute of the window until ``fail`` is set."""
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.fail = False
+
+    def fetch_equity_bars(self, *, start: datetime, end: datetime, **_: Any) -> Iterable[Dict[str, Any]]:
+        self.bar_calls += 1
+        if self.fail:
+            raise APIClientError("Polygon unauthorized")
+        stamps = pd.date_range(start.replace(second=0, microsecond=0), end, freq="1min")
+        return [{"timestamp": int(s.timestamp() * 1000), "close": float(s.minute)} for s in stamps]
+
+
+def test_market_data_collector_refetches_full_window_after_provider_switch(
+    tmp_path, base_settings: Settings
+) -> None:
+    alpaca = WindowAlpaca()
+    polygon = WindowPolygon()
+    collector = MarketDataCollector(
+        base_settings,
+        cache=LocalDataCache(root=tmp_path / "cache"),
+        alpaca_client=alpaca,  # type: ignore[arg-type]
+        polygon_client=polygon,  # type: ignore[arg-type]
+        aggregator=DummyAggregator(),  # type: ignore[arg-type]
+    )
+    end = datetime(2025, 11, 6, 15, 0, tzinfo=timezone.utc)
+    collector.collect_underlying_bars("AAPL", start=end - timedelta(hours=1), end=end)
+
+    polygon.fail = True  # flips the collector to Alpaca mid-run
+    later = end + timedelta(minutes=10)
+    bars = collector.collect_underlying_bars("AAPL", start=later - timedelta(hours=1), end=later)
+
+    assert not collector.use_polygon_bars
+    assert alpaca.windows == [(end - timedelta(minutes=1), later), (later - timedelta(hours=1), later)]
+    assert len(bars) == 61
@@ -0,0 +1,54 @@
+"""Tests for SnapshotStore ingestion."""
+
+from pathlib import Path
+
+import pandas as pd
+
+from trading_ai.data.duckdb_store import SnapshotStore
+
+
+def build_snapshot() -> dict:
+    bars = pd.DataFrame(
+        {
+            "timestamp": ["2025-11-06T15:00:00Z", "2025-11-06T15:01:00Z"],
+            "open": [100.0, 101.0],
+            "high": [101.0, 102.0],
+            "low": [99.5, 100.5],
+            "close": [100.5, 101.5],
+            "volume": [1000.0, 1200.0],
+        }
+    )
+    return {
+        ticker: {
+            "collected_at": "2025-11-06T15:02:00+00:00",
+            "underlying_bars": bars,
+            "option_chain": {f"{ticker}251107C00100000": {"latest_quote": {"bid_price": 1.2}}},
+            "option_metrics": {f"{ticker}251107C00100000": {"implied_volatility": 0.25}},
+            "news": [{"title": f"{ticker} rallies"}, {"title": f"{ticker} slips", "sentiment": -0.4}],
+        }
+        for ticker in ("AAPL", "MSFT")
+    }
+
+
+def test_snapshot_store_ingests_all_tables(tmp_path: Path) -> None:
+    store = SnapshotStore(tmp_path / "snapshots.duckdb")
+    try:
+        store.ingest_snapshot(build_snapshot())
+
+        counts = {
+            table: store.conn.execute(f"SELECT count(*) FROM {table}").fetchone()[0]
+            for table in ("underlying_bars", "option_chain", "option_metrics", "news_items")
+        }
+        assert counts == {"underlying_bars": 4, "option_chain": 2, "option_metrics": 2, "news_items": 4}
+        titles = store.conn.execute(
+            "SELECT payload->>'title' FROM news_items WHERE ticker = 'MSFT' ORDER BY 1"
+        ).fetchall()
+        assert titles == [("MSFT rallies",), ("MSFT slips",)]
+        iv = store.conn.execute(
+            "SELECT payload->'AAPL251107C00100000'->>'implied_volatility' FROM option_metrics "
+            "WHERE ticker = 'AAPL'"
+        ).fetchone()[0]
+        assert float(iv) == 0.25
+        assert len(store.list_snapshots()) == 2
+    finally:
+        store.close()
@@ -1,8 +1,12 @@
 """Feature engineering tests."""
 
+import numpy as np
 import pandas as pd
 
-from trading_ai.features import compute_intraday_features
+from trading_ai.features import close_features, compute_intraday_features
+
+# Read-only input shared by the tests; float64 up front so pandas has no dtype to infer.
+_CLOSE_FRAME = pd.DataFrame({"close": np.arange(100, 106, dtype=np.float64)})
 
 
 def test_compute_intraday_features_handles_empty() -> None:
@@ -11,7 +15,11 @@ def test_compute_intraday_features_handles_empty() -> None:
 
 
 def test_compute_intraday_features_basic() -> None:
-    data = pd.DataFrame({"close": [100, 101, 102, 103, 104, 105]})
-    features = compute_intraday_features(data)
+    features = compute_intraday_features(_CLOSE_FRAME)
     assert "momentum_15" in features
     assert isinstance(features["volatility"], float)
+
+
+def test_close_features_matches_dataframe_path() -> None:
+    close = np.linspace(100.0, 110.0, 90)
+    assert close_features(close) == compute_intraday_features(pd.DataFrame({"close": close}))
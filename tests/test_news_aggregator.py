@@ -1,9 +1,17 @@
 """Tests for NewsAggregator normalization."""
 
-from datetime import datetime, timedelta
+import threading
+import time
+from datetime import datetime, timedelta, timezone
 
+import numpy as np
+
+from trading_ai.clients.base import APIClientError, RateLimitExceeded
 from trading_ai.clients.news_aggregator import NewsAggregator
 
+# The dummy providers ignore ``since``; one aware lower bound serves every test.
+_SINCE = datetime.now(timezone.utc) - timedelta(hours=1)
+
 
 class DummyArticle:
     def __init__(self, title: str) -> None:
@@ -18,7 +26,140 @@ def test_news_aggregator_normalizes_objects() -> None:
     aggregator = NewsAggregator()
     aggregator.providers.append(lambda ticker, since, limit: [DummyArticle("Hello World")])
 
-    stories = aggregator.gather("AAPL", since=datetime.utcnow() - timedelta(hours=1))
+    stories = aggregator.gather("AAPL", since=_SINCE)
 
     assert len(stories) == 1
     assert stories[0]["title"] == "Hello World"
+
+
+def test_news_aggregator_queries_providers_concurrently() -> None:
+    barrier = threading.Barrier(2, timeout=5)
+
+    def provider(title: str):
+        def fetch(ticker, since, limit):
+            barrier.wait()  # only passes if both providers are in flight at once
+            return [{"title": title, "link": f"http://example.com/{title}"}]
+
+        return fetch
+
+    aggregator = NewsAggregator()
+    aggregator.providers.extend([provider("first"), provider("second")])
+
+    stories = aggregator.gather("AAPL", since=_SINCE)
+
+    assert [story["title"] for story in stories] == ["first", "second"]
+
+
+def test_news_aggregator_stops_waiting_once_limit_is_met() -> None:
+    release = threading.Event()
+
+    def fast_provider(ticker, since, limit):
+        return [
+            {"title": "Fed holds", "link": None},
+            {"title": "FED HOLDS", "link": None},
+            {"title": "CPI", "link": None},
+        ]
+
+    def slow_provider(ticker, since, limit):
+        release.wait(timeout=5)
+        return [{"title": "late", "link": None}]
+
+    aggregator = NewsAggregator()
+    aggregator.providers.extend([fast_provider, slow_provider])
+
+    started = time.monotonic()
+    try:
+        stories = aggregator.gather("AAPL", since=_SINCE, limit=2)
+    finally:
+        release.set()
+
+    assert time.monotonic() - started < 2
+    assert [story["title"] for story in stories] == ["Fed holds", "CPI"]
+
+
+def test_news_aggregator_gathers_columns() -> None:
+    aggregator = NewsAggregator()
+    aggregator.providers.append(
+        lambda ticker, since, limit: [
+            {"title": "Beat", "link": "http://example.com/1", "sentiment": 0.4, "source": "alpha_vantage"},
+            {"title": "Miss", "link": "http://example.com/2", "sentiment": None, "source": "newsapi"},
+        ]
+    )
+
+    columns = aggregator.gather_columns("AAPL", since=_SINCE)
+
+    assert columns["title"] == ["Beat", "Miss"]
+    assert columns["source"] == ["alpha_vantage", "newsapi"]
+    assert columns["sentiment"][0] == 0.4
+    assert np.isnan(columns["sentiment"][1])
+
+
+def test_news_aggregator_warms_up_configured_clients() -> None:
+    class WarmClient:
+        def __init__(self) -> None:
+            self.warmed = False
+
+        def warmup(self) -> None:
+            self.warmed = True
+
+    yahoo, alpha = WarmClient(), WarmClient()
+    aggregator = NewsAggregator(yahoo_client=yahoo, alpha_client=alpha)  # type: ignore[arg-type]
+
+    aggregator.warmup()
+
+    assert yahoo.warmed and alpha.warmed
+
+
+def test_news_aggregator_skips_provider_after_repeated_failures() -> None:
+    calls = []
+
+    def flaky(ticker, since, limit):
+        calls.append(ticker)
+        raise APIClientError("timeout")
+
+    aggregator = NewsAggregator(failure_threshold=2, cooldown_seconds=60.0)
+    aggregator.providers.append(flaky)
+
+    for _ in range(4):
+        assert aggregator.gather("AAPL", since=_SINCE) == []
+    assert len(calls) == 2
+
+    probing = NewsAggregator(failure_threshold=1, cooldown_seconds=0.0)
+    probing.providers.append(flaky)
+    probing.gather("AAPL", since=_SINCE)
+    probing.gather("AAPL", since=_SINCE)  # cooldown elapsed, so one probe goes through
+    assert len(calls) == 4
+
+
+def test_news_aggregator_does_not_trip_breaker_on_local_rate_limit() -> None:
+    outcomes = iter([RateLimitExceeded("held"), RateLimitExceeded("held"), None])
+
+    def throttled(ticker, since, limit):
+        error = next(outcomes)
+        if error is not None:
+            raise error
+        return [{"title": f"{ticker} headline", "link": None}]
+
+    aggregator = NewsAggregator(failure_threshold=1, cooldown_seconds=60.0)
+    aggregator.providers.append(throttled)
+
+    assert aggregator.gather("AAPL", since=_SINCE) == []
+    assert aggregator.gather("AAPL", since=_SINCE) == []
+    assert [story["title"] for story in aggregator.gather("MSFT", since=_SINCE)] == ["MSFT headline"]
+
+
+def test_news_aggregator_reprobes_after_rate_limited_half_open_probe() -> None:
+    outcomes = iter([APIClientError("timeout"), RateLimitExceeded("held"), None])
+
+    def provider(ticker, since, limit):
+        error = next(outcomes)
+        if error is not None:
+            raise error
+        return [{"title": "recovered", "link": None}]
+
+    aggregator = NewsAggregator(failure_threshold=1, cooldown_seconds=0.0)
+    aggregator.providers.append(provider)
+
+    assert aggregator.gather("AAPL", since=_SINCE) == []  # real failure opens the circuit
+    assert aggregator.gather("AAPL", since=_SINCE) == []  # half-open probe held back locally
+    assert [story["title"] for story in aggregator.gather("AAPL", since=_SINCE)] == ["recovered"]
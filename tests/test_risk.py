@@ -1,5 +1,7 @@
 """Risk manager tests."""
 
+import numpy as np
+
 from trading_ai.risk.manager import PositionSizingInput, RiskManager
 
 
@@ -27,6 +29,30 @@ def test_risk_manager_blocks_low_confidence() -> None:
     assert manager.size_position(params) == 0
 
 
+def test_size_position_batch_matches_scalar_sizing() -> None:
+    manager = RiskManager(max_daily_loss_pct=0.05, min_confidence=0.3)
+    prices = np.array([0.5, 1.25, 3.0, 0.0, 2.0, 0.8])
+    confidences = np.array([0.9, 0.6, 1.0, 0.9, 0.1, 0.3])
+
+    sizes = manager.size_position_batch(
+        500.0, prices, confidences, trade_risk_fraction=0.04, max_positions=20
+    )
+
+    expected = [
+        manager.size_position(
+            PositionSizingInput(
+                account_equity=500.0,
+                trade_risk_fraction=0.04,
+                contract_price=price,
+                confidence=confidence,
+                max_positions=20,
+            )
+        )
+        for price, confidence in zip(prices, confidences)
+    ]
+    assert sizes.tolist() == expected
+
+
 def test_stop_and_take_profit_levels() -> None:
     manager = RiskManager()
     stop = manager.stop_loss_price(entry_price=5.0, risk_fraction=0.2)
@@ -1,126 +1,119 @@
 """Strategy-layer unit tests."""
 
+from typing import Any, Callable, Dict
+
 import pandas as pd
+import pytest
 
 from trading_ai.strategies.momentum_iv import MomentumIVStrategy
-from trading_ai.strategies.base import StrategyContext
-
-
-def test_momentum_iv_strategy_uses_feature_fallback() -> None:
-    strategy = MomentumIVStrategy()
-    context = StrategyContext(
-        ticker="AAPL",
-        underlying_bars=pd.DataFrame(),  # empty bars
-        option_chain={},
-        option_metrics={},
-        option_quote={},
-        news_items=[],
-        features={"momentum_15": 0.01},
-    )
-
-    signal = strategy.generate_signal(context)
-
-    assert signal.direction == "CALL"
-    assert signal.confidence > 0.0
-
-
-def test_momentum_iv_strategy_uses_option_quote_spread() -> None:
-    strategy = MomentumIVStrategy()
-    context = StrategyContext(
-        ticker="AAPL",
-        underlying_bars=pd.DataFrame(),
-        option_chain={},
-        option_metrics={},
-        option_quote={
-            "CALL": {"bid": 2.0, "ask": 2.2},
-            "PUT": {"bid": 0.5, "ask": 0.6},
-        },
-        news_items=[],
-        features={},
-    )
-
-    signal = strategy.generate_signal(context)
-    assert signal.direction == "CALL"
-
-
-def test_momentum_iv_strategy_uses_option_flow_bias() -> None:
-    strategy = MomentumIVStrategy()
-    context = StrategyContext(
-        ticker="AAPL",
-        underlying_bars=pd.DataFrame(),
-        option_chain={},
-        option_metrics={
-            "call_leg": {
-                "contract_type": "call",
-                "open_interest": 200,
-                "greeks": {"delta": 0.55},
+from trading_ai.strategies.base import StrategyContext, TradingSignal
+
+# Shared empty bar frame; StrategyContext only reads it.
+_EMPTY_BARS = pd.DataFrame()
+_BASE_CONTEXT: Dict[str, Any] = {
+    "ticker": "AAPL",
+    "underlying_bars": _EMPTY_BARS,
+    "option_chain": {},
+    "option_metrics": {},
+    "option_quote": {},
+    "news_items": [],
+    "features": {},
+}
+
+
+@pytest.fixture(scope="module")
+def strategy() -> MomentumIVStrategy:
+    # The strategy keeps no per-signal state, so one instance serves the whole module.
+    return MomentumIVStrategy()
+
+
+def make_context(**overrides: Any) -> StrategyContext:
+    # A fresh constructor call (not dataclasses.replace) so derived fields such as the quote mids
+    # are recomputed from the overridden inputs.
+    return StrategyContext(**{**_BASE_CONTEXT, **overrides})
+
+
+@pytest.mark.parametrize(
+    "overrides, check",
+    [
+        pytest.param(
+            {"features": {"momentum_15": 0.01}},
+            lambda signal: signal.confidence > 0.0,
+            id="feature_fallback",
+        ),
+        pytest.param(
+            {
+                "option_quote": {
+                    "CALL": {"bid": 2.0, "ask": 2.2},
+                    "PUT": {"bid": 0.5, "ask": 0.6},
+                },
             },
-            "put_leg": {
-                "contract_type": "put",
-                "open_interest": 50,
-                "greeks": {"delta": -0.4},
+            lambda signal: True,
+            id="option_quote_spread",
+        ),
+        pytest.param(
+            {
+                "option_metrics": {
+                    "call_leg": {
+                        "contract_type": "call",
+                        "open_interest": 200,
+                        "greeks": {"delta": 0.55},
+                    },
+                    "put_leg": {
+                        "contract_type": "put",
+                        "open_interest": 50,
+                        "greeks": {"delta": -0.4},
+                    },
+                },
             },
-        },
-        option_quote={},
-        news_items=[],
-        features={},
-    )
-
-    signal = strategy.generate_signal(context)
-
-    assert signal.direction == "CALL"
-    assert signal.metadata["flow_ratio"] > 0
-
-
-def test_momentum_iv_strategy_falls_back_to_option_chain_for_flow() -> None:
-    strategy = MomentumIVStrategy()
-    context = StrategyContext(
-        ticker="AAPL",
-        underlying_bars=pd.DataFrame(),
-        option_chain={
-            "TEST240118C00100000": {
-                "symbol": "TEST240118C00100000",
-                "latest_quote": {"bid_size": 50, "ask_size": 60},
-                "greeks": {"delta": 0.6},
+            lambda signal: signal.metadata["flow_ratio"] > 0,
+            id="option_flow_bias",
+        ),
+        pytest.param(
+            {
+                "option_chain": {
+                    "TEST240118C00100000": {
+                        "symbol": "TEST240118C00100000",
+                        "latest_quote": {"bid_size": 50, "ask_size": 60},
+                        "greeks": {"delta": 0.6},
+                    },
+                    "TEST240118P00100000": {
+                        "symbol": "TEST240118P00100000",
+                        "latest_quote": {"bid_size": 5, "ask_size": 10},
+                        "greeks": {"delta": -0.3},
+                    },
+                },
             },
-            "TEST240118P00100000": {
-                "symbol": "TEST240118P00100000",
-                "latest_quote": {"bid_size": 5, "ask_size": 10},
-                "greeks": {"delta": -0.3},
+            lambda signal: signal.metadata["flow_ratio"] > 0,
+            id="option_chain_flow_fallback",
+        ),
+        pytest.param(
+            {
+                "option_quote": {
+                    "CALL": {"bid": 2.0, "ask": 2.2, "symbol": "AAPL251114C00270000"},
+                    "PUT": {"bid": 1.0, "ask": 1.1, "symbol": "AAPL251114P00270000"},
+                },
+                "option_aggregates": {
+                    "CALL": [{"close": 1.0}, {"close": 1.4}],
+                    "PUT": [{"close": 1.0}, {"close": 0.6}],
+                },
             },
-        },
-        option_metrics={},
-        option_quote={},
-        news_items=[],
-        features={},
-    )
-
-    signal = strategy.generate_signal(context)
+            lambda signal: signal.metadata["option_agg_momentum"] > 0,
+            id="option_aggregates",
+        ),
+    ],
+)
+def test_momentum_iv_strategy_signals_call(
+    strategy: MomentumIVStrategy,
+    overrides: Dict[str, Any],
+    check: Callable[[TradingSignal], bool],
+) -> None:
+    signal = strategy.generate_signal(make_context(**overrides))
 
     assert signal.direction == "CALL"
-    assert signal.metadata["flow_ratio"] > 0
-
+    assert check(signal)
 
-def test_momentum_iv_strategy_uses_option_aggregates() -> None:
-    strategy = MomentumIVStrategy()
-    context = StrategyContext(
-        ticker="AAPL",
-        underlying_bars=pd.DataFrame(),
-        option_chain={},
-        option_metrics={},
-        option_quote={
-            "CALL": {"bid": 2.0, "ask": 2.2, "symbol": "AAPL251114C00270000"},
-            "PUT": {"bid": 1.0, "ask": 1.1, "symbol": "AAPL251114P00270000"},
-        },
-        news_items=[],
-        features={},
-        option_aggregates={
-            "CALL": [{"close": 1.0}, {"close": 1.4}],
-            "PUT": [{"close": 1.0}, {"close": 0.6}],
-        },
-    )
 
-    signal = strategy.generate_signal(context)
-
-    assert signal.direction == "CALL"
-    assert signal.metadata["option_agg_momentum"] > 0
+def test_momentum_iv_strategy_keeps_zero_bid(strategy: MomentumIVStrategy) -> None:
+    assert strategy._quote_mid({"bid": 0.0, "bid_price": 5.0, "ask": 1.0}) == 0.5
+    assert strategy._quote_mid({"bid_price": 0.8, "ask_price": 1.0}) == 0.9